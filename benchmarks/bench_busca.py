@@ -0,0 +1,44 @@
+"""
+Compara a busca linear original com o índice invertido.
+
+Uso: python -m benchmarks.bench_busca
+"""
+import time
+from benchmarks.dados_sinteticos import gerar_registros
+from utils.indice_textual import IndiceTextual, normalizar
+
+CONSULTAS = ["sao joao", "forr", "cordel popular", "xilo", "teatro 1234"]
+
+def busca_linear(registros: dict, termo: str) -> list:
+    termo = normalizar(termo)
+    return [
+        id_ponto for id_ponto, dados in registros.items()
+        if (termo in normalizar(dados["nome"]) or
+            termo in normalizar(dados["descricao"]) or
+            termo in normalizar(dados["tipo"]))
+    ]
+
+def _medir(funcao, repeticoes: int) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+def main() -> None:
+    print(f"{'pontos':>8} {'carga (ms)':>11} {'linear (ms)':>12} {'índice (ms)':>12} {'ganho':>8}")
+    for quantidade in (1_000, 10_000, 100_000):
+        registros = gerar_registros(quantidade)
+
+        inicio = time.perf_counter()
+        indice = IndiceTextual()
+        for id_ponto, dados in registros.items():
+            indice.adicionar(id_ponto, {campo: dados[campo] for campo in ("nome", "descricao", "tipo")})
+        carga = (time.perf_counter() - inicio) * 1000
+
+        repeticoes = max(1, 10_000 // quantidade)
+        linear = sum(_medir(lambda: busca_linear(registros, c), repeticoes) for c in CONSULTAS) / len(CONSULTAS)
+        invertido = sum(_medir(lambda: indice.buscar(c), repeticoes * 10) for c in CONSULTAS) / len(CONSULTAS)
+        print(f"{quantidade:>8} {carga:>11.1f} {linear:>12.3f} {invertido:>12.3f} {linear / invertido:>7.1f}x")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compara o custo de montar uma página de listagem criando um PontoCultural por
+registro com o da coleção colunar, que só materializa a página.
+
+Uso: python -m benchmarks.bench_colecao
+"""
+import time
+import tracemalloc
+from benchmarks.dados_sinteticos import gerar_registros
+from models.ponto_cultural import PontoCultural
+from repositorios.repositorio_firebase import montar_listagem
+
+TAMANHO_PAGINA = 10
+
+def pagina_por_objetos(registros: dict, tipo: str) -> list:
+    pontos = [PontoCultural.from_dict(dados, id_ponto) for id_ponto, dados in registros.items() if not tipo or dados["tipo"] == tipo]
+    pontos.sort(key=lambda p: p.nome)
+    return pontos[:TAMANHO_PAGINA]
+
+def pagina_colunar(registros: dict, tipo: str) -> list:
+    # O caminho usado pelo repositório do Firebase: filtra os registros por
+    # tipo, monta as colunas só com eles e materializa a página
+    return montar_listagem(registros, tipo, 0, TAMANHO_PAGINA)[0]
+
+def _medir(funcao, *args):
+    tracemalloc.start()
+    inicio = time.perf_counter()
+    resultado = funcao(*args)
+    duracao = (time.perf_counter() - inicio) * 1000
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # Mede o tempo de novo sem o tracemalloc, que distorce a medição
+    inicio = time.perf_counter()
+    funcao(*args)
+    duracao = (time.perf_counter() - inicio) * 1000
+    return resultado, duracao, pico / 1024 / 1024
+
+def main() -> None:
+    print(f"{'pontos':>8} {'filtro':>7} {'objetos (ms)':>13} {'objetos (MiB)':>14} {'colunar (ms)':>13} {'colunar (MiB)':>14}")
+    for quantidade in (1_000, 10_000, 100_000):
+        registros = gerar_registros(quantidade)
+        for tipo in (None, "Museu"):
+            esperado, t_obj, m_obj = _medir(pagina_por_objetos, registros, tipo)
+            obtido, t_col, m_col = _medir(pagina_colunar, registros, tipo)
+            assert [p.id for p in esperado] == [p.id for p in obtido]
+            print(f"{quantidade:>8} {tipo or 'todos':>7} {t_obj:>13.1f} {m_obj:>14.2f} {t_col:>13.1f} {m_col:>14.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,41 @@
+"""
+Mede as consultas por raio e por área do índice espacial.
+
+Uso: python -m benchmarks.bench_espacial
+"""
+import random
+import time
+from benchmarks.dados_sinteticos import gerar_registros
+from utils.indice_espacial import IndiceEspacial, distancia_km
+
+def _medir(funcao, repeticoes: int = 200) -> float:
+    inicio = time.perf_counter()
+    for _ in range(repeticoes):
+        funcao()
+    return (time.perf_counter() - inicio) / repeticoes * 1000
+
+def main() -> None:
+    aleatorio = random.Random(7)
+    print(f"{'pontos':>8} {'consulta':>18} {'linear (ms)':>12} {'índice (ms)':>12} {'resultados':>11}")
+    for quantidade in (1_000, 10_000, 100_000):
+        registros = gerar_registros(quantidade)
+        coordenadas = {k: (float(v["latitude"]), float(v["longitude"])) for k, v in registros.items()}
+        indice = IndiceEspacial()
+        for id_ponto, (lat, lon) in coordenadas.items():
+            indice.adicionar(id_ponto, lat, lon)
+
+        lat, lon = aleatorio.uniform(-8.0, -6.5), aleatorio.uniform(-38.0, -35.0)
+        for raio in (2, 10):
+            linear = _medir(lambda: [k for k, (a, b) in coordenadas.items() if distancia_km(lat, lon, a, b) <= raio], 3)
+            rapido = _medir(lambda: indice.buscar_proximos(lat, lon, raio))
+            total = len(indice.buscar_proximos(lat, lon, raio))
+            print(f"{quantidade:>8} {f'raio {raio} km':>18} {linear:>12.3f} {rapido:>12.3f} {total:>11}")
+
+        area = (lat - 0.05, lon - 0.08, lat + 0.05, lon + 0.08)
+        linear = _medir(lambda: [k for k, (a, b) in coordenadas.items()
+                                 if area[0] <= a <= area[2] and area[1] <= b <= area[3]], 3)
+        rapido = _medir(lambda: indice.buscar_na_area(area))
+        print(f"{quantidade:>8} {'área 0,1° x 0,16°':>18} {linear:>12.3f} {rapido:>12.3f} {len(indice.buscar_na_area(area)):>11}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Mede o tempo até a primeira renderização de cada página do Streamlit e as
+importações que pesam nesse tempo, comparando com um orçamento.
+
+Cada página é executada num processo novo (com python -X importtime), depois
+de importar o streamlit, que o servidor já tem carregado. A sessão já tem um
+usuário (e o administrador) autenticado, de modo que é medido o caminho das
+páginas logadas, e o contêiner de serviços é substituído por um stub, sem
+acessar o Firebase. O tempo vai do início do script até a primeira chamada que
+envia um elemento visível para o navegador (set_page_config não conta); nesse
+ponto a execução é interrompida. O processo termina com código 1 se alguma
+página passar do orçamento.
+
+Uso: python -m benchmarks.bench_inicializacao [--orcamento-ms 300] [--repeticoes 3]
+"""
+import argparse
+import json
+import os
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGINAS = ["pages/0_login.py", "pages/1_cadastrar_ponto.py", "pages/2_listar_pontos.py", "pages/3_diagnostico.py"]
+# Tempo máximo até a primeira renderização de cada página, em milissegundos
+ORCAMENTO_MS = 300.0
+MARCADOR = "-- inicio da pagina --"
+
+# Executado no processo filho: autentica a sessão, troca os serviços por um
+# stub, intercepta as funções do streamlit que enviam elementos e interrompe a
+# página na primeira delas
+_FILHO = """
+import runpy, sys, time
+from unittest import mock
+import streamlit as st
+
+class PrimeiraRenderizacao(Exception):
+    pass
+
+def interromper(*args, **kwargs):
+    raise PrimeiraRenderizacao()
+
+for nome in ("title", "header", "subheader", "write", "markdown",
+             "error", "warning", "info", "success", "columns", "button", "form"):
+    setattr(st, nome, interromper)
+st.session_state["user"] = {"uid": "bench", "email": "bench@exemplo.com"}
+st.session_state["autenticado"] = True
+
+sys.path.insert(0, sys.argv[2])
+from services.container import Servicos
+Servicos.compartilhado = classmethod(lambda cls: mock.MagicMock())
+print(sys.argv[3], file=sys.stderr, flush=True)
+inicio = time.perf_counter()
+try:
+    runpy.run_path(sys.argv[1], run_name="__main__")
+except PrimeiraRenderizacao:
+    pass
+print((time.perf_counter() - inicio) * 1000)
+"""
+
+def _importacoes(saida: str) -> List[Tuple[str, float]]:
+    """
+    Importações de primeiro nível feitas pela página, com o tempo acumulado
+    em ms, a partir da saída de -X importtime.
+    """
+    _, _, depois = saida.partition(MARCADOR)
+    importacoes = []
+    for linha in depois.splitlines():
+        if not linha.startswith("import time:") or "|" not in linha:
+            continue
+        _, acumulado, modulo = linha.split(":", 1)[1].split("|")
+        # Módulos aninhados aparecem indentados sob quem os importou
+        if not modulo.startswith("  ") and acumulado.strip().isdigit():
+            importacoes.append((modulo.strip(), int(acumulado) / 1000))
+    return importacoes
+
+def medir_pagina(pagina: str) -> Tuple[float, List[Tuple[str, float]]]:
+    """
+    Executa a página num processo novo até a primeira renderização.
+
+    Returns:
+        Tuple[float, List[Tuple[str, float]]]: Tempo até a primeira renderização
+            e importações de primeiro nível, em ms
+    """
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", _FILHO, os.path.join(RAIZ, pagina), RAIZ, MARCADOR],
+        cwd=RAIZ, capture_output=True, text=True, check=True
+    )
+    return float(processo.stdout.strip().splitlines()[-1]), _importacoes(processo.stderr)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Tempo até a primeira renderização das páginas")
+    parser.add_argument("--orcamento-ms", type=float, default=ORCAMENTO_MS)
+    parser.add_argument("--repeticoes", type=int, default=3)
+    parser.add_argument("--json", action="store_true", help="Imprime o resultado em JSON")
+    args = parser.parse_args()
+
+    resultados: Dict[str, dict] = {}
+    for pagina in PAGINAS:
+        medicoes = [medir_pagina(pagina) for _ in range(args.repeticoes)]
+        tempo, importacoes = min(medicoes, key=lambda medicao: medicao[0])
+        resultados[pagina] = {
+            "primeira_renderizacao_ms": round(tempo, 1),
+            "importacoes_ms": dict(sorted(importacoes, key=lambda item: -item[1])[:5]),
+            "dentro_do_orcamento": tempo <= args.orcamento_ms
+        }
+
+    if args.json:
+        print(json.dumps(resultados, indent=2, ensure_ascii=False))
+    else:
+        print(f"{'página':<28} {'1ª renderização (ms)':>21}  importações mais lentas (ms)")
+        for pagina, resultado in resultados.items():
+            lentas = ", ".join(f"{modulo} {ms:.0f}" for modulo, ms in resultado["importacoes_ms"].items())
+            marca = "" if resultado["dentro_do_orcamento"] else "  << acima do orçamento"
+            print(f"{pagina:<28} {resultado['primeira_renderizacao_ms']:>21.1f}  {lentas}{marca}")
+
+    estourados = [pagina for pagina, resultado in resultados.items() if not resultado["dentro_do_orcamento"]]
+    if estourados:
+        print(f"Orçamento de {args.orcamento_ms:.0f} ms excedido: {', '.join(estourados)}", file=sys.stderr)
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Mede o custo da instrumentação de métricas por chamada: uma função sem
+decorador, com @medir e a coleta desativada, e com a coleta habilitada, além
+de listar_recentes do PontoService atendida pelo cache.
+
+Uso: python -m benchmarks.bench_metricas
+"""
+import time
+from unittest import mock
+from utils.metricas import medir, metricas
+
+CHAMADAS = 200_000
+
+def _medir(funcao, chamadas: int = CHAMADAS, repeticoes: int = 5) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for _ in range(chamadas):
+            funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor / chamadas
+
+def main() -> None:
+    def listar():
+        return [1, 2, 3]
+
+    listar_medido = medir("bench", quantidade=len)(listar)
+
+    # Serviço sem Firebase: a primeira chamada preenche o cache e as demais o consultam
+    from services.ponto_service import PontoService
+    repositorio = mock.Mock()
+    repositorio.listar_recentes.return_value = []
+    service = PontoService(repositorio=repositorio)
+    service.listar_recentes(5)
+
+    print(f"{'cenário':<34} {'sem decorador (ns)':>19} {'desativada (ns)':>16} {'habilitada (ns)':>16}")
+    t_puro = _medir(listar)
+    metricas.habilitadas = False
+    t_desativada = _medir(listar_medido)
+    t_servico_desativada = _medir(lambda: service.listar_recentes(5), chamadas=CHAMADAS // 10)
+    metricas.habilitadas = True
+    t_habilitada = _medir(listar_medido)
+    t_servico_habilitada = _medir(lambda: service.listar_recentes(5), chamadas=CHAMADAS // 10)
+    metricas.habilitadas = False
+    metricas.limpar()
+
+    print(f"{'função trivial':<34} {t_puro * 1e9:>19.0f} {t_desativada * 1e9:>16.0f} {t_habilitada * 1e9:>16.0f}")
+    print(f"{'listar_recentes (cache)':<34} {'-':>19} {t_servico_desativada * 1e9:>16.0f} {t_servico_habilitada * 1e9:>16.0f}")
+
+if __name__ == "__main__":
+    main()
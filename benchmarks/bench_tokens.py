@@ -0,0 +1,41 @@
+"""
+Compara a verificação completa de ID tokens (assinatura RS256 a cada chamada)
+com VerificadorTokens, que verifica cada token uma vez e consulta o cache nas
+repetições. Chaves e tokens são gerados localmente.
+
+Uso: python -m benchmarks.bench_tokens
+"""
+import time
+import jwt
+from benchmarks.dados_sinteticos import EmissorTokens
+from services.verificador_tokens import VerificadorTokens
+
+def _medir(funcao, tokens: list, repeticoes: int = 3) -> float:
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        for token in tokens:
+            funcao(token)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+def main() -> None:
+    emissor = EmissorTokens()
+    chave = emissor.chave.public_key()
+
+    def verificar_sempre(token: str) -> dict:
+        return jwt.decode(token, chave, algorithms=["RS256"], audience=emissor.projeto,
+                          issuer=f"https://securetoken.google.com/{emissor.projeto}")
+
+    print(f"{'tokens':>7} {'chamadas':>9} {'sem cache (µs/chamada)':>23} {'com cache (µs/chamada)':>23}")
+    for distintos in (1, 100, 1_000):
+        # Cada página carregada verifica de novo o token da sessão
+        tokens = [emissor.emitir(f"usuario-{i}") for i in range(distintos)] * 10
+        verificador = VerificadorTokens(emissor.projeto, buscar=emissor.certificados)
+        t_sem = _medir(verificar_sempre, tokens)
+        t_com = _medir(verificador.verificar, tokens)
+        verificador.parar()
+        print(f"{distintos:>7} {len(tokens):>9} {t_sem / len(tokens) * 1e6:>23.1f} {t_com / len(tokens) * 1e6:>23.1f}")
+
+if __name__ == "__main__":
+    main()
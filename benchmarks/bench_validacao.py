@@ -0,0 +1,53 @@
+"""
+Compara a validação ponto a ponto (PontoCultural.validar em laço) com
+validar_lote sobre a coleção colunar, em lotes com ~5% de registros inválidos.
+
+Uso: python -m benchmarks.bench_validacao
+"""
+import random
+import time
+from benchmarks.dados_sinteticos import gerar_registros
+from models.ponto_colecao import PontoColecao, validar_lote
+from models.ponto_cultural import PontoCultural
+
+def _com_invalidos(registros: dict, proporcao: float = 0.05, semente: int = 7) -> dict:
+    aleatorio = random.Random(semente)
+    defeitos = [("tipo", "Circo"), ("latitude", "abc"), ("longitude", 200.0), ("nome", ""), ("criado_por", "")]
+    for dados in registros.values():
+        if aleatorio.random() < proporcao:
+            campo, valor = aleatorio.choice(defeitos)
+            dados[campo] = valor
+    return registros
+
+def validar_por_objetos(registros: dict) -> list:
+    erros = []
+    for linha, (id_ponto, dados) in enumerate(registros.items()):
+        try:
+            PontoCultural.from_dict(dados, id_ponto).validar()
+        except ValueError as e:
+            erros.append((linha, id_ponto, str(e)))
+    return erros
+
+def validar_colunar(registros: dict) -> list:
+    return validar_lote(PontoColecao.from_registros(registros, estrito=False)).erros
+
+def _medir(funcao, registros: dict, repeticoes: int = 3):
+    melhor = float("inf")
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = funcao(registros)
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return resultado, melhor
+
+def main() -> None:
+    print(f"{'pontos':>8} {'inválidos':>10} {'objetos (ms)':>13} {'colunar (ms)':>13} {'registros/s (colunar)':>22}")
+    for quantidade in (1_000, 10_000, 100_000):
+        registros = _com_invalidos(gerar_registros(quantidade))
+        esperado, t_obj = _medir(validar_por_objetos, registros)
+        obtido, t_col = _medir(validar_colunar, registros)
+        # validar para na primeira falha; validar_lote relata todas as regras violadas
+        assert {linha for linha, _, _ in esperado} == {linha for linha, _, _ in obtido}
+        print(f"{quantidade:>8} {len(esperado):>10} {t_obj * 1000:>13.1f} {t_col * 1000:>13.1f} {quantidade / t_col:>22,.0f}")
+
+if __name__ == "__main__":
+    main()
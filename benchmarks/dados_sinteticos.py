@@ -0,0 +1,86 @@
+"""
+Geração de pontos culturais sintéticos para os benchmarks.
+"""
+import datetime
+import random
+import time
+from typing import Dict, Tuple
+import jwt
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from cryptography.x509.oid import NameOID
+from config import TIPOS_PONTOS
+
+_PALAVRAS = [
+    "São", "João", "Cultura", "Forró", "Artesanato", "Praça", "Memorial", "Casa",
+    "Popular", "Histórico", "Música", "Dança", "Xilogravura", "Cordel", "Mercado",
+    "Igreja", "Convento", "Arte", "Centro", "Cidade", "Sertão", "Litoral", "Festival",
+    "Coco", "Ciranda", "Maracatu", "Teatro", "Cinema", "Biblioteca", "Galeria"
+]
+
+def gerar_registros(quantidade: int, semente: int = 42) -> Dict[str, dict]:
+    """
+    Gera registros no formato persistido do nó "pontos".
+
+    Args:
+        quantidade (int): Número de pontos
+        semente (int): Semente do gerador aleatório
+
+    Returns:
+        Dict[str, dict]: Registros indexados por ID
+    """
+    aleatorio = random.Random(semente)
+    registros = {}
+    for i in range(quantidade):
+        nome = " ".join(aleatorio.sample(_PALAVRAS, 3)) + f" {i}"
+        registros[f"ponto-{i:06d}"] = {
+            "nome": nome,
+            "descricao": " ".join(aleatorio.choices(_PALAVRAS, k=12)),
+            "tipo": aleatorio.choice(TIPOS_PONTOS),
+            "latitude": str(round(aleatorio.uniform(-8.3, -6.0), 6)),
+            "longitude": str(round(aleatorio.uniform(-38.8, -34.8), 6)),
+            "criado_por": f"usuario-{aleatorio.randrange(50)}"
+        }
+    return registros
+
+class EmissorTokens:
+    """
+    Emite ID tokens no formato do Firebase assinados por uma chave RSA gerada
+    localmente, no lugar das chaves do Google.
+    """
+
+    def __init__(self, projeto: str = "projeto-teste", kid: str = "chave-local"):
+        self.projeto = projeto
+        self.kid = kid
+        self.chave = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+        nome = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "securetoken.local")])
+        agora = datetime.datetime.now(datetime.timezone.utc)
+        certificado = (
+            x509.CertificateBuilder()
+            .subject_name(nome).issuer_name(nome)
+            .public_key(self.chave.public_key())
+            .serial_number(x509.random_serial_number())
+            .not_valid_before(agora).not_valid_after(agora + datetime.timedelta(days=1))
+            .sign(self.chave, hashes.SHA256())
+        )
+        self.pem = certificado.public_bytes(serialization.Encoding.PEM).decode("ascii")
+
+    def certificados(self) -> Tuple[Dict[str, str], float]:
+        """
+        Certificados no formato de verificador_tokens.buscar_certificados.
+        """
+        return {self.kid: self.pem}, 3600.0
+
+    def emitir(self, uid: str, validade: float = 3600, **claims) -> str:
+        agora = int(time.time())
+        corpo = {
+            "iss": f"https://securetoken.google.com/{self.projeto}",
+            "aud": self.projeto,
+            "sub": uid,
+            "iat": agora,
+            "exp": agora + int(validade),
+            "email": f"{uid}@exemplo.com",
+            **claims
+        }
+        return jwt.encode(corpo, self.chave, algorithm="RS256", headers={"kid": self.kid})
@@ -34,9 +34,58 @@ FIREBASE_CONFIG = {
 # Configurações da Aplicação
 PAGINACAO_LIMITE = int(os.getenv("PAGINACAO_LIMITE", "10"))
 TIPOS_PONTOS = ["Museu", "Grafite", "Teatro", "Feira", "Evento"]
+IMPORTACAO_TAMANHO_LOTE = int(os.getenv("IMPORTACAO_TAMANHO_LOTE", "500"))  # pontos por escrita
+LOTE_MAX_CONEXOES = int(os.getenv("LOTE_MAX_CONEXOES", "8"))  # leituras simultâneas em operações em lote
+
+# Armazenamento dos pontos: "firebase" (Realtime Database) ou "sqlite" (arquivo local)
+REPOSITORIO_PONTOS = os.getenv("REPOSITORIO_PONTOS", "firebase")
+SQLITE_CAMINHO = os.getenv("SQLITE_CAMINHO", "dados/pontos.db")
+
+# Configurações do Serviço Assíncrono (API REST do Realtime Database)
+ASYNC_MAX_CONEXOES = int(os.getenv("ASYNC_MAX_CONEXOES", "32"))  # conexões mantidas no pool
+ASYNC_MAX_REQUISICOES = int(os.getenv("ASYNC_MAX_REQUISICOES", "16"))  # requisições simultâneas
+ASYNC_TEMPO_LIMITE = float(os.getenv("ASYNC_TEMPO_LIMITE", "10"))  # tempo máximo por requisição, em segundos
 
 # Configurações de Cache
 CACHE_TEMPO_EXPIRACAO = 300  # 5 minutos em segundos
+CACHE_TAMANHO_MAXIMO = int(os.getenv("CACHE_TAMANHO_MAXIMO", "1024"))  # número de entradas
+CACHE_INTERVALO_LIMPEZA = 60  # intervalo mínimo entre varreduras de expirados, em segundos
+# Por quanto tempo uma entrada expirada ainda pode ser servida enquanto é recarregada
+# em segundo plano (0 desativa)
+CACHE_TEMPO_OBSOLETO = float(os.getenv("CACHE_TEMPO_OBSOLETO", "0"))
+CACHE_TEMPO_NEGATIVO = 30  # validade de resultados vazios (buscas sem resultado, IDs inexistentes)
+
+# Configurações do Índice em Memória
+INDICE_TEMPO_CARGA = float(os.getenv("INDICE_TEMPO_CARGA", "30"))  # segundos
+INDICE_ESPACIAL_CELULA = 0.05  # tamanho da célula da grade espacial, em graus (~5,5 km)
+# Cópia local do índice usada para responder logo após o início do processo ("" desativa)
+INDICE_SNAPSHOT_CAMINHO = os.getenv("INDICE_SNAPSHOT_CAMINHO", "dados/indice_pontos.json")
+INDICE_SNAPSHOT_INTERVALO = 5  # atraso para agrupar alterações antes de regravar a cópia, em segundos
+
+# Configurações da Verificação de Tokens
+TOKEN_CACHE_TAMANHO = int(os.getenv("TOKEN_CACHE_TAMANHO", "4096"))  # tokens verificados em cache
+TOKEN_CERTIFICADOS_VALIDADE = 3600  # validade dos certificados quando o Google não a informa, em segundos
+TOKEN_TOLERANCIA_RELOGIO = 5  # diferença de relógio aceita na validade dos tokens, em segundos
+TOKEN_INTERVALO_RENOVACAO = 60  # intervalo mínimo entre renovações forçadas por chave desconhecida, em segundos
+
+# Configurações do Diretório de Usuários
+USUARIOS_CACHE_TTL = 600  # validade dos dados de usuário em cache, em segundos
+
+# Configurações do Mapa
+MAPA_CENTRO = [-7.0, -37.0]  # centro inicial (Paraíba)
+MAPA_ZOOM = 6
+MAPA_LIMITE_PONTOS = int(os.getenv("MAPA_LIMITE_PONTOS", "10000"))  # pontos no mapa completo (HTML)
+MAPA_LIMIAR_CLUSTER_RAPIDO = 500  # acima disso os marcadores são criados no navegador (FastMarkerCluster)
+MAPA_LARGURA = 700  # pixels
+MAPA_ALTURA = 400  # pixels
+# Viewport: abaixo deste zoom os pontos são agrupados no servidor em células de
+# MAPA_PIXELS_AGRUPAMENTO pixels de lado
+MAPA_ZOOM_SEM_AGRUPAMENTO = 14
+MAPA_PIXELS_AGRUPAMENTO = 64
+
+# Configurações de Métricas
+# Coleta de métricas de desempenho (também pode ser ligada na página de diagnóstico)
+METRICAS_HABILITADAS = os.getenv("METRICAS_HABILITADAS", "false").lower() in ("1", "true")
 
 # Configurações de Logging
 LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
@@ -2,13 +2,8 @@
 Módulo responsável pela configuração e autenticação do cliente Firebase.
 """
 import streamlit as st
-import pyrebase
-from config import FIREBASE_CONFIG
 from typing import Optional, Dict, Tuple
-
-# Inicializa o Firebase
-firebase = pyrebase.initialize_app(FIREBASE_CONFIG)
-auth = firebase.auth()
+from services.container import Servicos
 
 def login(email: str, senha: str) -> Tuple[bool, str]:
     """
@@ -22,7 +17,8 @@ def login(email: str, senha: str) -> Tuple[bool, str]:
         Tuple[bool, str]: Tupla contendo status do login e mensagem
     """
     try:
-        user = auth.sign_in_with_email_and_password(email, senha)
+        # O cliente do pyrebase é criado uma vez por processo, no primeiro login
+        user = Servicos.compartilhado().auth_cliente.sign_in_with_email_and_password(email, senha)
         st.session_state["user"] = user
         return True, "Login realizado com sucesso!"
     except Exception as e:
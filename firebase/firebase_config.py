@@ -2,18 +2,20 @@ import firebase_admin
 from firebase_admin import credentials, auth, db
 from config import FIREBASE_CONFIG
 
-def init_firebase() -> None:
+def init_firebase() -> firebase_admin.App:
     """
     Inicializa o Firebase Admin SDK com as credenciais fornecidas.
+    
+    Returns:
+        firebase_admin.App: App padrão, criado na primeira chamada
     """
     try:
         if not firebase_admin._apps:
             cred = credentials.Certificate("firebase/serviceAccountKey.json")
-            firebase_admin.initialize_app(cred, {
+            return firebase_admin.initialize_app(cred, {
                 'databaseURL': FIREBASE_CONFIG['databaseURL']
             })
-        else:
-            print("Firebase já foi inicializado.")
+        return firebase_admin.get_app()
     except Exception as e:
         raise ValueError(f"Erro ao inicializar Firebase: {str(e)}")
 
@@ -0,0 +1,255 @@
+from array import array
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from models.ponto_cultural import PontoCultural
+from config import (
+    LATITUDE_MIN, LATITUDE_MAX,
+    LONGITUDE_MIN, LONGITUDE_MAX,
+    TIPOS_PONTOS
+)
+
+_NAN = float("nan")
+
+def _numero(valor) -> float:
+    try:
+        return float(valor)
+    except (ValueError, TypeError):
+        return _NAN
+
+def _data(valor: float) -> Optional[float]:
+    return None if valor != valor else valor
+
+def _internavel(valor):
+    # Listas e objetos (registros malformados) não podem ser internados; viram
+    # valores ausentes, que validar_lote aponta
+    return None if isinstance(valor, (list, dict)) else valor
+
+def _internar(valores: List) -> Tuple[Dict, List]:
+    """
+    Tabela de códigos por valor distinto, na ordem em que aparecem, e os
+    valores efetivamente internados.
+    """
+    try:
+        return {v: i for i, v in enumerate(dict.fromkeys(valores))}, valores
+    except TypeError:
+        valores = [_internavel(v) for v in valores]
+        return {v: i for i, v in enumerate(dict.fromkeys(valores))}, valores
+
+class PontoColecao:
+    """
+    Representação colunar de um conjunto de pontos culturais.
+
+    Coordenadas ficam em arrays de double, tipos e criadores em arrays de
+    códigos que apontam para tabelas de strings internadas. Filtros e
+    ordenações operam sobre índices de linha, e objetos PontoCultural só são
+    criados para as linhas efetivamente materializadas.
+    """
+
+    __slots__ = (
+        "ids", "nomes", "descricoes", "latitudes", "longitudes", "criados_em",
+        "codigos_tipo", "codigos_criador", "tipos", "criadores",
+        "_codigo_por_tipo", "_codigo_por_criador"
+    )
+
+    def __init__(self):
+        self.ids: List[str] = []
+        self.nomes: List[str] = []
+        self.descricoes: List[str] = []
+        self.latitudes = array("d")
+        self.longitudes = array("d")
+        self.criados_em = array("d")  # NaN quando o ponto não tem data de criação
+        self.codigos_tipo = array("H")
+        self.codigos_criador = array("I")
+        self.tipos: List[str] = []
+        self.criadores: List[str] = []
+        self._codigo_por_tipo: Dict[str, int] = {}
+        self._codigo_por_criador: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @staticmethod
+    def _codigo(valor: str, tabela: List[str], codigos: Dict[str, int]) -> int:
+        codigo = codigos.get(valor)
+        if codigo is None:
+            codigo = codigos[valor] = len(tabela)
+            tabela.append(valor)
+        return codigo
+
+    def adicionar(self, id_ponto: str, data: dict) -> None:
+        """
+        Acrescenta uma linha a partir de um registro persistido.
+
+        Raises:
+            ValueError: Se as coordenadas não forem números válidos
+        """
+        try:
+            latitude = float(data.get("latitude", 0))
+            longitude = float(data.get("longitude", 0))
+        except (ValueError, TypeError):
+            raise ValueError("Latitude e longitude devem ser números válidos")
+
+        self.ids.append(id_ponto)
+        self.nomes.append(data.get("nome", ""))
+        self.descricoes.append(data.get("descricao", ""))
+        self.latitudes.append(latitude)
+        self.longitudes.append(longitude)
+        self.criados_em.append(_numero(data.get("criado_em", _NAN)))
+        self.codigos_tipo.append(self._codigo(_internavel(data.get("tipo", "")), self.tipos, self._codigo_por_tipo))
+        self.codigos_criador.append(
+            self._codigo(_internavel(data.get("criado_por", "")), self.criadores, self._codigo_por_criador)
+        )
+
+    @classmethod
+    def from_registros(cls, registros: Dict[str, dict], estrito: bool = True) -> 'PontoColecao':
+        """
+        Monta a coleção a partir do conteúdo do nó "pontos", coluna a coluna.
+
+        Args:
+            registros (Dict[str, dict]): Registros indexados pelo ID
+            estrito (bool): Se False, coordenadas inválidas viram NaN em vez de
+                interromper a montagem, para serem apontadas por validar_lote
+
+        Raises:
+            ValueError: Se alguma coordenada não for um número válido (modo estrito)
+        """
+        colecao = cls()
+        dados = list(registros.values())
+        colecao.ids = list(registros)
+        colecao.nomes = [d.get("nome", "") for d in dados]
+        colecao.descricoes = [d.get("descricao", "") for d in dados]
+        try:
+            colecao.latitudes = array("d", [float(d.get("latitude", 0)) for d in dados])
+            colecao.longitudes = array("d", [float(d.get("longitude", 0)) for d in dados])
+        except (ValueError, TypeError):
+            if estrito:
+                raise ValueError("Latitude e longitude devem ser números válidos")
+            colecao.latitudes = array("d", [_numero(d.get("latitude", 0)) for d in dados])
+            colecao.longitudes = array("d", [_numero(d.get("longitude", 0)) for d in dados])
+        try:
+            colecao.criados_em = array("d", [d.get("criado_em", _NAN) for d in dados])
+        except TypeError:
+            # Datas em texto (importação de CSV) ou inválidas
+            colecao.criados_em = array("d", [_numero(d.get("criado_em", _NAN)) for d in dados])
+
+        colecao._codigo_por_tipo, tipos = _internar([d.get("tipo", "") for d in dados])
+        colecao.tipos = list(colecao._codigo_por_tipo)
+        colecao.codigos_tipo = array("H", [colecao._codigo_por_tipo[t] for t in tipos])
+        colecao._codigo_por_criador, criadores = _internar([d.get("criado_por", "") for d in dados])
+        colecao.criadores = list(colecao._codigo_por_criador)
+        colecao.codigos_criador = array("I", [colecao._codigo_por_criador[c] for c in criadores])
+        return colecao
+
+    def linhas(self) -> range:
+        return range(len(self.ids))
+
+    def filtrar_tipo(self, tipo: str, linhas: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Linhas cujo tipo é `tipo`, comparando códigos em vez de strings.
+        """
+        codigo = self._codigo_por_tipo.get(tipo)
+        if codigo is None:
+            return []
+        codigos = self.codigos_tipo
+        if linhas is None:
+            return [i for i, c in enumerate(codigos) if c == codigo]
+        return [i for i in linhas if codigos[i] == codigo]
+
+    def filtrar_area(self, area: Tuple[float, float, float, float], linhas: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Linhas dentro da área (lat_min, lon_min, lat_max, lon_max).
+        """
+        lat_min, lon_min, lat_max, lon_max = area
+        latitudes, longitudes = self.latitudes, self.longitudes
+        linhas = self.linhas() if linhas is None else linhas
+        return [i for i in linhas if lat_min <= latitudes[i] <= lat_max and lon_min <= longitudes[i] <= lon_max]
+
+    def ordenar_por_nome(self, linhas: Optional[Iterable[int]] = None) -> List[int]:
+        """
+        Linhas ordenadas por nome; empates mantêm a ordem original.
+        """
+        linhas = self.linhas() if linhas is None else linhas
+        return sorted(linhas, key=self.nomes.__getitem__)
+
+    def ponto(self, linha: int) -> PontoCultural:
+        """
+        Cria o PontoCultural de uma linha.
+        """
+        return PontoCultural(
+            id=self.ids[linha],
+            nome=self.nomes[linha],
+            descricao=self.descricoes[linha],
+            tipo=self.tipos[self.codigos_tipo[linha]],
+            latitude=self.latitudes[linha],
+            longitude=self.longitudes[linha],
+            criado_por=self.criadores[self.codigos_criador[linha]],
+            criado_em=_data(self.criados_em[linha])
+        )
+
+    def materializar(self, linhas: Sequence[int]) -> List[PontoCultural]:
+        """
+        Cria os PontoCultural apenas das linhas informadas.
+        """
+        return [self.ponto(i) for i in linhas]
+
+
+@dataclass
+class RelatorioValidacao:
+    """
+    Resultado de validar_lote: todos os erros de cada linha da coleção.
+    """
+    total: int = 0
+    erros: List[Tuple[int, str, str]] = field(default_factory=list)
+
+    @property
+    def valido(self) -> bool:
+        return not self.erros
+
+    def por_linha(self) -> Dict[int, List[str]]:
+        """
+        Agrupa as mensagens de erro por linha.
+        """
+        agrupados: Dict[int, List[str]] = {}
+        for linha, _, mensagem in self.erros:
+            agrupados.setdefault(linha, []).append(mensagem)
+        return agrupados
+
+def validar_lote(colecao: PontoColecao) -> RelatorioValidacao:
+    """
+    Aplica as regras de PontoCultural.validar a todas as linhas de uma vez.
+
+    Cada regra percorre uma única coluna; tipos e criadores são verificados uma
+    vez por valor distinto da tabela internada, e as linhas são selecionadas
+    pelo código. Em vez de parar na primeira falha, todas são relatadas.
+
+    Args:
+        colecao (PontoColecao): Pontos a validar
+
+    Returns:
+        RelatorioValidacao: Erros como (linha, id, mensagem), ordenados por linha
+    """
+    tipos_validos = set(TIPOS_PONTOS)
+    tipos_vazios = {c for c, t in enumerate(colecao.tipos) if not isinstance(t, str) or not t.strip()}
+    tipos_invalidos = {c for c, t in enumerate(colecao.tipos) if c not in tipos_vazios and t not in tipos_validos}
+    criadores_vazios = {c for c, criador in enumerate(colecao.criadores) if not criador}
+
+    latitudes, longitudes = colecao.latitudes, colecao.longitudes
+    regras = [
+        ("Nome é obrigatório", [i for i, n in enumerate(colecao.nomes) if not isinstance(n, str) or not n.strip()]),
+        ("Tipo é obrigatório", [i for i, c in enumerate(colecao.codigos_tipo) if c in tipos_vazios] if tipos_vazios else []),
+        (f"Tipo inválido. Deve ser um dos seguintes: {', '.join(TIPOS_PONTOS)}",
+         [i for i, c in enumerate(colecao.codigos_tipo) if c in tipos_invalidos] if tipos_invalidos else []),
+        # NaN marca coordenadas que não puderam ser convertidas (x != x)
+        ("Latitude e longitude devem ser números válidos",
+         [i for i in colecao.linhas() if latitudes[i] != latitudes[i] or longitudes[i] != longitudes[i]]),
+        (f"Latitude deve estar entre {LATITUDE_MIN} e {LATITUDE_MAX}",
+         [i for i, x in enumerate(latitudes) if x == x and not LATITUDE_MIN <= x <= LATITUDE_MAX]),
+        (f"Longitude deve estar entre {LONGITUDE_MIN} e {LONGITUDE_MAX}",
+         [i for i, x in enumerate(longitudes) if x == x and not LONGITUDE_MIN <= x <= LONGITUDE_MAX]),
+        ("ID do criador é obrigatório", [i for i, c in enumerate(colecao.codigos_criador) if c in criadores_vazios] if criadores_vazios else []),
+    ]
+
+    ids = colecao.ids
+    erros = [(i, ids[i], mensagem) for mensagem, linhas in regras for i in linhas]
+    erros.sort(key=lambda erro: erro[0])
+    return RelatorioValidacao(total=len(colecao), erros=erros)
@@ -6,7 +6,11 @@ from config import (
     TIPOS_PONTOS
 )
 
-@dataclass
+# Versão do formato gravado no Firebase. Registros sem o campo (versão 1)
+# guardam latitude e longitude como texto; a partir da versão 2, como números.
+VERSAO_ESQUEMA = 2
+
+@dataclass(slots=True)
 class PontoCultural:
     nome: str
     descricao: str
@@ -15,6 +19,7 @@ class PontoCultural:
     longitude: float
     criado_por: str
     id: Optional[str] = None
+    criado_em: Optional[float] = None  # instante do cadastro, em segundos desde a época Unix
 
     def validar(self) -> bool:
         # Validação do nome
@@ -44,22 +49,38 @@ class PontoCultural:
         return True
 
     def to_dict(self) -> dict:
-        return {
+        dados = {
             "nome": self.nome,
             "descricao": self.descricao,
             "tipo": self.tipo,
-            "latitude": str(self.latitude),
-            "longitude": str(self.longitude),
-            "criado_por": self.criado_por
+            "latitude": float(self.latitude),
+            "longitude": float(self.longitude),
+            "criado_por": self.criado_por,
+            "versao_esquema": VERSAO_ESQUEMA
         }
+        # Pontos cadastrados antes do campo existir não têm data de criação
+        if self.criado_em is not None:
+            dados["criado_em"] = self.criado_em
+        return dados
 
     @classmethod
     def from_dict(cls, data: dict, id: str = None) -> 'PontoCultural':
-        try:
-            latitude = float(data.get("latitude", 0))
-            longitude = float(data.get("longitude", 0))
-        except (ValueError, TypeError):
-            raise ValueError("Latitude e longitude devem ser números válidos")
+        # Aceita coordenadas numéricas (versão 2) e em texto (versão 1)
+        latitude = data.get("latitude", 0)
+        longitude = data.get("longitude", 0)
+        if type(latitude) is not float or type(longitude) is not float:
+            try:
+                latitude = float(latitude)
+                longitude = float(longitude)
+            except (ValueError, TypeError):
+                raise ValueError("Latitude e longitude devem ser números válidos")
+
+        criado_em = data.get("criado_em")
+        if criado_em is not None and type(criado_em) is not float:
+            try:
+                criado_em = float(criado_em)
+            except (ValueError, TypeError):
+                raise ValueError("Data de criação deve ser um número válido")
 
         return cls(
             id=id,
@@ -68,5 +89,6 @@ class PontoCultural:
             tipo=data.get("tipo", ""),
             latitude=latitude,
             longitude=longitude,
-            criado_por=data.get("criado_por", "")
-        ) 
\ No newline at end of file
+            criado_por=data.get("criado_por", ""),
+            criado_em=criado_em
+        ) 
@@ -1,10 +1,7 @@
 import streamlit as st
 from firebase.firebase_client import login, logout, is_authenticated, get_user
-from firebase.firebase_config import init_firebase, is_firebase_initialized
-from services.ponto_service import PontoService
-from config import TIPOS_PONTOS
-import folium
-from streamlit_folium import st_folium
+from services.container import Servicos
+from config import TIPOS_PONTOS, MAPA_LARGURA, MAPA_ALTURA
 
 # Configuração da página
 st.set_page_config(
@@ -13,12 +10,20 @@ st.set_page_config(
     layout="wide"
 )
 
-# Inicializa o Firebase apenas se ainda não estiver inicializado
-if not is_firebase_initialized():
-    init_firebase()
+def show_mapa(chave: str, ponto_service):
+    """Exibe o mapa com os pontos da área visível, filtrados por tipo"""
+    # folium e streamlit_folium só são importados quando há mapa a exibir, depois
+    # que o restante da página já foi enviado
+    from streamlit_folium import st_folium
+    from utils.mapa import camada_viewport, mapa_base
 
-# Inicializa serviços
-ponto_service = PontoService()
+    tipo = st.selectbox("Filtrar mapa por tipo", ["Todos"] + TIPOS_PONTOS, key=f"mapa_tipo_{chave}")
+    # Limites e zoom da última interação com o mapa; só os pontos visíveis são carregados
+    viewport = st.session_state.get(f"mapa_{chave}") or {}
+    camada = camada_viewport(ponto_service, viewport.get("bounds"), viewport.get("zoom"),
+                             None if tipo == "Todos" else tipo)
+    st_folium(mapa_base(), key=f"mapa_{chave}", feature_group_to_add=camada,
+              returned_objects=["bounds", "zoom"], width=MAPA_LARGURA, height=MAPA_ALTURA)
 
 def show_login_form():
     """Exibe o formulário de login"""
@@ -48,28 +53,21 @@ def show_login_form():
     with col2:
         st.subheader("📍 Pontos Culturais Recentes")
         try:
-            pontos, _ = ponto_service.listar_pontos(pagina=1, limite=5)
-            if pontos:
-                # Cria o mapa
-                m = folium.Map(location=[-7.0, -37.0], zoom_start=6)
-                
-                # Adiciona os pontos ao mapa
-                for ponto in pontos:
-                    folium.Marker(
-                        [ponto.latitude, ponto.longitude],
-                        popup=f"<b>{ponto.nome}</b><br>{ponto.tipo}",
-                        tooltip=ponto.nome
-                    ).add_to(m)
-                
-                # Exibe o mapa
-                st_folium(m, width=700, height=400)
-                
-                # Lista os pontos
-                for ponto in pontos:
-                    with st.expander(f"📍 {ponto.nome} ({ponto.tipo})"):
-                        st.write(f"**Descrição:** {ponto.descricao}")
-                        st.write(f"**Localização:** {ponto.latitude}, {ponto.longitude}")
-            else:
+            # Serviços compartilhados pelo processo, criados na primeira execução;
+            # obtidos só aqui para que um erro ao carregar os pontos não derrube a página
+            ponto_service = Servicos.compartilhado().ponto_service
+
+            # O mapa não depende da lista: pontos sem data de criação ficam
+            # fora dos recentes, mas aparecem no mapa
+            show_mapa("login", ponto_service)
+            
+            # Lista os pontos
+            pontos = ponto_service.listar_recentes(5)
+            for ponto in pontos:
+                with st.expander(f"📍 {ponto.nome} ({ponto.tipo})"):
+                    st.write(f"**Descrição:** {ponto.descricao}")
+                    st.write(f"**Localização:** {ponto.latitude}, {ponto.longitude}")
+            if not pontos and ponto_service.contar_pontos() == 0:
                 st.info("Nenhum ponto cultural cadastrado ainda.")
         except Exception as e:
             st.error(f"Erro ao carregar pontos: {str(e)}")
@@ -96,38 +94,30 @@ def show_logout():
     # Exibe os pontos recentes
     st.subheader("📍 Pontos Culturais Recentes")
     try:
-        pontos, _ = ponto_service.listar_pontos(pagina=1, limite=5)
-        if pontos:
-            # Cria o mapa
-            m = folium.Map(location=[-7.0, -37.0], zoom_start=6)
-            
-            # Adiciona os pontos ao mapa
-            for ponto in pontos:
-                folium.Marker(
-                    [ponto.latitude, ponto.longitude],
-                    popup=f"<b>{ponto.nome}</b><br>{ponto.tipo}",
-                    tooltip=ponto.nome
-                ).add_to(m)
-            
-            # Exibe o mapa
-            st_folium(m, width=700, height=400)
-            
-            # Lista os pontos
-            for ponto in pontos:
-                with st.expander(f"📍 {ponto.nome} ({ponto.tipo})"):
-                    st.write(f"**Descrição:** {ponto.descricao}")
-                    st.write(f"**Localização:** {ponto.latitude}, {ponto.longitude}")
-                    
-                    # Botão para excluir se for o criador
-                    if ponto.criado_por == user['uid']:
-                        if st.button("🗑️ Excluir", key=f"excluir_{ponto.id}"):
-                            try:
-                                ponto_service.excluir_ponto(ponto.id)
-                                st.success("Ponto excluído com sucesso!")
-                                st.experimental_rerun()
-                            except Exception as e:
-                                st.error(f"Erro ao excluir ponto: {str(e)}")
-        else:
+        # Serviços compartilhados pelo processo, criados na primeira execução
+        ponto_service = Servicos.compartilhado().ponto_service
+
+        # O mapa não depende da lista: pontos sem data de criação ficam fora
+        # dos recentes, mas aparecem no mapa
+        show_mapa("inicio", ponto_service)
+        
+        # Lista os pontos
+        pontos = ponto_service.listar_recentes(5)
+        for ponto in pontos:
+            with st.expander(f"📍 {ponto.nome} ({ponto.tipo})"):
+                st.write(f"**Descrição:** {ponto.descricao}")
+                st.write(f"**Localização:** {ponto.latitude}, {ponto.longitude}")
+                
+                # Botão para excluir se for o criador
+                if ponto.criado_por == user['uid']:
+                    if st.button("🗑️ Excluir", key=f"excluir_{ponto.id}"):
+                        try:
+                            ponto_service.excluir_ponto(ponto.id)
+                            st.success("Ponto excluído com sucesso!")
+                            st.experimental_rerun()
+                        except Exception as e:
+                            st.error(f"Erro ao excluir ponto: {str(e)}")
+        if not pontos and ponto_service.contar_pontos() == 0:
             st.info("Nenhum ponto cultural cadastrado ainda.")
     except Exception as e:
         st.error(f"Erro ao carregar pontos: {str(e)}")
@@ -1,18 +1,11 @@
 import streamlit as st
-import folium
-from streamlit_folium import st_folium
-from firebase.firebase_config import init_firebase
-from services.ponto_service import PontoService
+from services.container import Servicos
 from firebase.firebase_client import require_auth, get_user
 from config import TIPOS_PONTOS
 
 # Verifica autenticação
 require_auth()
 
-# Inicializa serviços
-init_firebase()
-ponto_service = PontoService()
-
 # Cabeçalho com navegação
 st.title("📌 Cadastrar Novo Ponto Cultural")
 
@@ -28,11 +21,13 @@ with col3:
     if st.button("🚪 Sair"):
         st.switch_page("pages/0_login.py")
 
-# Mapa interativo
+# Mapa interativo; folium e streamlit_folium são importados só depois que o
+# cabeçalho foi enviado
 st.subheader("🗺️ Selecione a localização no mapa")
-m = folium.Map(location=[-7.0, -37.0], zoom_start=6)
+from streamlit_folium import st_folium
+from utils.mapa import mapa_base
 
-map_data = st_folium(m, width=700, height=500)
+map_data = st_folium(mapa_base(), width=700, height=500)
 
 latitude = ""
 longitude = ""
@@ -42,6 +37,9 @@ if map_data and map_data["last_clicked"]:
     longitude = map_data["last_clicked"]["lng"]
     st.success(f"Localização selecionada: {latitude}, {longitude}")
 
+# Serviços compartilhados pelo processo, criados na primeira execução
+ponto_service = Servicos.compartilhado().ponto_service
+
 with st.form("form-cadastro"):
     nome = st.text_input("Nome do ponto")
     descricao = st.text_area("Descrição")
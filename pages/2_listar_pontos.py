@@ -1,16 +1,11 @@
 import streamlit as st
-from firebase.firebase_config import init_firebase
-from services.ponto_service import PontoService
+from services.container import Servicos
 from firebase.firebase_client import require_auth, get_user
-from config import TIPOS_PONTOS
+from config import TIPOS_PONTOS, PAGINACAO_LIMITE, MAPA_LARGURA, MAPA_ALTURA
 
 # Verifica autenticação
 require_auth()
 
-# Inicializa serviços
-init_firebase()
-ponto_service = PontoService()
-
 # Cabeçalho com navegação
 st.title("📍 Pontos Culturais Cadastrados")
 
@@ -26,37 +21,75 @@ with col3:
     if st.button("🚪 Sair"):
         st.switch_page("pages/0_login.py")
 
+# Serviços compartilhados pelo processo, criados na primeira execução
+servicos = Servicos.compartilhado()
+ponto_service = servicos.ponto_service
+auth_service = servicos.auth_service
+uid = get_user()['uid']
+
 # Filtros e busca
-col1, col2 = st.columns([3, 1])
+col1, col2, col3 = st.columns([3, 1, 1])
 with col1:
     termo_busca = st.text_input("Buscar pontos", placeholder="Digite para buscar por nome, descrição ou tipo")
 with col2:
     tipo_filtro = st.selectbox("Filtrar por tipo", ["Todos"] + TIPOS_PONTOS)
+with col3:
+    apenas_meus = st.checkbox("Apenas meus pontos")
+    mostrar_mapa = st.checkbox("Mostrar mapa")
+
+tipo = tipo_filtro if tipo_filtro != "Todos" else None
 
-# Paginação
-if "pagina_atual" not in st.session_state:
-    st.session_state.pagina_atual = 1
+# Mapa sob demanda: sem ele, a página não importa folium e streamlit_folium.
+# Carrega só os pontos da área visível, agrupados conforme o zoom
+if mostrar_mapa:
+    try:
+        from streamlit_folium import st_folium
+        from utils.mapa import camada_viewport, html_mapa, mapa_base
+
+        viewport = st.session_state.get("mapa_listagem") or {}
+        camada = camada_viewport(ponto_service, viewport.get("bounds"), viewport.get("zoom"), tipo)
+        st_folium(mapa_base(), key="mapa_listagem", feature_group_to_add=camada,
+                  returned_objects=["bounds", "zoom"], width=MAPA_LARGURA, height=MAPA_ALTURA)
+        # Mapa completo do filtro, para uso fora da página; o HTML fica em cache
+        # até os pontos mudarem
+        st.download_button("⬇️ Baixar mapa completo (HTML)", html_mapa(ponto_service, tipo),
+                           file_name="mapa_pontos_culturais.html", mime="text/html")
+    except Exception as e:
+        st.error(f"Erro ao carregar o mapa: {str(e)}")
+
+# Paginação por cursor: cursores[i] é o cursor que abre a página i + 1
+if "cursores" not in st.session_state or st.session_state.get("tipo_paginado") != tipo:
+    st.session_state.cursores = [None]
+    st.session_state.tipo_paginado = tipo
 
 try:
+    proximo_cursor = None
+    total_paginas = 1
     if termo_busca:
         pontos = ponto_service.buscar_pontos(termo_busca)
-        total_paginas = 1
+    elif apenas_meus:
+        # Consulta indexada pelo criador, sem percorrer os pontos de todos
+        pontos = [p for p in ponto_service.listar_por_criador(uid) if tipo is None or p.tipo == tipo]
     else:
-        tipo = tipo_filtro if tipo_filtro != "Todos" else None
-        pontos, total_paginas = ponto_service.listar_pontos(
-            pagina=st.session_state.pagina_atual,
+        pontos, proximo_cursor = ponto_service.listar_pagina(
+            cursor=st.session_state.cursores[-1],
             tipo=tipo
         )
+        total_paginas = max(1, -(-ponto_service.contar_pontos(tipo) // PAGINACAO_LIMITE))
 
     if pontos:
+        # Criadores da página inteira numa única consulta
+        criadores = auth_service.obter_usuarios(ponto.criado_por for ponto in pontos)
+
         # Exibe os pontos
         for ponto in pontos:
             with st.expander(f"{ponto.nome} ({ponto.tipo})"):
                 st.write(f"**Descrição:** {ponto.descricao}")
                 st.write(f"**Localização:** {ponto.latitude}, {ponto.longitude}")
+                st.write(f"**Criado por:** {criadores.get(ponto.criado_por, {}).get('email') or 'usuário removido'}")
                 
                 # Só permite excluir pontos criados pelo usuário atual
-                if ponto.criado_por == get_user()['uid']:
+                if ponto.criado_por == uid:
                     col1, col2 = st.columns([1, 4])
                     with col1:
                         if st.button("Excluir", key=f"excluir_{ponto.id}"):
@@ -68,17 +101,18 @@ try:
                                 st.error(f"Erro ao excluir ponto: {str(e)}")
 
         # Controles de paginação
-        if total_paginas > 1 and not termo_busca:
+        pagina_atual = len(st.session_state.cursores)
+        if not termo_busca and not apenas_meus and (pagina_atual > 1 or proximo_cursor):
             col1, col2, col3 = st.columns([1, 2, 1])
             with col1:
-                if st.button("Anterior") and st.session_state.pagina_atual > 1:
-                    st.session_state.pagina_atual -= 1
+                if pagina_atual > 1 and st.button("Anterior"):
+                    st.session_state.cursores.pop()
                     st.experimental_rerun()
             with col2:
-                st.write(f"Página {st.session_state.pagina_atual} de {total_paginas}")
+                st.write(f"Página {pagina_atual} de {total_paginas}")
             with col3:
-                if st.button("Próxima") and st.session_state.pagina_atual < total_paginas:
-                    st.session_state.pagina_atual += 1
+                if proximo_cursor and st.button("Próxima"):
+                    st.session_state.cursores.append(proximo_cursor)
                     st.experimental_rerun()
     else:
         st.info("Nenhum ponto encontrado.")
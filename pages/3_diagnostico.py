@@ -0,0 +1,92 @@
+import json
+import streamlit as st
+from auth import autenticar_admin
+from services.container import Servicos
+from utils.metricas import metricas
+
+# Restrito ao administrador
+autenticar_admin()
+
+st.title("🩺 Diagnóstico")
+
+def _ms(segundos):
+    return None if segundos is None else round(segundos * 1000, 2)
+
+def _linhas(snapshot: dict, componente: str, rotulo: str) -> list:
+    """
+    Uma linha por método (ou operação) do componente, juntando duração, erros,
+    registros retornados e tamanho dos dados.
+    """
+    histogramas = snapshot["histogramas"]
+    erros = {
+        serie["rotulos"][rotulo]: serie["valor"]
+        for serie in snapshot["contadores"].get(f"{componente}_erros_total", [])
+    }
+    extras = {}
+    for nome, coluna in ((f"{componente}_registros", "registros (média)"),
+                         (f"{componente}_resposta_bytes", "resposta (bytes, média)"),
+                         (f"{componente}_envio_bytes", "envio (bytes, média)")):
+        for serie in histogramas.get(nome, []):
+            extras.setdefault(serie["rotulos"][rotulo], {})[coluna] = round(serie["media"], 1)
+
+    linhas = []
+    for serie in histogramas.get(f"{componente}_duracao_segundos", []):
+        chave = serie["rotulos"][rotulo]
+        linhas.append({
+            rotulo: chave,
+            "chamadas": serie["quantidade"],
+            "erros": erros.get(chave, 0),
+            "média (ms)": _ms(serie["media"]),
+            "p50 (ms)": _ms(serie["p50"]),
+            "p95 (ms)": _ms(serie["p95"]),
+            "p99 (ms)": _ms(serie["p99"]),
+            "total (ms)": _ms(serie["soma"]),
+            **extras.get(chave, {})
+        })
+    return sorted(linhas, key=lambda linha: -linha["total (ms)"])
+
+# A coleta vale para todo o processo, não só para esta sessão
+col1, col2 = st.columns(2)
+with col1:
+    metricas.habilitadas = st.toggle("Coletar métricas", value=metricas.habilitadas)
+with col2:
+    if st.button("🧹 Zerar métricas"):
+        metricas.limpar()
+
+if not metricas.habilitadas:
+    st.info("A coleta está desativada; ative-a acima ou defina METRICAS_HABILITADAS=true.")
+
+snapshot = metricas.snapshot()
+
+st.subheader("⏱️ Serviço de pontos")
+st.dataframe(_linhas(snapshot, "ponto_service", "metodo"), use_container_width=True)
+
+st.subheader("⏱️ Serviço de pontos (assíncrono)")
+st.dataframe(_linhas(snapshot, "ponto_service_async", "metodo"), use_container_width=True)
+
+st.subheader("🔥 Chamadas ao Firebase")
+st.dataframe(_linhas(snapshot, "firebase", "operacao"), use_container_width=True)
+
+st.subheader("🗃️ Caches")
+st.dataframe(
+    [{**coletor["rotulos"], **coletor["valores"]} for coletor in snapshot["coletores"] if coletor["familia"] == "cache"],
+    use_container_width=True
+)
+
+st.subheader("🚀 Inicialização dos serviços")
+tempos = Servicos.compartilhado().tempos
+if tempos:
+    st.dataframe(
+        [{"serviço": nome, "tempo (ms)": _ms(segundos)} for nome, segundos in tempos.items()],
+        use_container_width=True
+    )
+else:
+    st.caption("Nenhum serviço foi inicializado neste processo ainda.")
+
+st.subheader("📤 Exportar")
+col1, col2 = st.columns(2)
+with col1:
+    st.download_button("Prometheus (texto)", metricas.prometheus(), file_name="metricas.prom", mime="text/plain")
+with col2:
+    st.download_button("Snapshot (JSON)", json.dumps(snapshot, indent=2, ensure_ascii=False),
+                       file_name="metricas.json", mime="application/json")
@@ -0,0 +1,25 @@
+"""
+Repositórios de pontos culturais: a interface comum e suas implementações.
+"""
+from repositorios.base import RepositorioPontos
+from config import REPOSITORIO_PONTOS, SQLITE_CAMINHO
+
+BACKENDS = ("firebase", "sqlite")
+
+def criar_repositorio(backend: str = REPOSITORIO_PONTOS) -> RepositorioPontos:
+    """
+    Cria o repositório configurado em REPOSITORIO_PONTOS.
+
+    Args:
+        backend (str): "firebase" ou "sqlite"
+
+    Raises:
+        ValueError: Se o backend não for reconhecido
+    """
+    if backend == "firebase":
+        from repositorios.repositorio_firebase import RepositorioFirebase
+        return RepositorioFirebase()
+    if backend == "sqlite":
+        from repositorios.repositorio_sqlite import RepositorioSQLite
+        return RepositorioSQLite.compartilhado(SQLITE_CAMINHO)
+    raise ValueError(f"Repositório inválido. Deve ser um dos seguintes: {', '.join(BACKENDS)}")
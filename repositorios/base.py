@@ -0,0 +1,129 @@
+"""
+Interface comum dos repositórios de pontos culturais.
+"""
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Tuple
+from models.ponto_cultural import PontoCultural
+from utils.indice_espacial import Area, area_do_raio, distancia_km
+from config import IMPORTACAO_TAMANHO_LOTE
+
+class RepositorioPontos(ABC):
+    """
+    Armazenamento dos pontos culturais usado por PontoService.
+
+    O serviço cuida de validação, cache e índice em memória; o repositório só
+    lê e grava. Os registros recebidos estão no formato de PontoCultural.to_dict;
+    campos de índice próprios de um backend são acrescentados pelo repositório.
+    As listagens seguem a ordenação por (nome, id).
+    """
+
+    @abstractmethod
+    def inserir(self, registros: Dict[str, dict]) -> None:
+        """
+        Grava novos pontos, indexados pelo ID, numa única operação atômica.
+        """
+
+    @abstractmethod
+    def excluir(self, ids: List[str], tipos: Optional[List[Optional[str]]] = None) -> None:
+        """
+        Remove os pontos numa única operação atômica.
+
+        Args:
+            ids (List[str]): IDs dos pontos
+            tipos (Optional[List[Optional[str]]]): Tipos dos pontos, na mesma ordem,
+                quando já conhecidos pelo chamador; None num item (ou na lista
+                inteira) indica tipo desconhecido, consultado no armazenamento
+        """
+
+    @abstractmethod
+    def obter(self, id_ponto: str) -> Optional[PontoCultural]:
+        """
+        Retorna o ponto com o ID informado, se existir.
+        """
+
+    @abstractmethod
+    def listar(self, tipo: Optional[str], inicio: int, quantidade: int) -> Tuple[List[PontoCultural], int]:
+        """
+        Retorna os pontos nas posições [inicio, inicio + quantidade) da ordenação
+        por nome e o total de pontos do filtro.
+        """
+
+    @abstractmethod
+    def apos(self, chave: Optional[Tuple[str, str]], limite: int, tipo: Optional[str] = None) -> Tuple[List[PontoCultural], bool]:
+        """
+        Retorna até `limite` pontos posteriores à chave (nome, id) e se existem
+        mais pontos depois deles.
+        """
+
+    @abstractmethod
+    def listar_por_criador(self, criado_por: str) -> List[PontoCultural]:
+        """
+        Retorna os pontos cadastrados pelo usuário, ordenados por nome, lendo
+        apenas esses registros.
+        """
+
+    @abstractmethod
+    def contar(self, tipo: Optional[str] = None) -> int:
+        """
+        Retorna a quantidade de pontos, no total ou de um tipo.
+        """
+
+    @abstractmethod
+    def listar_recentes(self, quantidade: int) -> List[PontoCultural]:
+        """
+        Retorna os `quantidade` pontos cadastrados mais recentemente, do mais
+        novo ao mais antigo, lendo apenas esses registros. Pontos sem data de
+        criação ficam de fora.
+        """
+
+    @abstractmethod
+    def buscar_texto(self, termo: str) -> List[PontoCultural]:
+        """
+        Busca pontos pelo termo no nome, descrição ou tipo, sem diferenciar acentos.
+        """
+
+    @abstractmethod
+    def buscar_na_area(self, area: Area) -> List[PontoCultural]:
+        """
+        Retorna os pontos dentro da área (lat_min, lon_min, lat_max, lon_max).
+        """
+
+    def buscar_proximos(self, lat: float, lon: float, raio_km: float) -> List[PontoCultural]:
+        """
+        Retorna os pontos a até `raio_km` da coordenada, do mais próximo ao mais distante.
+
+        A implementação padrão filtra por distância os pontos do retângulo que
+        contém o círculo.
+        """
+        encontrados = []
+        for ponto in self.buscar_na_area(area_do_raio(lat, lon, raio_km)):
+            distancia = distancia_km(lat, lon, ponto.latitude, ponto.longitude)
+            if distancia <= raio_km:
+                encontrados.append((distancia, ponto.id or "", ponto))
+        encontrados.sort(key=lambda item: item[:2])
+        return [ponto for _, _, ponto in encontrados]
+
+    @abstractmethod
+    def percorrer(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE) -> Iterator[PontoCultural]:
+        """
+        Percorre todos os pontos em ordem de ID, lendo `tamanho_lote` por vez.
+        """
+
+    @abstractmethod
+    def recalcular_contadores(self) -> dict:
+        """
+        Recalcula as contagens a partir dos pontos gravados.
+
+        Returns:
+            dict: Contagens ({"total": int, "tipos": {tipo: int}})
+        """
+
+    def migrar_coordenadas(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE, reiniciar: bool = False) -> int:
+        """
+        Atualiza registros anteriores ao esquema atual (coordenadas em texto,
+        campos de índice ausentes); por padrão, não há o que migrar.
+
+        Returns:
+            int: Quantidade de pontos atualizados
+        """
+        return 0
@@ -0,0 +1,355 @@
+"""
+Repositório de pontos culturais no Firebase Realtime Database.
+"""
+from firebase_admin import db
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from models.ponto_cultural import PontoCultural, VERSAO_ESQUEMA
+from models.ponto_colecao import PontoColecao
+from repositorios.base import RepositorioPontos
+from utils.indice_textual import normalizar
+from utils.indice_espacial import Area
+from utils.metricas import metricas
+from utils.paralelo import executar_em_paralelo
+from config import LOG_LEVEL, LOG_FORMAT, IMPORTACAO_TAMANHO_LOTE
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+# Separador usado no campo composto "tipo_nome", indexado para paginar por tipo
+SEPARADOR_TIPO_NOME = "|"
+# Maior caractere usado pelo Realtime Database como limite superior de prefixo
+FIM_PREFIXO = "\uf8ff"
+# Nó com as contagens de pontos (total e por tipo), mantidas a cada escrita
+CONTADORES = "contadores/pontos"
+# Nó com a última chave processada pela migração de coordenadas, para retomada
+MIGRACAO_COORDENADAS = "migracoes/coordenadas"
+
+def campo_tipo_nome(tipo: str, nome: str) -> str:
+    """
+    Valor do campo composto "tipo_nome", ordenado por tipo e depois por nome.
+    """
+    return f"{tipo}{SEPARADOR_TIPO_NOME}{nome}"
+
+def atualizacoes_contagens(deltas: Dict[str, int]) -> dict:
+    """
+    Gera as atualizações multi-caminho que somam a variação de cada tipo às
+    contagens e a variação total ao total, usando incremento atômico do servidor.
+    """
+    atualizacoes = {f"{CONTADORES}/total": {".sv": {"increment": sum(deltas.values())}}}
+    for tipo, delta in deltas.items():
+        atualizacoes[f"{CONTADORES}/tipos/{tipo}"] = {".sv": {"increment": delta}}
+    return atualizacoes
+
+def contar_registros(pontos_data: Dict[str, dict]) -> dict:
+    """
+    Conteúdo do nó de contadores (total e por tipo) calculado a partir dos
+    registros do nó "pontos".
+    """
+    tipos: Dict[str, int] = {}
+    for ponto_data in pontos_data.values():
+        tipo = ponto_data.get("tipo")
+        if tipo:
+            tipos[tipo] = tipos.get(tipo, 0) + 1
+    return {"total": len(pontos_data), "tipos": tipos}
+
+def montar_listagem(pontos_data: Dict[str, dict], tipo: Optional[str], inicio: int,
+                    quantidade: int) -> Tuple[List[PontoCultural], int]:
+    """
+    Filtra, ordena e recorta os registros do nó "pontos".
+
+    Returns:
+        Tuple[List[PontoCultural], int]: Pontos do recorte e total do filtro
+    """
+    # O filtro por tipo é aplicado nos registros, para que só os do tipo virem
+    # colunas; ordenação e recorte são feitos sobre as colunas e só o recorte
+    # vira PontoCultural
+    if tipo:
+        pontos_data = {
+            id_ponto: ponto_data for id_ponto, ponto_data in pontos_data.items()
+            if ponto_data.get("tipo") == tipo
+        }
+    colecao = PontoColecao.from_registros(pontos_data)
+    linhas = colecao.ordenar_por_nome(colecao.linhas())
+    return colecao.materializar(linhas[inicio:inicio + quantidade]), len(linhas)
+
+def filtrar_busca(pontos_data: Dict[str, dict], termo: str) -> List[PontoCultural]:
+    """
+    Seleciona os registros cujo nome, descrição ou tipo contém o termo,
+    ordenados por nome.
+    """
+    resultados = []
+
+    termo = normalizar(termo)
+    for id_ponto, ponto_data in pontos_data.items():
+        if (termo in normalizar(ponto_data.get("nome", "")) or
+            termo in normalizar(ponto_data.get("descricao", "")) or
+            termo in normalizar(ponto_data.get("tipo", ""))):
+            resultados.append(PontoCultural.from_dict(ponto_data, id_ponto))
+
+    # Ordena por nome
+    resultados.sort(key=lambda x: x.nome)
+    return resultados
+
+
+class RepositorioFirebase(RepositorioPontos):
+    """
+    Repositório sobre o nó "pontos" do Realtime Database.
+
+    Escritas usam update() multi-caminho na raiz para gravar os pontos e o nó
+    de contadores atomicamente; antes da primeira escrita, o nó de contadores
+    é criado a partir dos pontos existentes, se ainda não existir. Listagens por cursor usam os índices "nome" e
+    "tipo_nome", os pontos recentes e os de um usuário, os índices
+    "criado_em" e "criado_por", e as consultas por área (e por raio), a faixa
+    de latitude do índice "latitude" (ver database.rules.json); as demais
+    leituras baixam o nó.
+    """
+
+    def __init__(self):
+        self.raiz = db.reference()
+        self.ref = db.reference('pontos')
+        self._contadores_prontos = False
+        self._lock_contadores = threading.Lock()
+
+    @staticmethod
+    def _chamar(operacao: str, funcao: Callable, *args) -> Any:
+        """
+        Executa uma chamada ao Realtime Database (get, update, set ou delete),
+        registrando a duração e o tamanho dos dados enviados e recebidos.
+        """
+        if args:
+            metricas.observar_tamanho("firebase_envio_bytes", args[0], operacao=operacao)
+        with metricas.cronometrar("firebase", operacao=operacao):
+            resposta = funcao(*args)
+        if resposta is not None:
+            metricas.observar_tamanho("firebase_resposta_bytes", resposta, operacao=operacao)
+        return resposta
+
+    def _garantir_contadores(self) -> None:
+        """
+        Cria o nó de contadores a partir dos pontos existentes antes do primeiro
+        incremento. O incremento do servidor num nó ausente começa do zero:
+        numa base anterior aos contadores, o total ficaria errado para sempre.
+        """
+        if self._contadores_prontos:
+            return
+        with self._lock_contadores:
+            if self._contadores_prontos:
+                return
+            existentes = self._chamar("contar", lambda: self.raiz.child(CONTADORES).get(shallow=True))
+            if existentes is None:
+                logger.info("Nó de contadores ausente; recalculando a partir dos pontos existentes")
+                self.recalcular_contadores()
+            self._contadores_prontos = True
+
+    def inserir(self, registros: Dict[str, dict]) -> None:
+        self._garantir_contadores()
+        deltas: Dict[str, int] = {}
+        atualizacoes = {}
+        for id_ponto, registro in registros.items():
+            # Campo composto do índice "tipo_nome", usado na listagem por tipo
+            tipo_nome = campo_tipo_nome(registro["tipo"], registro["nome"])
+            atualizacoes[f"{self.ref.key}/{id_ponto}"] = {**registro, "tipo_nome": tipo_nome}
+            deltas[registro["tipo"]] = deltas.get(registro["tipo"], 0) + 1
+        atualizacoes.update(atualizacoes_contagens(deltas))
+        self._chamar("inserir", self.raiz.update, atualizacoes)
+
+    def excluir(self, ids: List[str], tipos: Optional[List[Optional[str]]] = None) -> None:
+        self._garantir_contadores()
+        # Tipos desconhecidos pelo chamador são lidos do banco; pontos inexistentes
+        # continuam sem tipo e não alteram as contagens
+        tipos = list(tipos) if tipos is not None else [None] * len(ids)
+        desconhecidos = [posicao for posicao, tipo in enumerate(tipos) if tipo is None]
+        lidos = executar_em_paralelo(
+            lambda posicao: self._chamar("obter_tipo", self.ref.child(ids[posicao]).child("tipo").get), desconhecidos
+        )
+        for posicao, tipo in zip(desconhecidos, lidos):
+            tipos[posicao] = tipo
+
+        atualizacoes = {f"{self.ref.key}/{id_ponto}": None for id_ponto in ids}
+        deltas: Dict[str, int] = {}
+        for tipo in tipos:
+            if tipo:
+                deltas[tipo] = deltas.get(tipo, 0) - 1
+        if deltas:
+            atualizacoes.update(atualizacoes_contagens(deltas))
+        self._chamar("excluir", self.raiz.update, atualizacoes)
+
+    def obter(self, id_ponto: str) -> Optional[PontoCultural]:
+        ponto_data = self._chamar("obter", self.ref.child(id_ponto).get)
+        if ponto_data:
+            return PontoCultural.from_dict(ponto_data, id_ponto)
+        return None
+
+    def listar(self, tipo: Optional[str], inicio: int, quantidade: int) -> Tuple[List[PontoCultural], int]:
+        return montar_listagem(self._chamar("listar", self.ref.get) or {}, tipo, inicio, quantidade)
+
+    def apos(self, chave: Optional[Tuple[str, str]], limite: int, tipo: Optional[str] = None) -> Tuple[List[PontoCultural], bool]:
+        if tipo:
+            campo = "tipo_nome"
+            prefixo = f"{tipo}{SEPARADOR_TIPO_NOME}"
+        else:
+            campo = "nome"
+            prefixo = ""
+        inicio = prefixo + (chave[0] if chave else "")
+
+        # Busca um registro a mais para saber se existe próxima página (e mais
+        # um para o próprio ponto do cursor, que start_at inclui). Pontos com o
+        # mesmo nome do cursor são descartados localmente; se sobrarem poucos
+        # registros na janela, ela é ampliada.
+        janela = limite + (2 if chave else 1)
+        while True:
+            query = self.ref.order_by_child(campo).start_at(inicio)
+            if prefixo:
+                query = query.end_at(prefixo + FIM_PREFIXO)
+            pontos_data = self._chamar("apos", query.limit_to_first(janela).get) or {}
+            itens = [
+                (id_ponto, ponto_data) for id_ponto, ponto_data in pontos_data.items()
+                if chave is None or (ponto_data.get("nome", ""), id_ponto) > chave
+            ]
+            if len(itens) > limite or len(pontos_data) < janela:
+                break
+            janela *= 2
+
+        pontos = [PontoCultural.from_dict(ponto_data, id_ponto) for id_ponto, ponto_data in itens[:limite]]
+        return pontos, len(itens) > limite
+
+    def listar_recentes(self, quantidade: int) -> List[PontoCultural]:
+        # O índice "criado_em" ordena do mais antigo ao mais novo e registros sem
+        # o campo vêm antes de todos; limit_to_last traz só os últimos
+        consulta = self.ref.order_by_child("criado_em").limit_to_last(quantidade)
+        pontos_data = self._chamar("listar_recentes", consulta.get) or {}
+        pontos = [
+            PontoCultural.from_dict(ponto_data, id_ponto) for id_ponto, ponto_data in pontos_data.items()
+            if ponto_data.get("criado_em") is not None
+        ]
+        pontos.reverse()
+        return pontos
+
+    def listar_por_criador(self, criado_por: str) -> List[PontoCultural]:
+        consulta = self.ref.order_by_child("criado_por").equal_to(criado_por)
+        pontos_data = self._chamar("listar_por_criador", consulta.get) or {}
+        pontos = [PontoCultural.from_dict(ponto_data, id_ponto) for id_ponto, ponto_data in pontos_data.items()]
+        pontos.sort(key=lambda ponto: (ponto.nome, ponto.id))
+        return pontos
+
+    def contar(self, tipo: Optional[str] = None) -> int:
+        # Lê o nó de contadores, criando-o se ainda não existir
+        contadores = self._chamar("contar", self.raiz.child(CONTADORES).get)
+        if contadores is None:
+            contadores = self.recalcular_contadores()
+        if tipo:
+            return (contadores.get("tipos") or {}).get(tipo, 0)
+        return contadores.get("total", 0)
+
+    def buscar_texto(self, termo: str) -> List[PontoCultural]:
+        return filtrar_busca(self._chamar("buscar_texto", self.ref.get) or {}, termo)
+
+    def buscar_na_area(self, area: Area) -> List[PontoCultural]:
+        # Só a faixa de latitude é consultada no banco (índice "latitude"); a
+        # longitude é filtrada aqui. Coordenadas ainda em texto (esquema 1)
+        # ficam fora da faixa até a migração.
+        lat_min, _, lat_max, _ = area
+        consulta = self.ref.order_by_child("latitude").start_at(lat_min).end_at(lat_max)
+        colecao = PontoColecao.from_registros(self._chamar("buscar_na_area", consulta.get) or {})
+        return colecao.materializar(colecao.filtrar_area(area))
+
+    def percorrer(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE) -> Iterator[PontoCultural]:
+        ultima_chave = None
+        while True:
+            query = self.ref.order_by_key()
+            if ultima_chave is not None:
+                query = query.start_at(ultima_chave)
+            # start_at inclui a última chave do bloco anterior
+            consulta = query.limit_to_first(tamanho_lote + (1 if ultima_chave else 0))
+            pontos_data = self._chamar("percorrer", consulta.get) or {}
+            novos = [(k, v) for k, v in pontos_data.items() if k != ultima_chave]
+            for id_ponto, ponto_data in novos:
+                yield PontoCultural.from_dict(ponto_data, id_ponto)
+            if len(novos) < tamanho_lote:
+                return
+            ultima_chave = novos[-1][0]
+
+    def recalcular_contadores(self) -> dict:
+        contadores = contar_registros(self._chamar("recalcular_contadores", self.ref.get) or {})
+        self._chamar("recalcular_contadores", self.raiz.child(CONTADORES).set, contadores)
+        return contadores
+
+    def migrar_coordenadas(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE, reiniciar: bool = False) -> int:
+        """
+        Regrava as coordenadas em texto (esquema versão 1) como números.
+
+        Os pontos são percorridos em ordem de ID, em blocos de `tamanho_lote`.
+        Cada bloco é gravado numa única escrita atômica junto com a última chave
+        processada, de modo que uma execução interrompida continua de onde parou.
+        Pontos já migrados são ignorados, então repetir a migração é seguro.
+
+        Pontos sem data de criação recebem um segundo antes da do ponto datado
+        mais antigo (ou o instante da migração, se não houver nenhum): são
+        anteriores aos demais, mas sem o campo ficariam fora do índice "criado_em".
+        """
+        progresso = self.raiz.child(MIGRACAO_COORDENADAS)
+        ultima_chave = None if reiniciar else self._chamar("migrar_coordenadas", progresso.get)
+        if ultima_chave:
+            logger.info(f"Retomando a migração de coordenadas após o ponto {ultima_chave}")
+
+        # start_at(0) deixa de fora os registros sem o campo, que vêm antes de todos
+        consulta = self.ref.order_by_child("criado_em").start_at(0).limit_to_first(1)
+        mais_antigo = self._chamar("migrar_coordenadas", consulta.get) or {}
+        criado_em = next((ponto_data["criado_em"] - 1 for ponto_data in mais_antigo.values()), time.time())
+
+        migrados = 0
+        while True:
+            query = self.ref.order_by_key()
+            if ultima_chave:
+                query = query.start_at(ultima_chave)
+            # start_at inclui a última chave do bloco anterior
+            consulta = query.limit_to_first(tamanho_lote + (1 if ultima_chave else 0))
+            pontos_data = self._chamar("migrar_coordenadas", consulta.get) or {}
+            novos = [(k, v) for k, v in pontos_data.items() if k != ultima_chave]
+            if not novos:
+                break
+
+            atualizacoes = {}
+            for id_ponto, ponto_data in novos:
+                campos = self._campos_migrados(id_ponto, ponto_data, criado_em)
+                for campo, valor in campos.items():
+                    atualizacoes[f"{self.ref.key}/{id_ponto}/{campo}"] = valor
+                migrados += bool(campos)
+
+            ultima_chave = novos[-1][0]
+            atualizacoes[MIGRACAO_COORDENADAS] = ultima_chave
+            self._chamar("migrar_coordenadas", self.raiz.update, atualizacoes)
+            if len(novos) < tamanho_lote:
+                break
+
+        # Migração concluída: a próxima execução recomeça do início
+        self._chamar("migrar_coordenadas", progresso.delete)
+        return migrados
+
+    @staticmethod
+    def _campos_migrados(id_ponto: str, ponto_data: Any, criado_em: float) -> Dict[str, Any]:
+        """
+        Campos a regravar num registro anterior ao esquema atual: coordenadas
+        em texto convertidas em números, o campo "tipo_nome", que registros
+        gravados antes da paginação por tipo não têm e sem o qual não aparecem
+        nas consultas por tipo, e a data de criação, sem a qual não aparecem
+        entre os pontos recentes.
+        """
+        if not isinstance(ponto_data, dict):
+            return {}
+        campos = {}
+        if ponto_data.get("versao_esquema", 1) < VERSAO_ESQUEMA:
+            try:
+                ponto = PontoCultural.from_dict(ponto_data, id_ponto)
+                campos.update(latitude=ponto.latitude, longitude=ponto.longitude, versao_esquema=VERSAO_ESQUEMA)
+            except ValueError as e:
+                logger.warning(f"Coordenadas do ponto cultural {id_ponto} não migradas: {str(e)}")
+        if "tipo_nome" not in ponto_data and ponto_data.get("tipo"):
+            campos["tipo_nome"] = campo_tipo_nome(ponto_data["tipo"], ponto_data.get("nome", ""))
+        if ponto_data.get("criado_em") is None:
+            campos["criado_em"] = criado_em
+        return campos
@@ -0,0 +1,242 @@
+"""
+Repositório de pontos culturais num banco SQLite local.
+"""
+import os
+import sqlite3
+import threading
+import logging
+from typing import Dict, Iterator, List, Optional, Tuple
+from models.ponto_cultural import PontoCultural
+from repositorios.base import RepositorioPontos
+from utils.indice_textual import tokenizar
+from utils.indice_espacial import Area
+from config import LOG_LEVEL, LOG_FORMAT, IMPORTACAO_TAMANHO_LOTE, SQLITE_CAMINHO
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+_COLUNAS = "id, nome, descricao, tipo, latitude, longitude, criado_por, criado_em"
+_COLUNAS_P = ", ".join(f"p.{coluna}" for coluna in _COLUNAS.split(", "))
+
+# A tabela "pontos" é a fonte dos dados; a busca textual (FTS5) e a espacial
+# (R*Tree) são tabelas virtuais mantidas por gatilhos, indexadas pela coluna seq.
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS pontos (
+    seq INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    nome TEXT NOT NULL,
+    descricao TEXT NOT NULL,
+    tipo TEXT NOT NULL,
+    latitude REAL NOT NULL,
+    longitude REAL NOT NULL,
+    criado_por TEXT NOT NULL,
+    criado_em REAL
+);
+CREATE INDEX IF NOT EXISTS pontos_nome ON pontos (nome, id);
+CREATE INDEX IF NOT EXISTS pontos_tipo_nome ON pontos (tipo, nome, id);
+CREATE INDEX IF NOT EXISTS pontos_criado_por ON pontos (criado_por, nome, id);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS pontos_fts USING fts5(
+    nome, descricao, tipo,
+    content='pontos', content_rowid='seq',
+    tokenize='unicode61 remove_diacritics 2'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS pontos_rtree USING rtree(seq, lat_min, lat_max, lon_min, lon_max);
+
+CREATE TRIGGER IF NOT EXISTS pontos_inserido AFTER INSERT ON pontos BEGIN
+    INSERT INTO pontos_fts (rowid, nome, descricao, tipo) VALUES (new.seq, new.nome, new.descricao, new.tipo);
+    INSERT INTO pontos_rtree VALUES (new.seq, new.latitude, new.latitude, new.longitude, new.longitude);
+END;
+CREATE TRIGGER IF NOT EXISTS pontos_excluido AFTER DELETE ON pontos BEGIN
+    INSERT INTO pontos_fts (pontos_fts, rowid, nome, descricao, tipo) VALUES ('delete', old.seq, old.nome, old.descricao, old.tipo);
+    DELETE FROM pontos_rtree WHERE seq = old.seq;
+END;
+"""
+
+# Colunas acrescentadas depois da criação do esquema, com seus índices; bancos
+# criados antes recebem a coluna ao serem abertos
+_COLUNAS_NOVAS = {
+    "criado_em": ("REAL", "CREATE INDEX IF NOT EXISTS pontos_criado_em ON pontos (criado_em)"),
+}
+
+# Pesos de nome, descrição e tipo no ranking bm25, na ordem das colunas do FTS
+_PESOS_BUSCA = (3.0, 1.0, 2.0)
+
+def _ponto(linha: tuple) -> PontoCultural:
+    id_ponto, nome, descricao, tipo, latitude, longitude, criado_por, criado_em = linha
+    return PontoCultural(
+        id=id_ponto,
+        nome=nome,
+        descricao=descricao,
+        tipo=tipo,
+        latitude=latitude,
+        longitude=longitude,
+        criado_por=criado_por,
+        criado_em=criado_em
+    )
+
+
+class RepositorioSQLite(RepositorioPontos):
+    """
+    Repositório num arquivo SQLite, sem acesso à rede.
+
+    Listagens usam os índices (nome, id), (tipo, nome, id) e (criado_por,
+    nome, id), e os pontos recentes, o índice de criado_em. A busca textual
+    usa FTS5 com remoção de acentos e casamento por prefixo de cada palavra,
+    ordenada por relevância; as buscas por área usam uma R*Tree. Contagens
+    são feitas com COUNT(*) sobre os índices, sem nó de contadores.
+
+    Uma única conexão é compartilhada entre as threads, protegida por lock.
+    """
+
+    _compartilhados: Dict[str, 'RepositorioSQLite'] = {}
+    _lock_compartilhados = threading.Lock()
+
+    def __init__(self, caminho: str = SQLITE_CAMINHO):
+        """
+        Abre (ou cria) o banco e garante o esquema.
+
+        Args:
+            caminho (str): Arquivo do banco, ou ":memory:" para um banco temporário
+        """
+        if caminho != ":memory:":
+            diretorio = os.path.dirname(caminho)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+        self.caminho = caminho
+        self._lock = threading.RLock()
+        self._conexao = sqlite3.connect(caminho, check_same_thread=False)
+        if caminho != ":memory:":
+            self._conexao.execute("PRAGMA journal_mode=WAL")
+        self._conexao.executescript(_ESQUEMA)
+        self._migrar_esquema()
+
+    @classmethod
+    def compartilhado(cls, caminho: str = SQLITE_CAMINHO) -> 'RepositorioSQLite':
+        """
+        Retorna o repositório único do processo para o arquivo informado.
+        """
+        with cls._lock_compartilhados:
+            if caminho not in cls._compartilhados:
+                cls._compartilhados[caminho] = cls(caminho)
+            return cls._compartilhados[caminho]
+
+    def _migrar_esquema(self) -> None:
+        """
+        Acrescenta as colunas de _COLUNAS_NOVAS que faltarem e cria seus índices.
+        """
+        existentes = {linha[1] for linha in self._conexao.execute("PRAGMA table_info(pontos)")}
+        with self._conexao:
+            for coluna, (tipo, indice) in _COLUNAS_NOVAS.items():
+                if coluna not in existentes:
+                    logger.info(f"Acrescentando a coluna {coluna} ao banco {self.caminho}")
+                    self._conexao.execute(f"ALTER TABLE pontos ADD COLUMN {coluna} {tipo}")
+                self._conexao.execute(indice)
+
+    def fechar(self) -> None:
+        with self._lock:
+            self._conexao.close()
+
+    def _consultar(self, sql: str, parametros: tuple = ()) -> List[tuple]:
+        with self._lock:
+            return self._conexao.execute(sql, parametros).fetchall()
+
+    def inserir(self, registros: Dict[str, dict]) -> None:
+        linhas = [
+            (id_ponto, r["nome"], r.get("descricao", ""), r["tipo"], float(r["latitude"]),
+             float(r["longitude"]), r.get("criado_por", ""), r.get("criado_em"))
+            for id_ponto, r in registros.items()
+        ]
+        with self._lock, self._conexao:
+            self._conexao.executemany(f"INSERT INTO pontos ({_COLUNAS}) VALUES (?, ?, ?, ?, ?, ?, ?, ?)", linhas)
+
+    def excluir(self, ids: List[str], tipos: Optional[List[Optional[str]]] = None) -> None:
+        with self._lock, self._conexao:
+            self._conexao.executemany("DELETE FROM pontos WHERE id = ?", [(id_ponto,) for id_ponto in ids])
+
+    def obter(self, id_ponto: str) -> Optional[PontoCultural]:
+        linhas = self._consultar(f"SELECT {_COLUNAS} FROM pontos WHERE id = ?", (id_ponto,))
+        return _ponto(linhas[0]) if linhas else None
+
+    def listar(self, tipo: Optional[str], inicio: int, quantidade: int) -> Tuple[List[PontoCultural], int]:
+        filtro, parametros = ("WHERE tipo = ?", (tipo,)) if tipo else ("", ())
+        with self._lock:
+            linhas = self._conexao.execute(
+                f"SELECT {_COLUNAS} FROM pontos {filtro} ORDER BY nome, id LIMIT ? OFFSET ?",
+                parametros + (quantidade, inicio)
+            ).fetchall()
+            total = self._conexao.execute(f"SELECT COUNT(*) FROM pontos {filtro}", parametros).fetchone()[0]
+        return [_ponto(linha) for linha in linhas], total
+
+    def apos(self, chave: Optional[Tuple[str, str]], limite: int, tipo: Optional[str] = None) -> Tuple[List[PontoCultural], bool]:
+        condicoes, parametros = [], []
+        if tipo:
+            condicoes.append("tipo = ?")
+            parametros.append(tipo)
+        if chave:
+            condicoes.append("(nome, id) > (?, ?)")
+            parametros.extend(chave)
+        filtro = f"WHERE {' AND '.join(condicoes)}" if condicoes else ""
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS} FROM pontos {filtro} ORDER BY nome, id LIMIT ?", tuple(parametros) + (limite + 1,)
+        )
+        return [_ponto(linha) for linha in linhas[:limite]], len(linhas) > limite
+
+    def listar_recentes(self, quantidade: int) -> List[PontoCultural]:
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS} FROM pontos WHERE criado_em IS NOT NULL ORDER BY criado_em DESC LIMIT ?", (quantidade,)
+        )
+        return [_ponto(linha) for linha in linhas]
+
+    def listar_por_criador(self, criado_por: str) -> List[PontoCultural]:
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS} FROM pontos WHERE criado_por = ? ORDER BY nome, id", (criado_por,)
+        )
+        return [_ponto(linha) for linha in linhas]
+
+    def contar(self, tipo: Optional[str] = None) -> int:
+        if tipo:
+            return self._consultar("SELECT COUNT(*) FROM pontos WHERE tipo = ?", (tipo,))[0][0]
+        return self._consultar("SELECT COUNT(*) FROM pontos")[0][0]
+
+    def buscar_texto(self, termo: str) -> List[PontoCultural]:
+        termos = tokenizar(termo)
+        if not termos:
+            return []
+        # Cada palavra casa por prefixo e todas precisam aparecer
+        consulta = " ".join(f'"{t}"*' for t in termos)
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS_P} FROM pontos_fts JOIN pontos p ON p.seq = pontos_fts.rowid "
+            "WHERE pontos_fts MATCH ? ORDER BY bm25(pontos_fts, ?, ?, ?), p.nome",
+            (consulta,) + _PESOS_BUSCA
+        )
+        return [_ponto(linha) for linha in linhas]
+
+    def buscar_na_area(self, area: Area) -> List[PontoCultural]:
+        lat_min, lon_min, lat_max, lon_max = area
+        # A R*Tree guarda as coordenadas em precisão simples; a comparação com
+        # as colunas REAL mantém as bordas exatas
+        linhas = self._consultar(
+            f"SELECT {_COLUNAS_P} FROM pontos_rtree r JOIN pontos p ON p.seq = r.seq "
+            "WHERE r.lat_max >= ? AND r.lat_min <= ? AND r.lon_max >= ? AND r.lon_min <= ? "
+            "AND p.latitude BETWEEN ? AND ? AND p.longitude BETWEEN ? AND ?",
+            (lat_min, lat_max, lon_min, lon_max, lat_min, lat_max, lon_min, lon_max)
+        )
+        return [_ponto(linha) for linha in linhas]
+
+    def percorrer(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE) -> Iterator[PontoCultural]:
+        ultimo_id = ""
+        while True:
+            linhas = self._consultar(
+                f"SELECT {_COLUNAS} FROM pontos WHERE id > ? ORDER BY id LIMIT ?", (ultimo_id, tamanho_lote)
+            )
+            for linha in linhas:
+                yield _ponto(linha)
+            if len(linhas) < tamanho_lote:
+                return
+            ultimo_id = linhas[-1][0]
+
+    def recalcular_contadores(self) -> dict:
+        tipos = dict(self._consultar("SELECT tipo, COUNT(*) FROM pontos GROUP BY tipo"))
+        return {"total": sum(tipos.values()), "tipos": tipos}
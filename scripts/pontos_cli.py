@@ -0,0 +1,79 @@
+"""
+Linha de comando para importar, exportar e migrar pontos culturais em lote.
+
+Uso:
+    python -m scripts.pontos_cli importar pontos.csv --criado-por <uid>
+    python -m scripts.pontos_cli exportar pontos.geojson
+    python -m scripts.pontos_cli migrar
+"""
+import argparse
+import sys
+from typing import Iterator, List, Optional, Union
+from firebase.firebase_config import init_firebase
+from services.ponto_service import PontoService
+from services.importacao import FORMATOS, ErroLeitura, detectar_formato, ler_arquivo, escrever_arquivo
+from config import IMPORTACAO_TAMANHO_LOTE
+
+def _com_criador(registros: Iterator[Union[dict, ErroLeitura]], criado_por: Optional[str]) -> Iterator[Union[dict, ErroLeitura]]:
+    for dados in registros:
+        if criado_por and isinstance(dados, dict) and not dados.get("criado_por"):
+            dados["criado_por"] = criado_por
+        yield dados
+
+def importar(args: argparse.Namespace) -> int:
+    formato = args.formato or detectar_formato(args.arquivo)
+    with open(args.arquivo, encoding="utf-8", newline="") as arquivo:
+        registros = _com_criador(ler_arquivo(arquivo, formato), args.criado_por)
+        relatorio = PontoService().importar_lote(registros, tamanho_lote=args.tamanho_lote)
+
+    for posicao, erro in relatorio.erros:
+        print(f"Registro {posicao}: {erro}", file=sys.stderr)
+    print(f"{len(relatorio.importados)} de {relatorio.total} pontos importados.")
+    return 0 if relatorio.sucesso else 1
+
+def exportar(args: argparse.Namespace) -> int:
+    formato = args.formato or detectar_formato(args.arquivo)
+    with open(args.arquivo, "w", encoding="utf-8", newline="") as arquivo:
+        total = escrever_arquivo(PontoService().exportar(tamanho_lote=args.tamanho_lote), arquivo, formato)
+    print(f"{total} pontos exportados para {args.arquivo}.")
+    return 0
+
+def migrar(args: argparse.Namespace) -> int:
+    service = PontoService()
+    total = service.migrar_coordenadas(tamanho_lote=args.tamanho_lote, reiniciar=args.reiniciar)
+    print(f"{total} pontos atualizados para o esquema atual.")
+    # Bases anteriores aos contadores não têm o nó, ou têm contagens parciais
+    contadores = service.recalcular_contadores()
+    print(f"Contadores recalculados: {contadores['total']} pontos.")
+    return 0
+
+def criar_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(description="Importação, exportação e migração de pontos culturais")
+    subparsers = parser.add_subparsers(dest="comando", required=True)
+
+    parser_importar = subparsers.add_parser("importar", help="Importa pontos de um arquivo")
+    parser_importar.add_argument("arquivo")
+    parser_importar.add_argument("--criado-por", help="UID usado nos registros sem criado_por")
+    parser_importar.set_defaults(executar=importar)
+
+    parser_exportar = subparsers.add_parser("exportar", help="Exporta todos os pontos para um arquivo")
+    parser_exportar.add_argument("arquivo")
+    parser_exportar.set_defaults(executar=exportar)
+
+    parser_migrar = subparsers.add_parser("migrar", help="Atualiza registros antigos para o esquema atual")
+    parser_migrar.add_argument("--reiniciar", action="store_true", help="Ignora o progresso salvo de uma execução anterior")
+    parser_migrar.set_defaults(executar=migrar)
+
+    for subparser in (parser_importar, parser_exportar):
+        subparser.add_argument("--formato", choices=FORMATOS, help="Padrão: deduzido pela extensão")
+    for subparser in (parser_importar, parser_exportar, parser_migrar):
+        subparser.add_argument("--tamanho-lote", type=int, default=IMPORTACAO_TAMANHO_LOTE)
+    return parser
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = criar_parser().parse_args(argv)
+    init_firebase()
+    return args.executar(args)
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -3,14 +3,24 @@ Módulo responsável pelos serviços de autenticação.
 """
 import firebase_admin
 from firebase_admin import auth
-from typing import Optional, Dict, Tuple
+from typing import Optional, Dict, Iterable, Tuple
 import logging
-from config import LOG_LEVEL, LOG_FORMAT
+from services.verificador_tokens import VerificadorTokens
+from utils.cache import Cache, AUSENTE
+from utils.metricas import metricas
+from config import LOG_LEVEL, LOG_FORMAT, FIREBASE_CONFIG, USUARIOS_CACHE_TTL
 
 # Configuração de logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Máximo de identificadores aceito por auth.get_users em cada chamada
+LIMITE_GET_USERS = 100
+# Tamanho máximo de um UID do Firebase Authentication
+UID_TAMANHO_MAXIMO = 128
+# Tag do cache de todas as entradas de usuários
+TAG_USUARIOS = "usuarios"
+
 class AuthService:
     """
     Serviço responsável por gerenciar a autenticação de usuários.
@@ -22,6 +32,15 @@ class AuthService:
         """
         if not firebase_admin._apps:
             raise Exception("Firebase não inicializado. Chame init_firebase() primeiro.")
+        # Sem o ID do projeto não há como conferir a audiência localmente; nesse
+        # caso os tokens são verificados pelo Admin SDK
+        projeto = firebase_admin.get_app().project_id or FIREBASE_CONFIG.get("projectId")
+        self.verificador = VerificadorTokens.compartilhado(projeto) if projeto else None
+        self.cache = Cache()
+
+    @staticmethod
+    def _chave_usuario(uid: str) -> str:
+        return f"usuario_{uid}"
 
     def criar_usuario(self, email: str, senha: str) -> Dict:
         """
@@ -42,6 +61,8 @@ class AuthService:
                 email=email,
                 password=senha
             )
+            # Descarta uma eventual consulta anterior sem resultado para o mesmo UID
+            self.cache.invalidate(self._chave_usuario(user.uid))
             logger.info(f"Usuário criado com sucesso: {user.uid}")
             return {
                 "uid": user.uid,
@@ -74,6 +95,10 @@ class AuthService:
         """
         Verifica a validade de um token de autenticação.
         
+        A assinatura é conferida localmente uma única vez por token; as
+        verificações seguintes do mesmo token, até ele expirar, vêm do cache
+        do verificador compartilhado pelo processo.
+        
         Args:
             token (str): Token JWT a ser verificado
             
@@ -84,7 +109,10 @@ class AuthService:
             Exception: Se houver erro ao verificar o token
         """
         try:
-            decoded_token = auth.verify_id_token(token)
+            if self.verificador is not None:
+                decoded_token = self.verificador.verificar(token)
+            else:
+                decoded_token = auth.verify_id_token(token)
             return {
                 "uid": decoded_token["uid"],
                 "email": decoded_token["email"]
@@ -107,15 +135,62 @@ class AuthService:
             Exception: Se houver erro ao obter o usuário
         """
         try:
-            user = auth.get_user(uid)
-            return {
-                "uid": user.uid,
-                "email": user.email
-            }
+            return self.obter_usuarios([uid]).get(uid)
         except Exception as e:
             logger.error(f"Erro ao obter usuário {uid}: {str(e)}")
             return None
 
+    def obter_usuarios(self, uids: Iterable[str]) -> Dict[str, Dict]:
+        """
+        Obtém informações de vários usuários de uma vez.
+        
+        Os usuários que não estão em cache são buscados com auth.get_users, em
+        blocos de até LIMITE_GET_USERS; até esse limite, uma chamada atende
+        todos. Usuários encontrados ficam em cache por USUARIOS_CACHE_TTL
+        segundos e UIDs inexistentes, pelo prazo curto de cache negativo.
+        Valores que não podem ser UIDs (vazios ou que não são texto, como o
+        criado_por de registros antigos) são ignorados, como usuários removidos.
+        
+        Args:
+            uids (Iterable[str]): UIDs dos usuários
+            
+        Returns:
+            Dict[str, Dict]: Informações dos usuários encontrados, indexadas
+                pelo UID; UIDs inexistentes ficam de fora
+            
+        Raises:
+            Exception: Se houver erro ao obter os usuários
+        """
+        try:
+            usuarios: Dict[str, Dict] = {}
+            faltantes = []
+            for uid in dict.fromkeys(uids):
+                # auth.UidIdentifier recusaria o bloco inteiro
+                if not isinstance(uid, str) or not uid or len(uid) > UID_TAMANHO_MAXIMO:
+                    continue
+                usuario = self.cache.get(self._chave_usuario(uid), AUSENTE)
+                if usuario is AUSENTE:
+                    faltantes.append(uid)
+                elif usuario is not None:
+                    usuarios[uid] = usuario
+
+            for inicio in range(0, len(faltantes), LIMITE_GET_USERS):
+                bloco = faltantes[inicio:inicio + LIMITE_GET_USERS]
+                with metricas.cronometrar("firebase", operacao="auth_get_users"):
+                    resultado = auth.get_users([auth.UidIdentifier(uid) for uid in bloco])
+                encontrados = {user.uid: {"uid": user.uid, "email": user.email} for user in resultado.users}
+                for uid in bloco:
+                    usuario = encontrados.get(uid)
+                    if usuario is not None:
+                        usuarios[uid] = usuario
+                        self.cache.set(self._chave_usuario(uid), usuario, tags=[TAG_USUARIOS], ttl=USUARIOS_CACHE_TTL)
+                    else:
+                        self.cache.set(self._chave_usuario(uid), None, tags=[TAG_USUARIOS], negativo=True)
+            return usuarios
+        except Exception as e:
+            logger.error(f"Erro ao obter usuários: {str(e)}")
+            raise
+
     def excluir_usuario(self, uid: str) -> None:
         """
         Exclui um usuário do Firebase Authentication.
@@ -128,6 +203,7 @@ class AuthService:
         """
         try:
             auth.delete_user(uid)
+            self.cache.invalidate(self._chave_usuario(uid))
             logger.info(f"Usuário excluído com sucesso: {uid}")
         except Exception as e:
             logger.error(f"Erro ao excluir usuário {uid}: {str(e)}")
@@ -0,0 +1,118 @@
+"""
+Módulo responsável pelos objetos compartilhados por todas as sessões do processo.
+"""
+import logging
+import threading
+import time
+from typing import Any, Callable, Dict
+from config import LOG_LEVEL, LOG_FORMAT, FIREBASE_CONFIG, REPOSITORIO_PONTOS
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+class Servicos:
+    """
+    Contêiner dos serviços da aplicação, criado uma vez por processo.
+
+    As páginas do Streamlit são reexecutadas a cada interação; em vez de
+    inicializar o Firebase e construir os serviços a cada execução, elas obtêm
+    os objetos daqui. Cada objeto é criado na primeira vez em que é pedido,
+    sob lock, de modo que sessões concorrentes nunca o criam duas vezes, e o
+    tempo de cada inicialização fica registrado em `tempos`. Os objetos que
+    dependem do Admin SDK garantem antes o app do Firebase inicializado.
+
+    Uso:
+        servicos = Servicos.compartilhado()
+        pontos = servicos.ponto_service.listar_recentes(5)
+    """
+
+    _compartilhado = None
+    _lock_compartilhado = threading.Lock()
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._objetos: Dict[str, Any] = {}
+        self.tempos: Dict[str, float] = {}
+
+    @classmethod
+    def compartilhado(cls) -> 'Servicos':
+        """
+        Retorna o contêiner único do processo.
+        """
+        with cls._lock_compartilhado:
+            if cls._compartilhado is None:
+                cls._compartilhado = cls()
+            return cls._compartilhado
+
+    def _obter(self, nome: str, criar: Callable[[], Any]) -> Any:
+        """
+        Retorna o objeto `nome`, criando-o na primeira chamada.
+        """
+        objeto = self._objetos.get(nome)
+        if objeto is not None:
+            return objeto
+        with self._lock:
+            if nome not in self._objetos:
+                inicio = time.perf_counter()
+                self._objetos[nome] = criar()
+                # Inclui o tempo das dependências criadas durante a inicialização
+                self.tempos[nome] = time.perf_counter() - inicio
+                logger.info(f"{nome} inicializado em {self.tempos[nome] * 1000:.1f} ms")
+            return self._objetos[nome]
+
+    @property
+    def firebase_app(self):
+        """
+        App do Firebase Admin SDK.
+        """
+        from firebase.firebase_config import init_firebase
+        return self._obter("firebase_app", init_firebase)
+
+    @property
+    def referencia_pontos(self):
+        """
+        Referência do nó "pontos" no Realtime Database.
+        """
+        def criar():
+            from firebase_admin import db
+            self.firebase_app
+            return db.reference('pontos')
+        return self._obter("referencia_pontos", criar)
+
+    @property
+    def auth_cliente(self):
+        """
+        Cliente de autenticação do pyrebase, usado no login com email e senha.
+        """
+        def criar():
+            import pyrebase
+            return pyrebase.initialize_app(FIREBASE_CONFIG).auth()
+        return self._obter("auth_cliente", criar)
+
+    @property
+    def ponto_service(self):
+        """
+        Serviço de pontos culturais; com o Realtime Database, atendido pelo
+        índice em memória compartilhado.
+        """
+        def criar():
+            from services.ponto_service import PontoService
+            self.firebase_app
+            if REPOSITORIO_PONTOS != "firebase":
+                # O SQLite local já tem seus próprios índices
+                return PontoService()
+            from services.ponto_index import PontoIndex
+            return PontoService(indice=PontoIndex.compartilhado(ref=self.referencia_pontos))
+        return self._obter("ponto_service", criar)
+
+    @property
+    def auth_service(self):
+        """
+        Serviço de administração de usuários e verificação de tokens.
+        """
+        def criar():
+            from services.auth_service import AuthService
+            self.firebase_app
+            return AuthService()
+        return self._obter("auth_service", criar)
@@ -0,0 +1,194 @@
+"""
+Módulo responsável pela leitura e escrita de pontos culturais em arquivos
+CSV, JSON Lines e GeoJSON, sempre registro a registro.
+
+Um registro que não pode ser lido (linha JSON malformada, feature que não é
+um ponto) é produzido como ErroLeitura na sua posição, para que a importação
+o relate e continue com os demais.
+"""
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, TextIO, Tuple, Union
+from models.ponto_cultural import PontoCultural
+
+FORMATOS = ("csv", "jsonl", "geojson")
+CAMPOS_CSV = ["id", "nome", "descricao", "tipo", "latitude", "longitude", "criado_por", "criado_em"]
+_EXTENSOES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".geojson": "geojson", ".json": "geojson"}
+
+@dataclass
+class RelatorioImportacao:
+    """
+    Resultado de uma importação em lote.
+    """
+    total: int = 0
+    importados: List[str] = field(default_factory=list)
+    erros: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def sucesso(self) -> bool:
+        return not self.erros
+
+@dataclass
+class ErroLeitura:
+    """
+    Registro do arquivo que não pôde ser lido, com o motivo.
+    """
+    mensagem: str
+
+def detectar_formato(caminho: str) -> str:
+    """
+    Deduz o formato do arquivo pela extensão.
+
+    Raises:
+        ValueError: Se a extensão não for reconhecida
+    """
+    extensao = os.path.splitext(caminho)[1].lower()
+    if extensao not in _EXTENSOES:
+        raise ValueError(f"Formato não reconhecido para {caminho}. Use um dos seguintes: {', '.join(FORMATOS)}")
+    return _EXTENSOES[extensao]
+
+def ler_csv(arquivo: TextIO) -> Iterator[dict]:
+    """
+    Lê pontos de um CSV com cabeçalho (nome, descricao, tipo, latitude, longitude, criado_por).
+    """
+    for linha in csv.DictReader(arquivo):
+        yield {campo: valor for campo, valor in linha.items() if campo and valor not in (None, "")}
+
+def ler_jsonl(arquivo: TextIO) -> Iterator[Union[dict, ErroLeitura]]:
+    """
+    Lê pontos de um arquivo JSON Lines (um objeto por linha). Linhas com JSON
+    inválido são produzidas como ErroLeitura.
+    """
+    for numero, linha in enumerate(arquivo, start=1):
+        linha = linha.strip()
+        if not linha:
+            continue
+        try:
+            yield json.loads(linha)
+        except json.JSONDecodeError as e:
+            yield ErroLeitura(f"JSON inválido na linha {numero}: {e.msg}")
+
+def ler_geojson(arquivo: TextIO, tamanho_bloco: int = 65536) -> Iterator[Union[dict, ErroLeitura]]:
+    """
+    Lê as features de uma FeatureCollection GeoJSON. Features que não são do
+    tipo Point são produzidas como ErroLeitura.
+
+    O arquivo é lido em blocos e cada feature é decodificada assim que termina,
+    sem carregar a coleção inteira em memória.
+
+    Raises:
+        ValueError: Se o arquivo não tiver a lista "features" ou estiver truncado
+    """
+    decodificador = json.JSONDecoder()
+    buffer = ""
+    posicao = -1
+    fim_arquivo = False
+
+    def ler_mais() -> bool:
+        nonlocal buffer, fim_arquivo
+        bloco = arquivo.read(tamanho_bloco)
+        fim_arquivo = not bloco
+        buffer += bloco
+        return not fim_arquivo
+
+    # Avança até o início do array "features"
+    while posicao < 0:
+        chave = buffer.find('"features"')
+        if chave >= 0:
+            colchete = buffer.find("[", chave)
+            if colchete >= 0:
+                posicao = colchete + 1
+                break
+        if not ler_mais():
+            raise ValueError("Arquivo GeoJSON sem a lista \"features\"")
+
+    while True:
+        while posicao < len(buffer) and buffer[posicao] in " \t\r\n,":
+            posicao += 1
+        if posicao < len(buffer) and buffer[posicao] == "]":
+            return
+        try:
+            feature, fim = decodificador.raw_decode(buffer, posicao)
+        except json.JSONDecodeError:
+            if fim_arquivo or not ler_mais():
+                raise ValueError("Arquivo GeoJSON incompleto ou inválido")
+            continue
+        buffer = buffer[fim:]
+        posicao = 0
+        yield _de_feature(feature)
+
+def _de_feature(feature: dict) -> Union[dict, ErroLeitura]:
+    if not isinstance(feature, dict):
+        return ErroLeitura("Feature deve ser um objeto")
+    geometria = feature.get("geometry") or {}
+    if not isinstance(geometria, dict):
+        return ErroLeitura("Geometria deve ser um objeto")
+    if geometria.get("type") != "Point":
+        return ErroLeitura(f"Geometria {geometria.get('type')} não suportada; apenas Point")
+    coordenadas = geometria.get("coordinates")
+    if not isinstance(coordenadas, (list, tuple)) or len(coordenadas) < 2:
+        return ErroLeitura("Point deve ter longitude e latitude")
+    longitude, latitude = coordenadas[:2]
+    propriedades = feature.get("properties") or {}
+    if not isinstance(propriedades, dict):
+        return ErroLeitura("Propriedades da feature devem ser um objeto")
+    dados = dict(propriedades)
+    dados["latitude"] = latitude
+    dados["longitude"] = longitude
+    if feature.get("id") is not None:
+        dados.setdefault("id", feature["id"])
+    return dados
+
+def ler_arquivo(arquivo: TextIO, formato: str) -> Iterator[Union[dict, ErroLeitura]]:
+    """
+    Lê pontos do arquivo no formato informado ("csv", "jsonl" ou "geojson").
+    """
+    leitores = {"csv": ler_csv, "jsonl": ler_jsonl, "geojson": ler_geojson}
+    if formato not in leitores:
+        raise ValueError(f"Formato inválido. Deve ser um dos seguintes: {', '.join(FORMATOS)}")
+    return leitores[formato](arquivo)
+
+def _para_dict(ponto: PontoCultural) -> Dict:
+    return {"id": ponto.id, **ponto.to_dict()}
+
+def escrever_arquivo(pontos: Iterable[PontoCultural], arquivo: TextIO, formato: str) -> int:
+    """
+    Escreve os pontos no arquivo à medida que são produzidos.
+
+    Returns:
+        int: Quantidade de pontos escritos
+    """
+    total = 0
+    if formato == "csv":
+        escritor = csv.DictWriter(arquivo, fieldnames=CAMPOS_CSV, extrasaction="ignore")
+        escritor.writeheader()
+        for ponto in pontos:
+            escritor.writerow(_para_dict(ponto))
+            total += 1
+    elif formato == "jsonl":
+        for ponto in pontos:
+            arquivo.write(json.dumps(_para_dict(ponto), ensure_ascii=False) + "\n")
+            total += 1
+    elif formato == "geojson":
+        arquivo.write('{"type": "FeatureCollection", "features": [\n')
+        for ponto in pontos:
+            feature = {
+                "type": "Feature",
+                "id": ponto.id,
+                "geometry": {"type": "Point", "coordinates": [ponto.longitude, ponto.latitude]},
+                "properties": {
+                    "nome": ponto.nome,
+                    "descricao": ponto.descricao,
+                    "tipo": ponto.tipo,
+                    "criado_por": ponto.criado_por,
+                    "criado_em": ponto.criado_em
+                }
+            }
+            arquivo.write((",\n" if total else "") + json.dumps(feature, ensure_ascii=False))
+            total += 1
+        arquivo.write("\n]}\n")
+    else:
+        raise ValueError(f"Formato inválido. Deve ser um dos seguintes: {', '.join(FORMATOS)}")
+    return total
@@ -0,0 +1,415 @@
+"""
+Módulo responsável pelo índice em memória dos pontos culturais.
+"""
+from firebase_admin import db
+import bisect
+import json
+import os
+import threading
+import time
+import logging
+from typing import Dict, Optional, List, Tuple
+from models.ponto_cultural import PontoCultural
+from utils.indice_textual import IndiceTextual
+from utils.indice_espacial import IndiceEspacial, Area
+from config import (
+    LOG_LEVEL, LOG_FORMAT, INDICE_TEMPO_CARGA,
+    INDICE_SNAPSHOT_CAMINHO, INDICE_SNAPSHOT_INTERVALO
+)
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+class PontoIndex:
+    """
+    Cópia materializada do nó "pontos" mantida em memória.
+
+    O nó é baixado uma única vez (no primeiro evento de db.Reference.listen) e,
+    a partir daí, os eventos put/patch são aplicados incrementalmente. O índice
+    mantém visões pré-ordenadas por nome, geral, por tipo e por criador, e por
+    data de criação, para que listagens e filtros sejam atendidos sem acessar o
+    Firebase. Um índice invertido dos campos textuais atende as buscas e uma
+    grade espacial atende as consultas por área e por raio.
+
+    Com `caminho_snapshot`, o conteúdo do índice é gravado num arquivo local a
+    cada alteração (agrupadas por INDICE_SNAPSHOT_INTERVALO segundos). Ao
+    iniciar, o índice passa a responder com essa cópia imediatamente e a carga
+    completa do Firebase chega em segundo plano, substituindo-a.
+    """
+
+    _compartilhado = None
+    _lock_compartilhado = threading.Lock()
+
+    def __init__(self, ref=None, caminho_snapshot: Optional[str] = None,
+                 intervalo_snapshot: float = INDICE_SNAPSHOT_INTERVALO):
+        """
+        Inicializa o índice vazio.
+
+        Args:
+            ref: Referência do nó de pontos (padrão: db.reference('pontos'))
+            caminho_snapshot (Optional[str]): Arquivo da cópia local; None desativa
+            intervalo_snapshot (float): Atraso para agrupar alterações antes de
+                regravar a cópia, em segundos
+        """
+        self.ref = ref if ref is not None else db.reference('pontos')
+        self.caminho_snapshot = caminho_snapshot
+        self.intervalo_snapshot = intervalo_snapshot
+        self.versao = 0
+        self._lock = threading.RLock()
+        self._pronto = threading.Event()
+        self._sincronizado = threading.Event()
+        self._listener = None
+        self._gravacao: Optional[threading.Timer] = None
+        self._registros: Dict[str, dict] = {}
+        self._pontos: Dict[str, PontoCultural] = {}
+        self._por_nome: List[Tuple[str, str]] = []
+        self._por_tipo: Dict[str, List[Tuple[str, str]]] = {}
+        self._por_criacao: List[Tuple[float, str]] = []
+        self._por_criador: Dict[str, List[Tuple[str, str]]] = {}
+        self.textual = IndiceTextual()
+        self.espacial = IndiceEspacial()
+
+    @classmethod
+    def compartilhado(cls, ref=None) -> 'PontoIndex':
+        """
+        Retorna o índice único do processo, iniciando-o na primeira chamada.
+
+        Args:
+            ref: Referência do nó de pontos usada na criação (padrão: db.reference('pontos'))
+
+        Returns:
+            PontoIndex: Índice compartilhado entre as sessões
+        """
+        with cls._lock_compartilhado:
+            if cls._compartilhado is None:
+                indice = cls(ref=ref, caminho_snapshot=INDICE_SNAPSHOT_CAMINHO or None)
+                indice.iniciar()
+                cls._compartilhado = indice
+            return cls._compartilhado
+
+    def iniciar(self, timeout: float = INDICE_TEMPO_CARGA) -> None:
+        """
+        Registra o listener e aguarda a carga inicial do nó.
+
+        Se existir uma cópia local, o índice fica pronto com ela e a carga do
+        Firebase não é aguardada: ela substitui a cópia quando chegar.
+
+        Args:
+            timeout (float): Tempo máximo de espera pela carga inicial, em segundos
+
+        Raises:
+            TimeoutError: Se a carga inicial não chegar dentro do prazo
+        """
+        if self._carregar_snapshot():
+            self._listener = self.ref.listen(self._on_evento)
+            return
+        self._listener = self.ref.listen(self._on_evento)
+        if not self._pronto.wait(timeout):
+            self.parar()
+            raise TimeoutError("Tempo esgotado ao carregar o índice de pontos culturais")
+        logger.info(f"Índice de pontos culturais carregado: {len(self)} pontos")
+
+    def parar(self) -> None:
+        """
+        Encerra o listener de alterações e grava a cópia local pendente.
+        """
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        with self._lock:
+            pendente = self._gravacao is not None
+            if pendente:
+                self._gravacao.cancel()
+                self._gravacao = None
+        if pendente:
+            self.salvar_snapshot()
+
+    @property
+    def pronto(self) -> bool:
+        return self._pronto.is_set()
+
+    @property
+    def sincronizado(self) -> bool:
+        """
+        Indica se a carga completa do Firebase já foi recebida.
+        """
+        return self._sincronizado.is_set()
+
+    def _carregar_snapshot(self) -> bool:
+        """
+        Preenche o índice com a cópia local, se houver uma válida.
+        """
+        if not self.caminho_snapshot or not os.path.exists(self.caminho_snapshot):
+            return False
+        try:
+            with open(self.caminho_snapshot, "rb") as arquivo:
+                snapshot = json.loads(arquivo.read())
+            marcador = snapshot["marcador"]
+            with self._lock:
+                self._substituir(snapshot["pontos"])
+            self._pronto.set()
+            logger.info(
+                f"Índice de pontos culturais carregado da cópia local: {len(self)} pontos "
+                f"(versão {marcador.get('versao')}, salva em {time.ctime(marcador.get('salvo_em', 0))}); "
+                f"sincronizando com o Firebase em segundo plano"
+            )
+            return True
+        except Exception as e:
+            logger.warning(f"Cópia local do índice ignorada: {str(e)}")
+            return False
+
+    def salvar_snapshot(self) -> None:
+        """
+        Grava o conteúdo atual do índice na cópia local.
+
+        O arquivo é escrito ao lado do destino e renomeado, de modo que uma
+        leitura concorrente ou uma interrupção nunca encontra um arquivo parcial.
+        """
+        if not self.caminho_snapshot:
+            return
+        with self._lock:
+            self._gravacao = None
+            pontos = dict(self._registros)
+            marcador = {"versao": self.versao, "salvo_em": time.time(), "sincronizado": self.sincronizado}
+        try:
+            diretorio = os.path.dirname(self.caminho_snapshot)
+            if diretorio:
+                os.makedirs(diretorio, exist_ok=True)
+            temporario = f"{self.caminho_snapshot}.tmp"
+            with open(temporario, "w", encoding="utf-8") as arquivo:
+                json.dump({"marcador": marcador, "pontos": pontos}, arquivo, ensure_ascii=False, separators=(",", ":"))
+            os.replace(temporario, self.caminho_snapshot)
+        except Exception as e:
+            logger.error(f"Erro ao salvar a cópia local do índice: {str(e)}")
+
+    def _agendar_snapshot(self) -> None:
+        """
+        Agenda a gravação da cópia local, agrupando alterações próximas. Deve
+        ser chamado com o lock adquirido.
+        """
+        if not self.caminho_snapshot or self._gravacao is not None:
+            return
+        self._gravacao = threading.Timer(self.intervalo_snapshot, self.salvar_snapshot)
+        self._gravacao.daemon = True
+        self._gravacao.start()
+
+    def __len__(self) -> int:
+        return len(self._registros)
+
+    def _on_evento(self, evento) -> None:
+        """
+        Aplica um evento put/patch recebido do Realtime Database.
+        """
+        try:
+            segmentos = [s for s in (evento.path or "/").split("/") if s]
+            with self._lock:
+                if evento.event_type == "put":
+                    self._aplicar_caminho(segmentos, evento.data)
+                elif evento.event_type == "patch":
+                    for caminho, valor in (evento.data or {}).items():
+                        self._aplicar_caminho(segmentos + [s for s in caminho.split("/") if s], valor)
+                self._agendar_snapshot()
+            if not segmentos:
+                self._sincronizado.set()
+                self._pronto.set()
+        except Exception as e:
+            logger.error(f"Erro ao aplicar evento no índice de pontos: {str(e)}")
+
+    def _aplicar_caminho(self, segmentos: List[str], valor) -> None:
+        if not segmentos:
+            self._substituir(valor or {})
+            return
+
+        id_ponto = segmentos[0]
+        if len(segmentos) == 1:
+            self.aplicar(id_ponto, valor)
+            return
+
+        # Alteração de um campo isolado de um ponto
+        registro = dict(self._registros.get(id_ponto, {}))
+        alvo = registro
+        for segmento in segmentos[1:-1]:
+            alvo = alvo.setdefault(segmento, {})
+        if valor is None:
+            alvo.pop(segmentos[-1], None)
+        else:
+            alvo[segmentos[-1]] = valor
+        self.aplicar(id_ponto, registro)
+
+    def _substituir(self, dados: dict) -> None:
+        self._registros = {}
+        self._pontos = {}
+        self.textual.limpar()
+        self.espacial.limpar()
+        for id_ponto, registro in dados.items():
+            ponto = self._construir(id_ponto, registro)
+            if ponto is not None:
+                self._registros[id_ponto] = registro
+                self._pontos[id_ponto] = ponto
+                self.textual.adicionar(id_ponto, self._campos_textuais(ponto))
+                self.espacial.adicionar(id_ponto, ponto.latitude, ponto.longitude)
+        self._por_nome = sorted((p.nome, p.id) for p in self._pontos.values())
+        self._por_tipo = {}
+        for chave in self._por_nome:
+            self._por_tipo.setdefault(self._pontos[chave[1]].tipo, []).append(chave)
+        self._por_criador = {}
+        for chave in self._por_nome:
+            self._por_criador.setdefault(self._pontos[chave[1]].criado_por, []).append(chave)
+        self._por_criacao = sorted((p.criado_em, p.id) for p in self._pontos.values() if p.criado_em is not None)
+        self.versao += 1
+
+    @staticmethod
+    def _campos_textuais(ponto: PontoCultural) -> Dict[str, str]:
+        return {"nome": ponto.nome, "descricao": ponto.descricao, "tipo": ponto.tipo}
+
+    @staticmethod
+    def _construir(id_ponto: str, registro) -> Optional[PontoCultural]:
+        if not isinstance(registro, dict):
+            return None
+        try:
+            return PontoCultural.from_dict(registro, id_ponto)
+        except ValueError as e:
+            logger.warning(f"Ponto cultural {id_ponto} ignorado pelo índice: {str(e)}")
+            return None
+
+    def aplicar(self, id_ponto: str, registro: Optional[dict]) -> None:
+        """
+        Insere, atualiza ou remove (registro None) um ponto do índice.
+
+        Args:
+            id_ponto (str): ID do ponto
+            registro (Optional[dict]): Registro persistido do ponto ou None
+        """
+        with self._lock:
+            anterior = self._pontos.pop(id_ponto, None)
+            self._registros.pop(id_ponto, None)
+            if anterior is not None:
+                chave = (anterior.nome, anterior.id)
+                self._remover_ordenado(self._por_nome, chave)
+                self._remover_ordenado(self._por_tipo.get(anterior.tipo, []), chave)
+                self._remover_ordenado(self._por_criador.get(anterior.criado_por, []), chave)
+                if anterior.criado_em is not None:
+                    self._remover_ordenado(self._por_criacao, (anterior.criado_em, anterior.id))
+                self.textual.remover(id_ponto)
+                self.espacial.remover(id_ponto)
+
+            ponto = self._construir(id_ponto, registro) if registro is not None else None
+            if ponto is not None:
+                chave = (ponto.nome, ponto.id)
+                self._registros[id_ponto] = registro
+                self._pontos[id_ponto] = ponto
+                bisect.insort(self._por_nome, chave)
+                bisect.insort(self._por_tipo.setdefault(ponto.tipo, []), chave)
+                bisect.insort(self._por_criador.setdefault(ponto.criado_por, []), chave)
+                if ponto.criado_em is not None:
+                    bisect.insort(self._por_criacao, (ponto.criado_em, ponto.id))
+                self.textual.adicionar(id_ponto, self._campos_textuais(ponto))
+                self.espacial.adicionar(id_ponto, ponto.latitude, ponto.longitude)
+            self.versao += 1
+            self._agendar_snapshot()
+
+    @staticmethod
+    def _remover_ordenado(lista: List[Tuple[str, str]], chave: Tuple[str, str]) -> None:
+        posicao = bisect.bisect_left(lista, chave)
+        if posicao < len(lista) and lista[posicao] == chave:
+            del lista[posicao]
+
+    def obter(self, id_ponto: str) -> Optional[PontoCultural]:
+        """
+        Retorna o ponto com o ID informado, se existir.
+        """
+        return self._pontos.get(id_ponto)
+
+    def total(self, tipo: Optional[str] = None) -> int:
+        """
+        Retorna a quantidade de pontos, no total ou de um tipo.
+        """
+        if tipo:
+            return len(self._por_tipo.get(tipo, ()))
+        return len(self._por_nome)
+
+    def todos(self) -> List[PontoCultural]:
+        """
+        Retorna todos os pontos ordenados por nome.
+        """
+        with self._lock:
+            return [self._pontos[id_ponto] for _, id_ponto in self._por_nome]
+
+    def fatia(self, inicio: int, fim: int, tipo: Optional[str] = None) -> List[PontoCultural]:
+        """
+        Retorna os pontos nas posições [inicio, fim) da ordenação por nome.
+
+        Args:
+            inicio (int): Posição inicial
+            fim (int): Posição final (exclusiva)
+            tipo (Optional[str]): Tipo de ponto para filtrar
+        """
+        with self._lock:
+            ordenados = self._por_tipo.get(tipo, []) if tipo else self._por_nome
+            return [self._pontos[id_ponto] for _, id_ponto in ordenados[inicio:fim]]
+
+    def listar_por_criador(self, criado_por: str) -> List[PontoCultural]:
+        """
+        Retorna os pontos cadastrados pelo usuário, ordenados por nome.
+        """
+        with self._lock:
+            return [self._pontos[id_ponto] for _, id_ponto in self._por_criador.get(criado_por, [])]
+
+    def listar_recentes(self, quantidade: int) -> List[PontoCultural]:
+        """
+        Retorna os pontos cadastrados mais recentemente, do mais novo ao mais antigo.
+        """
+        with self._lock:
+            ultimos = self._por_criacao[-quantidade:] if quantidade > 0 else []
+            return [self._pontos[id_ponto] for _, id_ponto in reversed(ultimos)]
+
+    def apos(self, chave: Optional[Tuple[str, str]], limite: int, tipo: Optional[str] = None) -> Tuple[List[PontoCultural], bool]:
+        """
+        Retorna até `limite` pontos posteriores à chave (nome, id) informada.
+
+        Args:
+            chave (Optional[Tuple[str, str]]): Último (nome, id) já exibido
+            limite (int): Quantidade de pontos
+            tipo (Optional[str]): Tipo de ponto para filtrar
+
+        Returns:
+            Tuple[List[PontoCultural], bool]: Pontos e se existem mais pontos depois deles
+        """
+        with self._lock:
+            ordenados = self._por_tipo.get(tipo, []) if tipo else self._por_nome
+            inicio = bisect.bisect_right(ordenados, chave) if chave else 0
+            fatia = ordenados[inicio:inicio + limite]
+            return [self._pontos[id_ponto] for _, id_ponto in fatia], inicio + limite < len(ordenados)
+
+    def buscar_texto(self, termo: str) -> List[PontoCultural]:
+        """
+        Busca pontos pelo índice invertido, em ordem de relevância.
+
+        Args:
+            termo (str): Texto digitado pelo usuário; cada palavra casa por prefixo,
+                sem diferenciar acentos ou maiúsculas
+
+        Returns:
+            List[PontoCultural]: Pontos encontrados, os mais relevantes primeiro
+        """
+        with self._lock:
+            resultados = self.textual.buscar(termo)
+            pontos = [(pontuacao, self._pontos[id_ponto]) for id_ponto, pontuacao in resultados]
+        pontos.sort(key=lambda item: (-item[0], item[1].nome))
+        return [ponto for _, ponto in pontos]
+
+    def buscar_na_area(self, area: Area) -> List[PontoCultural]:
+        """
+        Retorna os pontos dentro da área (lat_min, lon_min, lat_max, lon_max).
+        """
+        with self._lock:
+            return [self._pontos[id_ponto] for id_ponto in self.espacial.buscar_na_area(area)]
+
+    def buscar_proximos(self, lat: float, lon: float, raio_km: float) -> List[Tuple[PontoCultural, float]]:
+        """
+        Retorna os pontos a até `raio_km` da coordenada, com suas distâncias em km,
+        do mais próximo ao mais distante.
+        """
+        with self._lock:
+            return [(self._pontos[id_ponto], distancia) for id_ponto, distancia in self.espacial.buscar_proximos(lat, lon, raio_km)]
@@ -1,29 +1,62 @@
 """
 Módulo responsável pelos serviços relacionados aos pontos culturais.
 """
-from firebase_admin import db
+import base64
+import json
+import time
 import uuid
 import logging
-from typing import Dict, Optional, List, Tuple
+from typing import Dict, Optional, List, Tuple, Iterable, Iterator, Union
 from models.ponto_cultural import PontoCultural
+from models.ponto_colecao import PontoColecao, validar_lote
+from repositorios import RepositorioPontos, criar_repositorio
+from services.ponto_index import PontoIndex
+from services.importacao import ErroLeitura, RelatorioImportacao
 from utils.cache import Cache
-from config import PAGINACAO_LIMITE, LOG_LEVEL, LOG_FORMAT
+from utils.indice_espacial import Area
+from utils.metricas import medir
+from utils.paralelo import executar_em_paralelo
+from config import PAGINACAO_LIMITE, LOG_LEVEL, LOG_FORMAT, IMPORTACAO_TAMANHO_LOTE
 
 # Configuração de logging
 logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
+# Tag do cache que agrupa os resultados de listagens e buscas
+TAG_LISTAGEM = "listagem"
+
+def _quantidade_pagina(resultado: Tuple[List[PontoCultural], object]) -> int:
+    """
+    Quantidade de pontos de uma página (pontos, total de páginas ou cursor).
+    """
+    return len(resultado[0])
+
 class PontoService:
     """
-    Serviço responsável por gerenciar os pontos culturais no Firebase.
+    Serviço responsável por gerenciar os pontos culturais.
     """
     
-    def __init__(self):
+    def __init__(self, indice: Optional[PontoIndex] = None, repositorio: Optional[RepositorioPontos] = None):
         """
-        Inicializa o serviço com a referência do banco de dados e cache.
+        Inicializa o serviço com o repositório de pontos e o cache.
+        
+        Args:
+            indice (Optional[PontoIndex]): Índice em memória usado para atender as
+                leituras; sem ele, as leituras consultam o repositório
+            repositorio (Optional[RepositorioPontos]): Armazenamento dos pontos
+                (padrão: o configurado em REPOSITORIO_PONTOS)
         """
-        self.ref = db.reference('pontos')
+        self.repositorio = repositorio if repositorio is not None else criar_repositorio()
         self.cache = Cache()
+        self.indice = indice
+
+    @property
+    def versao(self) -> int:
+        """
+        Versão dos dados vista pelo índice em memória (0 sem índice), usada em
+        chaves de cache de dados derivados de todos os pontos.
+        """
+        return self.indice.versao if self.indice is not None else 0
 
     def _get_cache_key(self, prefix: str, **kwargs) -> str:
         """
@@ -39,6 +72,45 @@ class PontoService:
         params = '_'.join(f"{k}={v}" for k, v in sorted(kwargs.items()))
         return f"{prefix}_{params}"
 
+    @staticmethod
+    def _tag_ponto(id_ponto: str) -> str:
+        """
+        Tag do cache associada às entradas de um único ponto.
+        """
+        return f"ponto:{id_ponto}"
+
+    @staticmethod
+    def _pagina_vazia(resultado: Tuple[List[PontoCultural], object]) -> bool:
+        """
+        Indica se uma página (pontos, metadados) não trouxe nenhum ponto.
+        """
+        return not resultado[0]
+
+    @staticmethod
+    def _codificar_cursor(nome: str, id_ponto: str) -> str:
+        """
+        Gera o cursor opaco que aponta para o último ponto de uma página.
+        """
+        bruto = json.dumps([nome, id_ponto], ensure_ascii=False).encode("utf-8")
+        return base64.urlsafe_b64encode(bruto).decode("ascii")
+
+    @staticmethod
+    def _decodificar_cursor(cursor: str) -> Tuple[str, str]:
+        """
+        Recupera o par (nome, id) de um cursor gerado por _codificar_cursor.
+        
+        Raises:
+            ValueError: Se o cursor for inválido
+        """
+        try:
+            nome, id_ponto = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        except (ValueError, TypeError):
+            raise ValueError("Cursor de paginação inválido")
+        if not isinstance(nome, str) or not isinstance(id_ponto, str):
+            raise ValueError("Cursor de paginação inválido")
+        return nome, id_ponto
+
+    @medir("ponto_service")
     def cadastrar_ponto(self, dados: dict) -> str:
         """
         Cadastra um novo ponto cultural.
@@ -55,12 +127,17 @@ class PontoService:
         try:
             ponto = PontoCultural.from_dict(dados)
             ponto.validar()
+            ponto.criado_em = time.time()
             
             id_ponto = str(uuid.uuid4())
-            self.ref.child(id_ponto).set(ponto.to_dict())
+            registro = ponto.to_dict()
+            self.repositorio.inserir({id_ponto: registro})
             
-            # Invalida cache após cadastro
-            self.cache.clear()
+            if self.indice is not None:
+                self.indice.aplicar(id_ponto, registro)
+            else:
+                # Invalida apenas as listagens; pontos já em cache não mudam
+                self.cache.invalidate_tag(TAG_LISTAGEM)
             
             logger.info(f"Ponto cultural cadastrado com sucesso: {id_ponto}")
             return id_ponto
@@ -69,6 +146,107 @@ class PontoService:
             logger.error(f"Erro ao cadastrar ponto cultural: {str(e)}")
             raise
 
+    @medir("ponto_service", quantidade=lambda relatorio: len(relatorio.importados))
+    def importar_lote(self, registros: Iterable[Union[dict, ErroLeitura]], tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE) -> RelatorioImportacao:
+        """
+        Importa pontos culturais em lote.
+        
+        Os registros são consumidos em blocos de `tamanho_lote`; cada bloco é
+        montado como uma PontoColecao, validado de uma vez com validar_lote e
+        seus pontos válidos são gravados numa única escrita multi-caminho, junto
+        com as contagens. Registros inválidos, inclusive os que o leitor do
+        arquivo não conseguiu ler (ErroLeitura), não interrompem a importação e
+        são listados no relatório com sua posição (a partir de 1). Cada ponto
+        importado recebe um novo ID.
+        
+        Args:
+            registros (Iterable[Union[dict, ErroLeitura]]): Dados dos pontos, no
+                formato de cadastrar_ponto
+            tamanho_lote (int): Quantidade de pontos por escrita
+            
+        Returns:
+            RelatorioImportacao: Total lido, IDs importados e erros por registro
+            
+        Raises:
+            Exception: Se houver erro ao gravar um lote
+        """
+        relatorio = RelatorioImportacao()
+        pendentes: List[Tuple[int, dict]] = []
+        try:
+            for posicao, dados in enumerate(registros, start=1):
+                relatorio.total = posicao
+                if isinstance(dados, ErroLeitura):
+                    relatorio.erros.append((posicao, dados.mensagem))
+                    continue
+                if not isinstance(dados, dict):
+                    relatorio.erros.append((posicao, "Registro deve ser um objeto"))
+                    continue
+                pendentes.append((posicao, dados))
+                if len(pendentes) >= tamanho_lote:
+                    self._importar_bloco(pendentes, relatorio)
+                    pendentes = []
+            if pendentes:
+                self._importar_bloco(pendentes, relatorio)
+            relatorio.erros.sort(key=lambda erro: erro[0])
+
+            logger.info(
+                f"Importação concluída: {len(relatorio.importados)} de {relatorio.total} pontos importados, "
+                f"{len(relatorio.erros)} com erro"
+            )
+            return relatorio
+        except Exception as e:
+            logger.error(f"Erro ao importar lote de pontos culturais após {len(relatorio.importados)} pontos: {str(e)}")
+            raise
+
+    def _importar_bloco(self, pendentes: List[Tuple[int, dict]], relatorio: RelatorioImportacao) -> None:
+        """
+        Valida um bloco de registros e grava os válidos.
+        """
+        colecao = PontoColecao.from_registros({str(uuid.uuid4()): dados for _, dados in pendentes}, estrito=False)
+        erros = validar_lote(colecao).por_linha()
+        agora = time.time()
+        lote: Dict[str, dict] = {}
+        for linha, (posicao, _) in enumerate(pendentes):
+            if linha in erros:
+                relatorio.erros.append((posicao, "; ".join(erros[linha])))
+            else:
+                # Registros exportados mantêm a data de criação original
+                ponto = colecao.ponto(linha)
+                if ponto.criado_em is None:
+                    ponto.criado_em = agora
+                lote[colecao.ids[linha]] = ponto.to_dict()
+        if lote:
+            self._gravar_lote(lote)
+            relatorio.importados.extend(lote)
+
+    def _gravar_lote(self, lote: Dict[str, dict]) -> None:
+        """
+        Grava um lote de registros numa única escrita atômica.
+        """
+        self.repositorio.inserir(lote)
+
+        if self.indice is not None:
+            for id_ponto, registro in lote.items():
+                self.indice.aplicar(id_ponto, registro)
+        else:
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+
+    def exportar(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE) -> Iterator[PontoCultural]:
+        """
+        Percorre todos os pontos culturais em ordem de ID.
+        
+        Os pontos são lidos do repositório em blocos de `tamanho_lote`, de modo
+        que a base inteira nunca fica em memória.
+        
+        Args:
+            tamanho_lote (int): Quantidade de pontos por leitura
+            
+        Yields:
+            PontoCultural: Cada ponto cadastrado
+        """
+        return self.repositorio.percorrer(tamanho_lote)
+
+    @medir("ponto_service", quantidade=_quantidade_pagina)
     def listar_pontos(self, pagina: int = 1, tipo: Optional[str] = None, limite: Optional[int] = None) -> Tuple[List[PontoCultural], int]:
         """
         Lista os pontos culturais com paginação e filtros.
@@ -85,45 +263,217 @@ class PontoService:
             Exception: Se houver erro ao listar os pontos
         """
         try:
+            if self.indice is not None:
+                if limite:
+                    pontos = self.indice.fatia(0, limite, tipo)
+                else:
+                    inicio = (pagina - 1) * PAGINACAO_LIMITE
+                    pontos = self.indice.fatia(inicio, inicio + PAGINACAO_LIMITE, tipo)
+                total_paginas = self._total_paginas(self.indice.total(tipo)) if not limite else 1
+                return pontos, total_paginas
+
             cache_key = self._get_cache_key("listar_pontos", pagina=pagina, tipo=tipo, limite=limite)
-            cached_result = self.cache.get(cache_key)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self._carregar_listagem(pagina, tipo, limite), tags=[TAG_LISTAGEM],
+                e_negativo=self._pagina_vazia
+            )
             
-            if cached_result:
-                return cached_result
+        except Exception as e:
+            logger.error(f"Erro ao listar pontos culturais: {str(e)}")
+            raise
 
-            pontos_data = self.ref.get() or {}
-            pontos = []
+    @medir("ponto_service", quantidade=len)
+    def listar_recentes(self, quantidade: int = 5) -> List[PontoCultural]:
+        """
+        Lista os pontos culturais cadastrados mais recentemente.
+        
+        Args:
+            quantidade (int): Quantidade de pontos
             
-            for id_ponto, ponto_data in pontos_data.items():
-                if tipo and ponto_data.get("tipo") != tipo:
-                    continue
-                pontos.append(PontoCultural.from_dict(ponto_data, id_ponto))
+        Returns:
+            List[PontoCultural]: Pontos do mais novo ao mais antigo; pontos
+                cadastrados antes da data de criação existir ficam de fora
+            
+        Raises:
+            Exception: Se houver erro ao listar os pontos
+        """
+        try:
+            if self.indice is not None:
+                return self.indice.listar_recentes(quantidade)
+
+            cache_key = self._get_cache_key("listar_recentes", quantidade=quantidade)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.listar_recentes(quantidade), tags=[TAG_LISTAGEM]
+            )
             
-            # Ordena por nome
-            pontos.sort(key=lambda x: x.nome)
+        except Exception as e:
+            logger.error(f"Erro ao listar pontos culturais recentes: {str(e)}")
+            raise
+
+    @medir("ponto_service", quantidade=len)
+    def listar_por_criador(self, criado_por: str) -> List[PontoCultural]:
+        """
+        Lista os pontos culturais cadastrados por um usuário.
+        
+        Args:
+            criado_por (str): UID do usuário
             
-            # Paginação
-            if limite:
-                pontos = pontos[:limite]
-            else:
-                inicio = (pagina - 1) * PAGINACAO_LIMITE
-                fim = inicio + PAGINACAO_LIMITE
-                pontos = pontos[inicio:fim]
+        Returns:
+            List[PontoCultural]: Pontos do usuário, ordenados por nome
             
-            total_paginas = (len(pontos) + PAGINACAO_LIMITE - 1) // PAGINACAO_LIMITE if not limite else 1
+        Raises:
+            Exception: Se houver erro ao listar os pontos
+        """
+        try:
+            if self.indice is not None:
+                return self.indice.listar_por_criador(criado_por)
+
+            cache_key = self._get_cache_key("listar_por_criador", criado_por=criado_por)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.listar_por_criador(criado_por), tags=[TAG_LISTAGEM]
+            )
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar pontos culturais do usuário {criado_por}: {str(e)}")
+            raise
+
+    @medir("ponto_service")
+    def contar_pontos(self, tipo: Optional[str] = None) -> int:
+        """
+        Retorna a quantidade de pontos cadastrados, no total ou de um tipo.
+        
+        A contagem vem do índice em memória ou do repositório (no Firebase, do nó
+        de contadores mantido a cada escrita), sem baixar os pontos.
+        
+        Args:
+            tipo (Optional[str]): Tipo de ponto para filtrar
             
-            result = (pontos, total_paginas)
-            self.cache.set(cache_key, result)
+        Returns:
+            int: Quantidade de pontos
             
-            return result
+        Raises:
+            Exception: Se houver erro ao contar os pontos
+        """
+        try:
+            if self.indice is not None:
+                return self.indice.total(tipo)
+
+            cache_key = self._get_cache_key("contar_pontos", tipo=tipo)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.contar(tipo), tags=[TAG_LISTAGEM],
+                e_negativo=lambda _: False
+            )
             
         except Exception as e:
-            logger.error(f"Erro ao listar pontos culturais: {str(e)}")
+            logger.error(f"Erro ao contar pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service")
+    def recalcular_contadores(self) -> dict:
+        """
+        Recalcula as contagens a partir de todos os pontos cadastrados.
+        
+        No Firebase, necessário apenas uma vez para bases criadas antes do nó de
+        contadores, ou para corrigir divergências; baixa o nó de pontos inteiro.
+        
+        Returns:
+            dict: Contadores gravados ({"total": int, "tipos": {tipo: int}})
+            
+        Raises:
+            Exception: Se houver erro ao recalcular os contadores
+        """
+        try:
+            contadores = self.repositorio.recalcular_contadores()
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+            logger.info(f"Contadores de pontos culturais recalculados: {contadores['total']} pontos")
+            return contadores
+        except Exception as e:
+            logger.error(f"Erro ao recalcular contadores de pontos culturais: {str(e)}")
             raise
 
+    @medir("ponto_service")
+    def migrar_coordenadas(self, tamanho_lote: int = IMPORTACAO_TAMANHO_LOTE, reiniciar: bool = False) -> int:
+        """
+        Atualiza os registros anteriores ao esquema atual: regrava as coordenadas
+        em texto (esquema versão 1) como números e preenche o campo "tipo_nome"
+        usado na paginação por tipo.
+        
+        Só se aplica ao Firebase. Os pontos são percorridos em ordem de ID, em
+        blocos de `tamanho_lote`. Cada bloco é gravado numa única escrita atômica
+        junto com a última chave processada, de modo que uma execução
+        interrompida continua de onde parou. Pontos já atualizados são ignorados,
+        então repetir a migração é seguro.
+        
+        Args:
+            tamanho_lote (int): Quantidade de pontos lidos e gravados por vez
+            reiniciar (bool): Ignora o progresso salvo e recomeça do primeiro ponto
+            
+        Returns:
+            int: Quantidade de pontos atualizados nesta execução
+            
+        Raises:
+            Exception: Se houver erro ao migrar os pontos
+        """
+        try:
+            migrados = self.repositorio.migrar_coordenadas(tamanho_lote, reiniciar)
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+            logger.info(f"Migração de pontos concluída: {migrados} pontos atualizados")
+            return migrados
+        except Exception as e:
+            logger.error(f"Erro ao migrar coordenadas dos pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service", quantidade=_quantidade_pagina)
+    def listar_pagina(self, cursor: Optional[str] = None, tipo: Optional[str] = None, limite: Optional[int] = None) -> Tuple[List[PontoCultural], Optional[str]]:
+        """
+        Lista uma página de pontos ordenados por nome usando paginação por cursor.
+        
+        Cada chamada consulta o repositório a partir do último (nome, id) exibido,
+        de modo que o custo é proporcional ao tamanho da página e não ao total
+        de pontos cadastrados.
+        
+        Args:
+            cursor (Optional[str]): Cursor retornado pela página anterior
+            tipo (Optional[str]): Tipo de ponto para filtrar
+            limite (Optional[int]): Limite de pontos por página
+            
+        Returns:
+            Tuple[List[PontoCultural], Optional[str]]: Lista de pontos e cursor da
+            próxima página (None se esta for a última)
+            
+        Raises:
+            Exception: Se houver erro ao listar os pontos
+        """
+        try:
+            limite = limite or PAGINACAO_LIMITE
+            ultimo = self._decodificar_cursor(cursor) if cursor else None
+
+            if self.indice is not None:
+                pontos, ha_mais = self.indice.apos(ultimo, limite, tipo)
+                proximo_cursor = None
+                if ha_mais and pontos:
+                    proximo_cursor = self._codificar_cursor(pontos[-1].nome, pontos[-1].id)
+                return pontos, proximo_cursor
+
+            cache_key = self._get_cache_key("listar_pagina", cursor=cursor, tipo=tipo, limite=limite)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self._carregar_pagina(ultimo, tipo, limite), tags=[TAG_LISTAGEM],
+                e_negativo=self._pagina_vazia
+            )
+            
+        except Exception as e:
+            logger.error(f"Erro ao listar página de pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service", quantidade=len)
     def buscar_pontos(self, termo: str) -> List[PontoCultural]:
         """
-        Busca pontos culturais por termo.
+        Busca pontos culturais por termo, sem diferenciar acentos.
+        
+        Com o índice em memória ou o repositório SQLite, cada palavra do termo
+        casa por prefixo e os resultados vêm em ordem de relevância; no Firebase
+        sem índice, o termo é procurado como trecho de nome, descrição ou tipo e
+        os resultados vêm ordenados por nome.
         
         Args:
             termo (str): Termo para busca
@@ -135,32 +485,80 @@ class PontoService:
             Exception: Se houver erro ao buscar os pontos
         """
         try:
+            if self.indice is not None:
+                return self.indice.buscar_texto(termo)
+
             cache_key = self._get_cache_key("buscar_pontos", termo=termo)
-            cached_result = self.cache.get(cache_key)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.buscar_texto(termo), tags=[TAG_LISTAGEM]
+            )
             
-            if cached_result:
-                return cached_result
+        except Exception as e:
+            logger.error(f"Erro ao buscar pontos culturais: {str(e)}")
+            raise
 
-            pontos_data = self.ref.get() or {}
-            resultados = []
+    @medir("ponto_service", quantidade=len)
+    def buscar_proximos(self, lat: float, lon: float, raio_km: float) -> List[PontoCultural]:
+        """
+        Busca os pontos culturais a até `raio_km` quilômetros de uma coordenada.
+        
+        Args:
+            lat (float): Latitude do centro da busca
+            lon (float): Longitude do centro da busca
+            raio_km (float): Raio da busca em quilômetros
             
-            termo = termo.lower()
-            for id_ponto, ponto_data in pontos_data.items():
-                if (termo in ponto_data.get("nome", "").lower() or 
-                    termo in ponto_data.get("descricao", "").lower() or
-                    termo in ponto_data.get("tipo", "").lower()):
-                    resultados.append(PontoCultural.from_dict(ponto_data, id_ponto))
+        Returns:
+            List[PontoCultural]: Pontos encontrados, do mais próximo ao mais distante
             
-            # Ordena por nome
-            resultados.sort(key=lambda x: x.nome)
+        Raises:
+            Exception: Se houver erro ao buscar os pontos
+        """
+        try:
+            if self.indice is not None:
+                return [ponto for ponto, _ in self.indice.buscar_proximos(lat, lon, raio_km)]
+
+            cache_key = self._get_cache_key("buscar_proximos", lat=lat, lon=lon, raio_km=raio_km)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.buscar_proximos(lat, lon, raio_km), tags=[TAG_LISTAGEM]
+            )
             
-            self.cache.set(cache_key, resultados)
-            return resultados
+        except Exception as e:
+            logger.error(f"Erro ao buscar pontos culturais próximos: {str(e)}")
+            raise
+
+    @medir("ponto_service", quantidade=len)
+    def buscar_na_area(self, bbox: Area) -> List[PontoCultural]:
+        """
+        Busca os pontos culturais dentro de um retângulo de coordenadas, como a
+        área visível de um mapa.
+        
+        Args:
+            bbox (Area): Tupla (lat_min, lon_min, lat_max, lon_max)
+            
+        Returns:
+            List[PontoCultural]: Pontos dentro da área
+            
+        Raises:
+            Exception: Se houver erro ao buscar os pontos
+        """
+        try:
+            if self.indice is not None:
+                return self.indice.buscar_na_area(bbox)
+
+            lat_min, lon_min, lat_max, lon_max = bbox
+            if lat_min > lat_max or lon_min > lon_max:
+                raise ValueError("Área inválida: os limites mínimos devem ser menores que os máximos")
+
+            cache_key = self._get_cache_key("buscar_na_area", bbox=bbox)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.buscar_na_area(bbox), tags=[TAG_LISTAGEM]
+            )
             
         except Exception as e:
-            logger.error(f"Erro ao buscar pontos culturais: {str(e)}")
+            logger.error(f"Erro ao buscar pontos culturais na área: {str(e)}")
             raise
 
+    @medir("ponto_service")
     def excluir_ponto(self, id_ponto: str) -> None:
         """
         Exclui um ponto cultural.
@@ -172,14 +570,80 @@ class PontoService:
             Exception: Se houver erro ao excluir o ponto
         """
         try:
-            self.ref.child(id_ponto).delete()
-            # Invalida cache após exclusão
-            self.cache.clear()
+            self._excluir([id_ponto])
             logger.info(f"Ponto cultural excluído com sucesso: {id_ponto}")
         except Exception as e:
             logger.error(f"Erro ao excluir ponto cultural {id_ponto}: {str(e)}")
             raise
 
+    @medir("ponto_service")
+    def excluir_pontos(self, ids: Iterable[str]) -> None:
+        """
+        Exclui vários pontos culturais numa única escrita atômica.
+        
+        Args:
+            ids (Iterable[str]): IDs dos pontos a serem excluídos
+            
+        Raises:
+            Exception: Se houver erro ao excluir os pontos; nesse caso nenhum é excluído
+        """
+        ids = list(dict.fromkeys(ids))
+        try:
+            if ids:
+                self._excluir(ids)
+            logger.info(f"{len(ids)} pontos culturais excluídos com sucesso")
+        except Exception as e:
+            logger.error(f"Erro ao excluir {len(ids)} pontos culturais: {str(e)}")
+            raise
+
+    def _excluir(self, ids: List[str]) -> None:
+        """
+        Remove os pontos numa única escrita e invalida o cache uma vez para o
+        lote inteiro.
+        """
+        tipos = None
+        if self.indice is not None:
+            # IDs que o índice não conhece (por exemplo, servido de uma cópia
+            # local desatualizada) ficam com None e têm o tipo lido do banco
+            pontos = [self.indice.obter(id_ponto) for id_ponto in ids]
+            tipos = [ponto.tipo if ponto else None for ponto in pontos]
+        self.repositorio.excluir(ids, tipos)
+
+        if self.indice is not None:
+            for id_ponto in ids:
+                self.indice.aplicar(id_ponto, None)
+        else:
+            # Invalida as listagens e as entradas dos pontos excluídos
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+            for id_ponto in ids:
+                self.cache.invalidate_tag(self._tag_ponto(id_ponto))
+
+    @medir("ponto_service", quantidade=len)
+    def buscar_por_ids(self, ids: Iterable[str]) -> Dict[str, PontoCultural]:
+        """
+        Busca vários pontos culturais pelo ID.
+        
+        Os pontos que não estão em cache são lidos do repositório em paralelo.
+        
+        Args:
+            ids (Iterable[str]): IDs dos pontos
+            
+        Returns:
+            Dict[str, PontoCultural]: Pontos encontrados por ID, na ordem pedida;
+            IDs inexistentes ficam de fora
+            
+        Raises:
+            Exception: Se houver erro ao buscar os pontos
+        """
+        ids = list(dict.fromkeys(ids))
+        try:
+            pontos = executar_em_paralelo(self.buscar_por_id, ids)
+            return {id_ponto: ponto for id_ponto, ponto in zip(ids, pontos) if ponto is not None}
+        except Exception as e:
+            logger.error(f"Erro ao buscar {len(ids)} pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service")
     def buscar_por_id(self, id_ponto: str) -> Optional[PontoCultural]:
         """
         Busca um ponto cultural pelo ID.
@@ -194,18 +658,38 @@ class PontoService:
             Exception: Se houver erro ao buscar o ponto
         """
         try:
-            cache_key = self._get_cache_key("buscar_por_id", id_ponto=id_ponto)
-            cached_result = self.cache.get(cache_key)
-            
-            if cached_result:
-                return cached_result
+            if self.indice is not None:
+                return self.indice.obter(id_ponto)
 
-            ponto_data = self.ref.child(id_ponto).get()
-            if ponto_data:
-                ponto = PontoCultural.from_dict(ponto_data, id_ponto)
-                self.cache.set(cache_key, ponto)
-                return ponto
-            return None
+            cache_key = self._get_cache_key("buscar_por_id", id_ponto=id_ponto)
+            return self.cache.obter_ou_carregar(
+                cache_key, lambda: self.repositorio.obter(id_ponto), tags=[self._tag_ponto(id_ponto)]
+            )
         except Exception as e:
             logger.error(f"Erro ao buscar ponto cultural {id_ponto}: {str(e)}")
             raise
+
+    def _carregar_listagem(self, pagina: int, tipo: Optional[str], limite: Optional[int]) -> Tuple[List[PontoCultural], int]:
+        """
+        Consulta o repositório para listar_pontos.
+        """
+        if limite:
+            pontos, _ = self.repositorio.listar(tipo, 0, limite)
+            return pontos, 1
+        # O total de páginas considera todos os pontos do filtro, antes do recorte
+        pontos, total = self.repositorio.listar(tipo, (pagina - 1) * PAGINACAO_LIMITE, PAGINACAO_LIMITE)
+        return pontos, self._total_paginas(total)
+
+    @staticmethod
+    def _total_paginas(total: int) -> int:
+        return (total + PAGINACAO_LIMITE - 1) // PAGINACAO_LIMITE
+
+    def _carregar_pagina(self, ultimo: Optional[Tuple[str, str]], tipo: Optional[str], limite: int) -> Tuple[List[PontoCultural], Optional[str]]:
+        """
+        Consulta o repositório para listar_pagina.
+        """
+        pontos, ha_mais = self.repositorio.apos(ultimo, limite, tipo)
+        proximo_cursor = None
+        if ha_mais and pontos:
+            proximo_cursor = self._codificar_cursor(pontos[-1].nome, pontos[-1].id)
+        return pontos, proximo_cursor
@@ -0,0 +1,341 @@
+"""
+Módulo responsável pela variante assíncrona do serviço de pontos culturais,
+que acessa o Realtime Database pela API REST.
+"""
+import aiohttp
+import asyncio
+import firebase_admin
+import json
+import time
+import uuid
+import logging
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from firebase_admin import credentials
+from models.ponto_cultural import PontoCultural
+from repositorios.repositorio_firebase import (
+    CONTADORES, atualizacoes_contagens, campo_tipo_nome, contar_registros, montar_listagem, filtrar_busca
+)
+from services.ponto_service import PontoService, TAG_LISTAGEM, _quantidade_pagina
+from utils.cache import Cache
+from utils.metricas import medir, metricas, LIMITES_BYTES
+from config import (
+    FIREBASE_DATABASE_URL, PAGINACAO_LIMITE, LOG_LEVEL, LOG_FORMAT,
+    ASYNC_MAX_CONEXOES, ASYNC_MAX_REQUISICOES, ASYNC_TEMPO_LIMITE
+)
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+# Antecedência com que o token de acesso é renovado antes de expirar, em segundos
+MARGEM_RENOVACAO_TOKEN = 60
+
+class AsyncPontoService:
+    """
+    Serviço assíncrono de pontos culturais sobre a API REST do Realtime Database.
+
+    Todas as requisições compartilham uma aiohttp.ClientSession com pool de
+    conexões keep-alive, de modo que chamadas seguidas reaproveitam a conexão
+    TLS. Um semáforo limita as requisições simultâneas e cada requisição tem
+    tempo máximo. Os métodos têm a mesma assinatura dos de PontoService.
+
+    Uso:
+        async with AsyncPontoService() as service:
+            pontos = await asyncio.gather(*(service.buscar_por_id(i) for i in ids))
+    """
+
+    def __init__(self, database_url: Optional[str] = FIREBASE_DATABASE_URL,
+                 credencial: Optional[credentials.Base] = None,
+                 max_conexoes: int = ASYNC_MAX_CONEXOES,
+                 max_requisicoes: int = ASYNC_MAX_REQUISICOES,
+                 tempo_limite: float = ASYNC_TEMPO_LIMITE):
+        """
+        Inicializa o serviço; a sessão HTTP é criada no primeiro uso.
+
+        Args:
+            database_url (Optional[str]): URL do Realtime Database
+            credencial (Optional[credentials.Base]): Credencial usada para gerar o
+                token de acesso (padrão: a do app Firebase inicializado, se houver);
+                sem credencial, as requisições não são autenticadas
+            max_conexoes (int): Tamanho do pool de conexões
+            max_requisicoes (int): Requisições simultâneas em andamento
+            tempo_limite (float): Tempo máximo de cada requisição, em segundos
+        """
+        if not database_url:
+            raise ValueError("URL do Realtime Database não configurada")
+        if credencial is None and firebase_admin._apps:
+            credencial = firebase_admin.get_app().credential
+        self.database_url = database_url.rstrip("/")
+        self.credencial = credencial
+        self.max_conexoes = max_conexoes
+        self.tempo_limite = tempo_limite
+        self.cache = Cache()
+        self._semaforo = asyncio.Semaphore(max_requisicoes)
+        self._sessao: Optional[aiohttp.ClientSession] = None
+        self._token: Optional[str] = None
+        self._token_expira_em = 0.0
+        self._contadores_prontos = False
+        self._lock_contadores = asyncio.Lock()
+
+    async def __aenter__(self) -> 'AsyncPontoService':
+        return self
+
+    async def __aexit__(self, *excecao) -> None:
+        await self.fechar()
+
+    async def fechar(self) -> None:
+        """
+        Encerra a sessão HTTP e as conexões do pool.
+        """
+        if self._sessao is not None:
+            await self._sessao.close()
+            self._sessao = None
+
+    def _obter_sessao(self) -> aiohttp.ClientSession:
+        if self._sessao is None or self._sessao.closed:
+            self._sessao = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.max_conexoes),
+                timeout=aiohttp.ClientTimeout(total=self.tempo_limite),
+                json_serialize=lambda valor: json.dumps(valor, ensure_ascii=False)
+            )
+        return self._sessao
+
+    async def _obter_token(self) -> Optional[str]:
+        """
+        Token OAuth2 da credencial, renovado pouco antes de expirar.
+        """
+        if self.credencial is None:
+            return None
+        if self._token is None or time.time() >= self._token_expira_em:
+            # A renovação do google-auth é bloqueante
+            info = await asyncio.to_thread(self.credencial.get_access_token)
+            self._token = info.access_token
+            expira_em = info.expiry.timestamp() if info.expiry else time.time() + 3600
+            self._token_expira_em = expira_em - MARGEM_RENOVACAO_TOKEN
+        return self._token
+
+    async def _requisitar(self, metodo: str, caminho: str, consulta: Optional[Dict[str, Any]] = None,
+                          corpo: Any = None) -> Any:
+        """
+        Executa uma requisição na API REST e retorna o JSON da resposta.
+
+        Args:
+            metodo (str): Método HTTP
+            caminho (str): Caminho do nó, sem barra inicial
+            consulta (Optional[Dict[str, Any]]): Parâmetros de consulta (orderBy,
+                equalTo...); os valores são codificados em JSON, como a API exige
+            corpo (Any): Corpo JSON de PATCH/PUT
+
+        Raises:
+            aiohttp.ClientResponseError: Se a API responder com erro
+            asyncio.TimeoutError: Se a requisição passar do tempo limite
+        """
+        params = {chave: json.dumps(valor, ensure_ascii=False) for chave, valor in (consulta or {}).items()}
+        token = await self._obter_token()
+        if token:
+            params["access_token"] = token
+        url = f"{self.database_url}/{caminho}.json"
+        if corpo is not None:
+            metricas.observar_tamanho("firebase_envio_bytes", corpo, operacao=f"rest_{metodo.lower()}")
+        async with self._semaforo:
+            with metricas.cronometrar("firebase", operacao=f"rest_{metodo.lower()}"):
+                async with self._obter_sessao().request(metodo, url, params=params, json=corpo) as resposta:
+                    resposta.raise_for_status()
+                    conteudo = await resposta.read()
+            metricas.observar("firebase_resposta_bytes", len(conteudo), LIMITES_BYTES, operacao=f"rest_{metodo.lower()}")
+            return json.loads(conteudo)
+
+    async def _obter_pontos(self, consulta: Optional[Dict[str, Any]] = None) -> Dict[str, dict]:
+        return await self._requisitar("GET", "pontos", consulta) or {}
+
+    async def _garantir_contadores(self) -> None:
+        """
+        Cria o nó de contadores a partir dos pontos existentes antes do primeiro
+        incremento, como RepositorioFirebase._garantir_contadores.
+        """
+        if self._contadores_prontos:
+            return
+        async with self._lock_contadores:
+            if self._contadores_prontos:
+                return
+            if await self._requisitar("GET", CONTADORES, {"shallow": True}) is None:
+                logger.info("Nó de contadores ausente; recalculando a partir dos pontos existentes")
+                contadores = contar_registros(await self._obter_pontos())
+                await self._requisitar("PATCH", "", corpo={CONTADORES: contadores})
+            self._contadores_prontos = True
+
+    @medir("ponto_service_async")
+    async def cadastrar_ponto(self, dados: dict) -> str:
+        """
+        Cadastra um novo ponto cultural.
+
+        Args:
+            dados (dict): Dicionário com os dados do ponto
+
+        Returns:
+            str: ID do ponto cadastrado
+
+        Raises:
+            Exception: Se houver erro ao cadastrar o ponto
+        """
+        try:
+            ponto = PontoCultural.from_dict(dados)
+            ponto.validar()
+            ponto.criado_em = time.time()
+
+            id_ponto = str(uuid.uuid4())
+            await self._garantir_contadores()
+            # Grava o ponto e atualiza as contagens numa única escrita atômica
+            registro = {**ponto.to_dict(), "tipo_nome": campo_tipo_nome(ponto.tipo, ponto.nome)}
+            atualizacoes = {f"pontos/{id_ponto}": registro}
+            atualizacoes.update(atualizacoes_contagens({ponto.tipo: 1}))
+            await self._requisitar("PATCH", "", corpo=atualizacoes)
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+
+            logger.info(f"Ponto cultural cadastrado com sucesso: {id_ponto}")
+            return id_ponto
+
+        except Exception as e:
+            logger.error(f"Erro ao cadastrar ponto cultural: {str(e)}")
+            raise
+
+    @medir("ponto_service_async", quantidade=_quantidade_pagina)
+    async def listar_pontos(self, pagina: int = 1, tipo: Optional[str] = None, limite: Optional[int] = None) -> Tuple[List[PontoCultural], int]:
+        """
+        Lista os pontos culturais com paginação e filtros.
+
+        Args:
+            pagina (int): Número da página
+            tipo (Optional[str]): Tipo de ponto para filtrar
+            limite (Optional[int]): Limite de pontos por página
+
+        Returns:
+            Tuple[List[PontoCultural], int]: Lista de pontos e total de páginas
+
+        Raises:
+            Exception: Se houver erro ao listar os pontos
+        """
+        try:
+            # Com tipo, o filtro é feito no servidor pelo índice "tipo"
+            consulta = {"orderBy": "tipo", "equalTo": tipo} if tipo else None
+            pontos_data = await self._obter_pontos(consulta)
+            if limite:
+                return montar_listagem(pontos_data, tipo, 0, limite)[0], 1
+            pontos, total = montar_listagem(pontos_data, tipo, (pagina - 1) * PAGINACAO_LIMITE, PAGINACAO_LIMITE)
+            return pontos, PontoService._total_paginas(total)
+        except Exception as e:
+            logger.error(f"Erro ao listar pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service_async", quantidade=len)
+    async def listar_recentes(self, quantidade: int = 5) -> List[PontoCultural]:
+        """
+        Lista os pontos culturais cadastrados mais recentemente.
+
+        Args:
+            quantidade (int): Quantidade de pontos
+
+        Returns:
+            List[PontoCultural]: Pontos do mais novo ao mais antigo
+
+        Raises:
+            Exception: Se houver erro ao listar os pontos
+        """
+        try:
+            # A API REST não garante a ordem das chaves na resposta; a ordenação é refeita aqui
+            pontos_data = await self._obter_pontos({"orderBy": "criado_em", "limitToLast": quantidade})
+            pontos = [
+                PontoCultural.from_dict(ponto_data, id_ponto) for id_ponto, ponto_data in pontos_data.items()
+                if ponto_data.get("criado_em") is not None
+            ]
+            pontos.sort(key=lambda ponto: ponto.criado_em, reverse=True)
+            return pontos
+        except Exception as e:
+            logger.error(f"Erro ao listar pontos culturais recentes: {str(e)}")
+            raise
+
+    @medir("ponto_service_async", quantidade=len)
+    async def buscar_pontos(self, termo: str) -> List[PontoCultural]:
+        """
+        Busca pontos culturais por termo no nome, descrição ou tipo.
+
+        Args:
+            termo (str): Termo de busca
+
+        Returns:
+            List[PontoCultural]: Lista de pontos encontrados, ordenados por nome
+
+        Raises:
+            Exception: Se houver erro ao buscar os pontos
+        """
+        try:
+            return filtrar_busca(await self._obter_pontos(), termo)
+        except Exception as e:
+            logger.error(f"Erro ao buscar pontos culturais: {str(e)}")
+            raise
+
+    @medir("ponto_service_async")
+    async def buscar_por_id(self, id_ponto: str) -> Optional[PontoCultural]:
+        """
+        Busca um ponto cultural pelo ID.
+
+        Args:
+            id_ponto (str): ID do ponto
+
+        Returns:
+            Optional[PontoCultural]: Ponto encontrado ou None
+
+        Raises:
+            Exception: Se houver erro ao buscar o ponto
+        """
+        try:
+            ponto_data = await self._requisitar("GET", f"pontos/{id_ponto}")
+            if ponto_data:
+                return PontoCultural.from_dict(ponto_data, id_ponto)
+            return None
+        except Exception as e:
+            logger.error(f"Erro ao buscar ponto cultural {id_ponto}: {str(e)}")
+            raise
+
+    @medir("ponto_service_async", quantidade=len)
+    async def buscar_por_ids(self, ids: Iterable[str]) -> Dict[str, PontoCultural]:
+        """
+        Busca vários pontos de uma vez, com as leituras em paralelo.
+
+        Args:
+            ids (Iterable[str]): IDs dos pontos
+
+        Returns:
+            Dict[str, PontoCultural]: Pontos encontrados indexados pelo ID; IDs
+                inexistentes ficam de fora
+        """
+        ids = list(dict.fromkeys(ids))
+        pontos = await asyncio.gather(*(self.buscar_por_id(id_ponto) for id_ponto in ids))
+        return {id_ponto: ponto for id_ponto, ponto in zip(ids, pontos) if ponto is not None}
+
+    @medir("ponto_service_async")
+    async def excluir_ponto(self, id_ponto: str) -> None:
+        """
+        Exclui um ponto cultural.
+
+        Args:
+            id_ponto (str): ID do ponto a ser excluído
+
+        Raises:
+            Exception: Se houver erro ao excluir o ponto
+        """
+        try:
+            await self._garantir_contadores()
+            tipo = await self._requisitar("GET", f"pontos/{id_ponto}/tipo")
+            atualizacoes = {f"pontos/{id_ponto}": None}
+            if tipo:
+                atualizacoes.update(atualizacoes_contagens({tipo: -1}))
+            await self._requisitar("PATCH", "", corpo=atualizacoes)
+
+            # Mantém coerente o cache do serviço síncrono no mesmo processo
+            self.cache.invalidate_tag(TAG_LISTAGEM)
+            self.cache.invalidate_tag(PontoService._tag_ponto(id_ponto))
+            logger.info(f"Ponto cultural excluído com sucesso: {id_ponto}")
+        except Exception as e:
+            logger.error(f"Erro ao excluir ponto cultural {id_ponto}: {str(e)}")
+            raise
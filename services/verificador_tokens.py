@@ -0,0 +1,212 @@
+"""
+Módulo responsável pela verificação local dos ID tokens do Firebase Authentication.
+"""
+import copy
+import hashlib
+import logging
+import re
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+import jwt
+import requests
+from cryptography.x509 import load_pem_x509_certificate
+from utils.cache import CacheLRU, AUSENTE
+from utils.metricas import metricas
+from config import (
+    LOG_LEVEL, LOG_FORMAT, TOKEN_CACHE_TAMANHO, TOKEN_CERTIFICADOS_VALIDADE, TOKEN_TOLERANCIA_RELOGIO,
+    TOKEN_INTERVALO_RENOVACAO
+)
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+# Certificados públicos (X.509, por "kid") que assinam os ID tokens do Firebase
+URL_CERTIFICADOS = "https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com"
+EMISSOR = "https://securetoken.google.com/{projeto}"
+# Fração da validade informada pelo Google após a qual os certificados são renovados
+FRACAO_RENOVACAO = 0.9
+
+def buscar_certificados() -> Tuple[Dict[str, str], float]:
+    """
+    Baixa os certificados públicos e a validade indicada em Cache-Control.
+
+    Returns:
+        Tuple[Dict[str, str], float]: Certificados PEM por "kid" e validade em segundos
+    """
+    resposta = requests.get(URL_CERTIFICADOS, timeout=10)
+    resposta.raise_for_status()
+    max_age = re.search(r"max-age=(\d+)", resposta.headers.get("Cache-Control", ""))
+    return resposta.json(), float(max_age.group(1)) if max_age else TOKEN_CERTIFICADOS_VALIDADE
+
+
+class VerificadorTokens:
+    """
+    Verifica ID tokens do Firebase localmente, com cache dos tokens já verificados.
+
+    A primeira verificação de um token confere assinatura (RS256, com as chaves
+    públicas do Google), emissor, audiência e validade. As claims ficam num
+    cache LRU com chave pelo SHA-256 do token e prazo igual ao "exp" do próprio
+    token, de modo que as verificações seguintes são uma consulta ao cache.
+
+    Os certificados são baixados na primeira verificação e renovados em
+    segundo plano antes de expirarem. Um token assinado por uma chave ainda
+    desconhecida força uma renovação imediata, no máximo uma a cada
+    `intervalo_renovacao` segundos; fora desse limite, o token é recusado sem
+    acessar a rede, de modo que tokens forjados não geram uma busca cada.
+    """
+
+    _compartilhados: Dict[str, 'VerificadorTokens'] = {}
+    _lock_compartilhados = threading.Lock()
+
+    def __init__(self, projeto: str,
+                 buscar: Callable[[], Tuple[Dict[str, str], float]] = buscar_certificados,
+                 tamanho_cache: int = TOKEN_CACHE_TAMANHO,
+                 tolerancia: float = TOKEN_TOLERANCIA_RELOGIO,
+                 intervalo_renovacao: float = TOKEN_INTERVALO_RENOVACAO):
+        """
+        Inicializa o verificador; os certificados são baixados no primeiro uso.
+
+        Args:
+            projeto (str): ID do projeto Firebase (audiência dos tokens)
+            buscar (Callable): Função que retorna os certificados PEM por "kid" e
+                sua validade em segundos
+            tamanho_cache (int): Quantidade máxima de tokens em cache
+            tolerancia (float): Diferença de relógio aceita em "exp" e "iat", em segundos
+            intervalo_renovacao (float): Intervalo mínimo entre renovações forçadas
+                por chaves desconhecidas, em segundos
+        """
+        self.projeto = projeto
+        self.emissor = EMISSOR.format(projeto=projeto)
+        self.tolerancia = tolerancia
+        self.intervalo_renovacao = intervalo_renovacao
+        self._buscar = buscar
+        self._cache = CacheLRU(tamanho_maximo=tamanho_cache, tempo_obsoleto=0)
+        self._lock = threading.Lock()
+        self._chaves: Optional[Dict[str, Any]] = None
+        self._renovacao: Optional[threading.Timer] = None
+        # Serializa as buscas feitas durante a verificação; threads que esperam
+        # reaproveitam a busca da que chegou primeiro
+        self._lock_busca = threading.Lock()
+        self._ultima_renovacao_forcada: Optional[float] = None
+
+    @classmethod
+    def compartilhado(cls, projeto: str) -> 'VerificadorTokens':
+        """
+        Retorna o verificador único do processo para o projeto informado.
+        """
+        with cls._lock_compartilhados:
+            if projeto not in cls._compartilhados:
+                verificador = cls._compartilhados[projeto] = cls(projeto)
+                metricas.registrar_coletor("cache", verificador.stats, medidores=("size",), cache="tokens")
+            return cls._compartilhados[projeto]
+
+    def atualizar_certificados(self) -> None:
+        """
+        Baixa os certificados e agenda a próxima renovação em segundo plano.
+
+        Raises:
+            Exception: Se houver erro ao baixar os certificados
+        """
+        try:
+            certificados, validade = self._buscar()
+            chaves = {
+                kid: load_pem_x509_certificate(pem.encode("utf-8")).public_key()
+                for kid, pem in certificados.items()
+            }
+            with self._lock:
+                self._chaves = chaves
+                if self._renovacao is not None:
+                    self._renovacao.cancel()
+                self._renovacao = threading.Timer(max(1.0, validade * FRACAO_RENOVACAO), self._renovar)
+                self._renovacao.daemon = True
+                self._renovacao.start()
+            logger.info(f"Certificados de tokens atualizados: {len(chaves)} chaves, válidos por {validade:.0f}s")
+        except Exception as e:
+            logger.error(f"Erro ao atualizar certificados de tokens: {str(e)}")
+            raise
+
+    def _renovar(self) -> None:
+        try:
+            self.atualizar_certificados()
+        except Exception:
+            # Mantém as chaves atuais; a próxima chave desconhecida tenta de novo
+            pass
+
+    def parar(self) -> None:
+        """
+        Cancela a renovação agendada dos certificados.
+        """
+        with self._lock:
+            if self._renovacao is not None:
+                self._renovacao.cancel()
+                self._renovacao = None
+
+    def _chave(self, kid: Optional[str]):
+        chaves = self._chaves
+        if chaves is None or kid not in chaves:
+            with self._lock_busca:
+                # Outra thread pode ter baixado os certificados enquanto esta esperava
+                chaves = self._chaves
+                if chaves is None:
+                    self.atualizar_certificados()
+                elif kid not in chaves and self._pode_forcar_renovacao():
+                    self._ultima_renovacao_forcada = time.monotonic()
+                    self.atualizar_certificados()
+                chaves = self._chaves
+        chave = chaves.get(kid)
+        if chave is None:
+            raise jwt.InvalidTokenError("Token assinado por uma chave desconhecida")
+        return chave
+
+    def _pode_forcar_renovacao(self) -> bool:
+        return (self._ultima_renovacao_forcada is None or
+                time.monotonic() - self._ultima_renovacao_forcada >= self.intervalo_renovacao)
+
+    def verificar(self, token: str) -> Dict[str, Any]:
+        """
+        Verifica o token e retorna suas claims, com "uid" igual a "sub".
+
+        Cada chamada recebe uma cópia das claims em cache, que pode ser
+        alterada sem afetar as verificações seguintes.
+
+        Args:
+            token (str): ID token do Firebase
+
+        Returns:
+            Dict[str, Any]: Claims do token
+
+        Raises:
+            jwt.InvalidTokenError: Se o token for inválido ou estiver expirado
+        """
+        chave_cache = hashlib.sha256(token.encode("utf-8")).hexdigest()
+        claims = self._cache.get(chave_cache, AUSENTE)
+        if claims is not AUSENTE:
+            return copy.deepcopy(claims)
+
+        cabecalho = jwt.get_unverified_header(token)
+        claims = jwt.decode(
+            token,
+            self._chave(cabecalho.get("kid")),
+            algorithms=["RS256"],
+            audience=self.projeto,
+            issuer=self.emissor,
+            leeway=self.tolerancia,
+            options={"require": ["exp", "iat", "sub"]}
+        )
+        if not isinstance(claims["sub"], str) or not claims["sub"]:
+            raise jwt.InvalidTokenError("Token sem usuário (sub)")
+        claims["uid"] = claims["sub"]
+
+        # O token só fica em cache até expirar
+        restante = claims["exp"] - time.time()
+        if restante > 0:
+            self._cache.set(chave_cache, claims, ttl=restante)
+        return copy.deepcopy(claims)
+
+    def stats(self) -> Dict[str, int]:
+        """
+        Estatísticas do cache de tokens verificados.
+        """
+        return self._cache.stats()
@@ -0,0 +1,14 @@
+import pytest
+from firebase_admin import db
+from tests.fake_db import FakeDatabase
+from utils.cache import Cache
+
+
+@pytest.fixture
+def banco(monkeypatch):
+    """Substitui ``firebase_admin.db`` por um banco em memória."""
+    fake = FakeDatabase()
+    monkeypatch.setattr(db, "reference", fake.reference)
+    Cache().clear()
+    yield fake
+    Cache().clear()
@@ -0,0 +1,251 @@
+"""
+Implementação local e em memória de um subconjunto de ``firebase_admin.db``
+usada pelos testes dos serviços.
+"""
+import copy
+import time
+from firebase_admin.db import _Sorter
+
+
+def _segmentos(path: str) -> list:
+    return [s for s in path.strip("/").split("/") if s]
+
+
+class FakeDatabase:
+    """
+    Árvore JSON em memória que imita o Realtime Database.
+    """
+
+    def __init__(self, dados: dict = None):
+        self.dados = copy.deepcopy(dados) if dados else {}
+        self.ouvintes = []
+        # Registra as chamadas de leitura para que os testes possam medir
+        # quantos registros cada operação realmente baixou.
+        self.leituras = []
+        # Atraso artificial das leituras, em segundos, para testes de concorrência
+        self.latencia = 0.0
+
+    def reference(self, path: str = "/") -> "FakeReference":
+        return FakeReference(self, _segmentos(path))
+
+    def _obter(self, segmentos: list):
+        atual = self.dados
+        for segmento in segmentos:
+            if not isinstance(atual, dict) or segmento not in atual:
+                return None
+            atual = atual[segmento]
+        return copy.deepcopy(atual)
+
+    def _definir(self, segmentos: list, valor) -> None:
+        if not segmentos:
+            self.dados = copy.deepcopy(valor) if valor is not None else {}
+            return
+        atual = self.dados
+        for segmento in segmentos[:-1]:
+            if not isinstance(atual.get(segmento), dict):
+                atual[segmento] = {}
+            atual = atual[segmento]
+        if valor is None:
+            atual.pop(segmentos[-1], None)
+        else:
+            atual[segmentos[-1]] = copy.deepcopy(valor)
+
+    def _resolver(self, segmentos: list, valor):
+        """Aplica valores de servidor como {".sv": {"increment": n}}."""
+        if isinstance(valor, dict) and ".sv" in valor:
+            atual = self._obter(segmentos)
+            return (atual if isinstance(atual, (int, float)) else 0) + valor[".sv"]["increment"]
+        return valor
+
+    def _notificar(self, segmentos: list, valor) -> None:
+        for ouvinte in list(self.ouvintes):
+            base = ouvinte.segmentos
+            if segmentos[:len(base)] == base:
+                caminho = "/" + "/".join(segmentos[len(base):])
+                ouvinte.callback(FakeEvent("put", caminho, copy.deepcopy(valor)))
+            elif base[:len(segmentos)] == segmentos:
+                ouvinte.callback(FakeEvent("put", "/", self._obter(base)))
+
+    def _notificar_update(self, segmentos: list, valores: dict) -> None:
+        for ouvinte in list(self.ouvintes):
+            base = ouvinte.segmentos
+            if segmentos[:len(base)] == base:
+                caminho = "/" + "/".join(segmentos[len(base):])
+                ouvinte.callback(FakeEvent("patch", caminho, copy.deepcopy(valores)))
+                continue
+            for caminho, valor in valores.items():
+                completo = segmentos + _segmentos(caminho)
+                if completo[:len(base)] == base:
+                    relativo = "/" + "/".join(completo[len(base):])
+                    ouvinte.callback(FakeEvent("put", relativo, copy.deepcopy(valor)))
+                elif base[:len(completo)] == completo:
+                    ouvinte.callback(FakeEvent("put", "/", self._obter(base)))
+
+    def _registrar_leitura(self, path: list, resultado) -> None:
+        if self.latencia:
+            time.sleep(self.latencia)
+        total = len(resultado) if isinstance(resultado, dict) else int(resultado is not None)
+        self.leituras.append(("/".join(path), total))
+
+
+class FakeReference:
+    """
+    Equivalente em memória de ``firebase_admin.db.Reference``.
+    """
+
+    def __init__(self, banco: FakeDatabase, segmentos: list):
+        self._banco = banco
+        self._segmentos = segmentos
+
+    @property
+    def key(self):
+        return self._segmentos[-1] if self._segmentos else None
+
+    @property
+    def path(self) -> str:
+        return "/" + "/".join(self._segmentos)
+
+    def child(self, path: str) -> "FakeReference":
+        return FakeReference(self._banco, self._segmentos + _segmentos(path))
+
+    def get(self, etag=False, shallow=False):
+        resultado = self._banco._obter(self._segmentos)
+        if shallow and isinstance(resultado, dict):
+            resultado = {k: True for k in resultado}
+        self._banco._registrar_leitura(self._segmentos, resultado)
+        return resultado
+
+    def set(self, value) -> None:
+        self._banco._definir(self._segmentos, value)
+        self._banco._notificar(self._segmentos, value)
+
+    def update(self, value: dict) -> None:
+        valores = {}
+        for caminho, valor in value.items():
+            segmentos = self._segmentos + _segmentos(caminho)
+            valores[caminho] = self._banco._resolver(segmentos, valor)
+            self._banco._definir(segmentos, valores[caminho])
+        self._banco._notificar_update(self._segmentos, valores)
+
+    def delete(self) -> None:
+        self._banco._definir(self._segmentos, None)
+        self._banco._notificar(self._segmentos, None)
+
+    def listen(self, callback) -> "FakeListenerRegistration":
+        registro = FakeListenerRegistration(self._banco, self._segmentos, callback)
+        self._banco.ouvintes.append(registro)
+        # Assim como o SDK, o primeiro evento entrega o conteúdo completo do nó.
+        callback(FakeEvent("put", "/", self._banco._obter(self._segmentos)))
+        return registro
+
+    def order_by_child(self, path: str) -> "FakeQuery":
+        return FakeQuery(self, path)
+
+    def order_by_key(self) -> "FakeQuery":
+        return FakeQuery(self, "$key")
+
+    def order_by_value(self) -> "FakeQuery":
+        return FakeQuery(self, "$value")
+
+
+class FakeEvent:
+    """
+    Equivalente em memória de ``firebase_admin.db.Event``.
+    """
+
+    def __init__(self, event_type: str, path: str, data):
+        self.event_type = event_type
+        self.path = path
+        self.data = data
+
+
+class FakeListenerRegistration:
+    """
+    Equivalente em memória de ``firebase_admin.db.ListenerRegistration``.
+    """
+
+    def __init__(self, banco: FakeDatabase, segmentos: list, callback):
+        self._banco = banco
+        self.segmentos = segmentos
+        self.callback = callback
+
+    def close(self) -> None:
+        if self in self._banco.ouvintes:
+            self._banco.ouvintes.remove(self)
+
+
+class FakeQuery:
+    """
+    Equivalente em memória de ``firebase_admin.db.Query``.
+    """
+
+    def __init__(self, ref: FakeReference, order_by: str):
+        self._ref = ref
+        self._order_by = order_by
+        self._inicio = None
+        self._fim = None
+        self._igual = None
+        self._primeiros = None
+        self._ultimos = None
+
+    def start_at(self, start) -> "FakeQuery":
+        self._inicio = start
+        return self
+
+    def end_at(self, end) -> "FakeQuery":
+        self._fim = end
+        return self
+
+    def equal_to(self, value) -> "FakeQuery":
+        self._igual = value
+        return self
+
+    def limit_to_first(self, limit: int) -> "FakeQuery":
+        self._primeiros = limit
+        return self
+
+    def limit_to_last(self, limit: int) -> "FakeQuery":
+        self._ultimos = limit
+        return self
+
+    def _indice(self, chave, valor):
+        if self._order_by == "$key":
+            return chave
+        if self._order_by == "$value":
+            return valor
+        atual = valor
+        for segmento in self._order_by.split("/"):
+            atual = atual.get(segmento) if isinstance(atual, dict) else None
+        return atual
+
+    @staticmethod
+    def _comparavel(a, b) -> bool:
+        numerico = (int, float)
+        if isinstance(a, bool) or isinstance(b, bool):
+            return isinstance(a, bool) and isinstance(b, bool)
+        return (isinstance(a, numerico) and isinstance(b, numerico)) or (
+            isinstance(a, str) and isinstance(b, str))
+
+    def _filtra(self, chave, valor) -> bool:
+        indice = self._indice(chave, valor)
+        if self._igual is not None:
+            return self._comparavel(indice, self._igual) and indice == self._igual
+        if self._inicio is not None:
+            if not self._comparavel(indice, self._inicio) or indice < self._inicio:
+                return False
+        if self._fim is not None:
+            if not self._comparavel(indice, self._fim) or indice > self._fim:
+                return False
+        return True
+
+    def get(self):
+        dados = self._ref._banco._obter(self._ref._segmentos) or {}
+        filtrados = {k: v for k, v in dados.items() if self._filtra(k, v)}
+        ordenados = list(_Sorter(filtrados, self._order_by).get().items())
+        if self._primeiros is not None:
+            ordenados = ordenados[:self._primeiros]
+        if self._ultimos is not None:
+            ordenados = ordenados[-self._ultimos:] if self._ultimos else []
+        resultado = _Sorter(dict(ordenados), self._order_by).get()
+        self._ref._banco._registrar_leitura(self._ref._segmentos, resultado)
+        return resultado
@@ -0,0 +1,57 @@
+"""
+Servidor HTTP local que expõe um FakeDatabase com a mesma interface da API
+REST do Realtime Database, usado pelos testes do serviço assíncrono.
+"""
+import asyncio
+import json
+from aiohttp import web
+from tests.fake_db import FakeDatabase
+
+
+class FakeRestServer:
+    """
+    Atende GET (com orderBy, equalTo, startAt, endAt, limitToFirst e
+    limitToLast) e PATCH em /<caminho>.json.
+    """
+
+    def __init__(self, banco: FakeDatabase):
+        self.banco = banco
+        # Conexões TCP distintas e pico de requisições simultâneas, para os testes
+        self.conexoes = set()
+        self.em_andamento = 0
+        self.pico = 0
+        self.app = web.Application()
+        self.app.router.add_route("*", "/{caminho:.*}", self._atender)
+
+    async def _atender(self, request: web.Request) -> web.Response:
+        self.conexoes.add(id(request.transport))
+        self.em_andamento += 1
+        self.pico = max(self.pico, self.em_andamento)
+        try:
+            if self.banco.latencia:
+                await asyncio.sleep(self.banco.latencia)
+            caminho = request.match_info["caminho"]
+            if not caminho.endswith(".json"):
+                return web.json_response({"error": "404 Not Found"}, status=404)
+            ref = self.banco.reference(caminho[:-len(".json")])
+
+            if request.method == "GET":
+                params = {k: json.loads(v) for k, v in request.query.items() if k != "access_token"}
+                if "orderBy" not in params:
+                    return web.json_response(ref.get())
+                ordem = params["orderBy"]
+                consulta = ref.order_by_key() if ordem == "$key" else ref.order_by_child(ordem)
+                for parametro, metodo in (("equalTo", "equal_to"), ("startAt", "start_at"), ("endAt", "end_at"),
+                                          ("limitToFirst", "limit_to_first"), ("limitToLast", "limit_to_last")):
+                    if parametro in params:
+                        consulta = getattr(consulta, metodo)(params[parametro])
+                return web.json_response(consulta.get())
+
+            if request.method == "PATCH":
+                corpo = await request.json()
+                ref.update(corpo)
+                return web.json_response(corpo)
+
+            return web.json_response({"error": "405 Method Not Allowed"}, status=405)
+        finally:
+            self.em_andamento -= 1
@@ -0,0 +1,75 @@
+from types import SimpleNamespace
+import firebase_admin
+import pytest
+from firebase_admin import auth
+from services.auth_service import AuthService
+from utils.cache import Cache
+
+class FakeAuth:
+    """Diretório de usuários em memória no lugar do Firebase Authentication."""
+
+    def __init__(self, uids):
+        self.usuarios = {uid: f"{uid}@exemplo.com" for uid in uids}
+        self.chamadas = []
+
+    def get_users(self, identificadores):
+        assert len(identificadores) <= 100
+        self.chamadas.append([i.uid for i in identificadores])
+        return SimpleNamespace(users=[
+            SimpleNamespace(uid=i.uid, email=self.usuarios[i.uid]) for i in identificadores if i.uid in self.usuarios
+        ])
+
+    def create_user(self, email, password):
+        uid = email.split("@")[0]
+        self.usuarios[uid] = email
+        return SimpleNamespace(uid=uid, email=email)
+
+    def delete_user(self, uid):
+        del self.usuarios[uid]
+
+@pytest.fixture
+def diretorio(monkeypatch):
+    fake = FakeAuth([f"user-{i}" for i in range(230)])
+    monkeypatch.setattr(firebase_admin, "_apps", {"[DEFAULT]": object()})
+    monkeypatch.setattr(firebase_admin, "get_app", lambda: SimpleNamespace(project_id=None))
+    monkeypatch.setattr("services.auth_service.FIREBASE_CONFIG", {})
+    for nome in ("get_users", "create_user", "delete_user"):
+        monkeypatch.setattr(auth, nome, getattr(fake, nome))
+    Cache().clear()
+    yield fake
+    Cache().clear()
+
+def test_obter_usuarios_em_blocos_e_cache(diretorio):
+    service = AuthService()
+    uids = [f"user-{i}" for i in range(250)]
+
+    usuarios = service.obter_usuarios(uids)
+
+    assert len(usuarios) == 230
+    assert usuarios["user-7"] == {"uid": "user-7", "email": "user-7@exemplo.com"}
+    assert [len(bloco) for bloco in diretorio.chamadas] == [100, 100, 50]
+
+    diretorio.chamadas.clear()
+    assert service.obter_usuarios(uids + uids) == usuarios
+    assert service.obter_usuario("user-3")["email"] == "user-3@exemplo.com"
+    assert service.obter_usuario("user-240") is None
+    assert diretorio.chamadas == []
+
+def test_uids_invalidos_sao_ignorados(diretorio):
+    service = AuthService()
+
+    usuarios = service.obter_usuarios(["user-1", "", None, "user-2"])
+
+    assert set(usuarios) == {"user-1", "user-2"}
+    assert diretorio.chamadas == [["user-1", "user-2"]]
+
+def test_criar_e_excluir_invalidam_o_cache(diretorio):
+    service = AuthService()
+    assert service.obter_usuario("nova") is None
+    assert service.obter_usuario("user-1") is not None
+
+    service.criar_usuario("nova@exemplo.com", "segredo")
+    service.excluir_usuario("user-1")
+
+    assert service.obter_usuario("nova")["email"] == "nova@exemplo.com"
+    assert service.obter_usuario("user-1") is None
@@ -0,0 +1,193 @@
+import threading
+import time
+from utils.cache import AUSENTE, Cache, CacheLRU
+from services.ponto_service import PontoService
+from tests.test_ponto_service import _dados
+
+def test_cache_compartilhado_e_unico():
+    assert Cache() is Cache()
+
+def test_lru_descarta_entrada_menos_usada():
+    cache = CacheLRU(tamanho_maximo=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+def test_expiracao_e_varredura():
+    cache = CacheLRU(ttl=0.01, intervalo_limpeza=0)
+    cache.set("a", 1)
+    cache.set("b", 2, ttl=60)
+    time.sleep(0.02)
+
+    assert cache.get("a") is None
+    cache.set("c", 3)
+    assert len(cache) == 2
+    assert cache.stats()["expirations"] == 1
+
+def test_invalidacao_por_tag():
+    cache = CacheLRU()
+    cache.set("listar", [1], tags=["listagem"])
+    cache.set("buscar", [2], tags=["listagem"])
+    cache.set("ponto_1", 1, tags=["ponto:1"])
+    cache.invalidate_tag("listagem")
+
+    assert cache.get("listar") is None
+    assert cache.get("buscar") is None
+    assert cache.get("ponto_1") == 1
+
+def test_contadores():
+    cache = CacheLRU()
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("b")
+    assert cache.stats() == {
+        "hits": 1, "misses": 1, "evictions": 0, "expirations": 0,
+        "negative_hits": 0, "negative_stores": 0, "size": 1
+    }
+
+def test_exclusao_preserva_cache_de_outros_pontos(banco):
+    service = PontoService()
+    id_a = service.cadastrar_ponto(_dados("A"))
+    id_b = service.cadastrar_ponto(_dados("B"))
+    service.buscar_por_id(id_a)
+    service.listar_pontos()
+
+    service.excluir_ponto(id_b)
+    banco.leituras.clear()
+    service.buscar_por_id(id_a)
+    assert banco.leituras == []
+
+    assert [p.nome for p in service.listar_pontos()[0]] == ["A"]
+
+def test_carga_unica_com_sessoes_concorrentes(banco):
+    service = PontoService()
+    for nome in ["A", "B", "C"]:
+        service.cadastrar_ponto(_dados(nome))
+    banco.latencia = 0.05
+    banco.leituras.clear()
+
+    barreira = threading.Barrier(20)
+    resultados = []
+
+    def sessao():
+        barreira.wait()
+        resultados.append(service.listar_pontos(pagina=1))
+
+    threads = [threading.Thread(target=sessao) for _ in range(20)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(banco.leituras) == 1
+    assert len(resultados) == 20
+    assert all([p.nome for p in pontos] == ["A", "B", "C"] for pontos, _ in resultados)
+
+def test_erro_na_carga_e_repassado_e_nao_fica_em_cache():
+    cache = CacheLRU()
+    chamadas = []
+
+    def falha():
+        chamadas.append(1)
+        raise RuntimeError("Firebase indisponível")
+
+    for _ in range(2):
+        try:
+            cache.obter_ou_carregar("chave", falha)
+        except RuntimeError:
+            pass
+    assert len(chamadas) == 2
+    assert cache.obter_ou_carregar("chave", lambda: 42) == 42
+
+def test_invalidacao_descarta_apenas_cargas_com_a_tag():
+    cache = CacheLRU()
+    liberar = threading.Event()
+    cargas = []
+
+    def carregar():
+        cargas.append(1)
+        liberar.wait(1)
+        return [len(cargas)]
+
+    def carregar_em_paralelo():
+        thread = threading.Thread(target=cache.obter_ou_carregar, args=("listar", carregar, ["listagem"]))
+        thread.start()
+        while not cargas:
+            time.sleep(0.001)
+        return thread
+
+    # Invalidar outra tag não afeta a carga em andamento: quem chega depois a aguarda
+    primeira = carregar_em_paralelo()
+    cache.invalidate_tag("ponto:1")
+    segunda = threading.Thread(target=cache.obter_ou_carregar, args=("listar", carregar, ["listagem"]))
+    segunda.start()
+    liberar.set()
+    primeira.join()
+    segunda.join()
+    assert len(cargas) == 1
+    assert cache.get("listar") == [1]
+
+    # Invalidar a tag da carga descarta o resultado dela
+    cache.invalidate("listar")
+    liberar.clear()
+    primeira = carregar_em_paralelo()
+    cache.invalidate_tag("listagem")
+    liberar.set()
+    primeira.join()
+    assert cache.get("listar", AUSENTE) is AUSENTE
+
+def test_valor_obsoleto_servido_enquanto_recarrega():
+    cache = CacheLRU(ttl=60, tempo_obsoleto=60)
+    cache.obter_ou_carregar("chave", lambda: "antigo", ttl=0.01)
+    time.sleep(0.02)
+    recarregado = threading.Event()
+
+    def recarregar():
+        recarregado.set()
+        return "novo"
+
+    assert cache.obter_ou_carregar("chave", recarregar) == "antigo"
+    assert recarregado.wait(1)
+    for _ in range(100):
+        if cache.get("chave") == "novo":
+            break
+        time.sleep(0.01)
+    assert cache.get("chave") == "novo"
+
+def test_valores_vazios_sao_cacheados():
+    cache = CacheLRU()
+    cache.set("vazio", [], negativo=True)
+    cache.set("nulo", None, negativo=True)
+
+    assert cache.get("vazio", AUSENTE) == []
+    assert cache.get("nulo", AUSENTE) is None
+    assert cache.get("inexistente", AUSENTE) is AUSENTE
+    assert cache.stats()["negative_hits"] == 2
+
+def test_cache_negativo_expira_antes():
+    cache = CacheLRU(ttl=60, ttl_negativo=0.01)
+    cache.obter_ou_carregar("vazio", lambda: [])
+    cache.obter_ou_carregar("cheio", lambda: [1])
+    time.sleep(0.02)
+
+    assert cache.get("vazio", AUSENTE) is AUSENTE
+    assert cache.get("cheio") == [1]
+
+def test_consultas_vazias_repetidas_nao_voltam_ao_firebase(banco):
+    service = PontoService()
+    service.cadastrar_ponto(_dados("Museu"))
+    banco.leituras.clear()
+
+    for _ in range(5):
+        assert service.buscar_por_id("id-inexistente") is None
+        assert service.buscar_pontos("termo sem resultado") == []
+        assert service.listar_pontos(pagina=99) == ([], 1)
+
+    assert len(banco.leituras) == 3
+    assert Cache().stats()["negative_hits"] >= 12
@@ -0,0 +1,41 @@
+import threading
+import pytest
+from firebase import firebase_config
+from services import ponto_index
+from services.container import Servicos
+from services.ponto_index import PontoIndex
+
+@pytest.fixture
+def servicos(banco, monkeypatch):
+    inicializacoes = []
+    monkeypatch.setattr(firebase_config, "init_firebase", lambda: inicializacoes.append(1) or object())
+    monkeypatch.setattr(ponto_index, "INDICE_SNAPSHOT_CAMINHO", "")
+    monkeypatch.setattr(PontoIndex, "_compartilhado", None)
+    servicos = Servicos()
+    servicos.inicializacoes = inicializacoes
+    yield servicos
+    if PontoIndex._compartilhado is not None:
+        PontoIndex._compartilhado.parar()
+
+def test_servicos_criados_uma_vez_entre_threads(servicos):
+    obtidos = []
+    barreira = threading.Barrier(8)
+
+    def obter():
+        barreira.wait()
+        obtidos.append(servicos.ponto_service)
+
+    threads = [threading.Thread(target=obter) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len({id(service) for service in obtidos}) == 1
+    assert obtidos[0].indice is PontoIndex._compartilhado
+    assert servicos.inicializacoes == [1]
+    assert set(servicos.tempos) == {"firebase_app", "referencia_pontos", "ponto_service"}
+    assert all(tempo >= 0 for tempo in servicos.tempos.values())
+
+def test_container_compartilhado():
+    assert Servicos.compartilhado() is Servicos.compartilhado()
@@ -0,0 +1,127 @@
+import io
+import json
+import pytest
+from services.importacao import ler_csv, ler_geojson, ler_jsonl, escrever_arquivo, detectar_formato
+from services.ponto_service import PontoService
+from tests.test_ponto_service import _dados
+
+CSV = """nome,descricao,tipo,latitude,longitude,criado_por
+Museu Casa do Cantador,Acervo de repente,Museu,-7.1,-34.8,user-1
+Sem tipo,,,-7.1,-34.8,user-1
+Feira da Prata,Feira tradicional,Feira,-7.22,-35.88,user-1
+Coordenada ruim,,Teatro,abc,-34.8,user-1
+"""
+
+def test_importar_lote_relata_erros_por_registro(banco):
+    service = PontoService()
+    relatorio = service.importar_lote(ler_csv(io.StringIO(CSV)), tamanho_lote=1)
+
+    assert relatorio.total == 4
+    assert len(relatorio.importados) == 2
+    assert [posicao for posicao, _ in relatorio.erros] == [2, 4]
+    assert "Tipo é obrigatório" in relatorio.erros[0][1]
+    assert service.contar_pontos() == 2
+    assert service.contar_pontos(tipo="Feira") == 1
+
+def test_registros_ilegiveis_sao_relatados_sem_interromper(banco):
+    service = PontoService()
+    linhas = [json.dumps(_dados("A")), json.dumps(_dados("B")), '{"nome": "quebrado"', json.dumps(_dados("C"))]
+    relatorio = service.importar_lote(ler_jsonl(io.StringIO("\n".join(linhas))), tamanho_lote=2)
+
+    assert len(relatorio.importados) == 3
+    assert [posicao for posicao, _ in relatorio.erros] == [3]
+    assert "linha 3" in relatorio.erros[0][1]
+
+    colecao = {"type": "FeatureCollection", "features": [
+        {"type": "Feature", "geometry": {"type": "LineString", "coordinates": [[-34.8, -7.1], [-34.9, -7.2]]},
+         "properties": {"nome": "Rota", "tipo": "Evento"}},
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [-34.8, -7.1]},
+         "properties": {"nome": "Ponto", "tipo": "Museu", "criado_por": "user-1"}},
+    ]}
+    relatorio = service.importar_lote(ler_geojson(io.StringIO(json.dumps(colecao))))
+
+    assert len(relatorio.importados) == 1
+    assert relatorio.erros == [(1, "Geometria LineString não suportada; apenas Point")]
+    assert service.contar_pontos() == 4
+
+def test_features_com_geometria_malformada_sao_relatadas(banco):
+    ponto = {"type": "Feature", "geometry": {"type": "Point", "coordinates": [-34.8, -7.1]},
+             "properties": {"nome": "Ponto", "tipo": "Museu", "criado_por": "user-1"}}
+    colecao = {"type": "FeatureCollection", "features": [
+        {**ponto, "geometry": {"type": "Point", "coordinates": []}},
+        {**ponto, "geometry": {"type": "Point", "coordinates": [-34.8]}},
+        {**ponto, "geometry": "Point"},
+        ponto,
+    ]}
+    relatorio = PontoService().importar_lote(ler_geojson(io.StringIO(json.dumps(colecao))))
+
+    assert len(relatorio.importados) == 1
+    assert relatorio.erros == [
+        (1, "Point deve ter longitude e latitude"),
+        (2, "Point deve ter longitude e latitude"),
+        (3, "Geometria deve ser um objeto"),
+    ]
+
+def test_tipo_ou_criador_que_nao_e_texto_invalida_apenas_o_registro(banco):
+    service = PontoService()
+    registros = [_dados("A"), {**_dados("B"), "tipo": ["Museu"]}, {**_dados("C"), "criado_por": {"uid": "x"}}, _dados("D")]
+    relatorio = service.importar_lote(registros)
+
+    assert len(relatorio.importados) == 2
+    assert relatorio.erros == [(2, "Tipo é obrigatório"), (3, "ID do criador é obrigatório")]
+    assert service.contar_pontos() == 2
+
+def test_importar_lote_agrupa_escritas(banco, monkeypatch):
+    service = PontoService()
+    escritas = []
+    atualizar = service.repositorio.raiz.update
+    monkeypatch.setattr(service.repositorio.raiz, "update", lambda valor: (escritas.append(len(valor)), atualizar(valor)))
+
+    relatorio = service.importar_lote((_dados(f"Ponto {i}") for i in range(25)), tamanho_lote=10)
+
+    assert len(relatorio.importados) == 25
+    assert len(escritas) == 3
+    assert len(banco.dados["pontos"]) == 25
+
+def test_exportar_percorre_em_blocos(banco):
+    service = PontoService()
+    service.importar_lote(_dados(f"Ponto {i:02d}") for i in range(23))
+    banco.leituras.clear()
+
+    exportados = list(service.exportar(tamanho_lote=5))
+
+    assert len(exportados) == 23
+    assert len({p.id for p in exportados}) == 23
+    assert max(total for _, total in banco.leituras) <= 6
+
+@pytest.mark.parametrize("formato", ["csv", "jsonl", "geojson"])
+def test_ida_e_volta_pelos_formatos(banco, formato):
+    service = PontoService()
+    service.importar_lote([_dados("São João"), _dados("Teatro Ariano Suassuna", tipo="Teatro")])
+
+    arquivo = io.StringIO()
+    assert escrever_arquivo(service.exportar(), arquivo, formato) == 2
+    arquivo.seek(0)
+    leitor = {"csv": ler_csv, "jsonl": ler_jsonl, "geojson": ler_geojson}[formato]
+    registros = sorted(leitor(arquivo), key=lambda r: r["nome"])
+
+    assert [r["nome"] for r in registros] == ["São João", "Teatro Ariano Suassuna"]
+    assert float(registros[0]["latitude"]) == -7.1
+    assert float(registros[0]["longitude"]) == -34.8
+
+def test_geojson_lido_em_blocos_pequenos():
+    colecao = {"type": "FeatureCollection", "features": [
+        {"type": "Feature", "geometry": {"type": "Point", "coordinates": [-34.8, -7.1 - i]},
+         "properties": {"nome": f"Ponto {i}", "tipo": "Museu"}}
+        for i in range(5)
+    ]}
+    registros = list(ler_geojson(io.StringIO(json.dumps(colecao)), tamanho_bloco=7))
+
+    assert [r["nome"] for r in registros] == [f"Ponto {i}" for i in range(5)]
+    assert registros[4]["latitude"] == -11.1
+
+def test_detectar_formato():
+    assert detectar_formato("pontos.CSV") == "csv"
+    assert detectar_formato("pontos.ndjson") == "jsonl"
+    with pytest.raises(ValueError, match="Formato não reconhecido"):
+        detectar_formato("pontos.xlsx")
@@ -0,0 +1,38 @@
+import pytest
+from utils.indice_espacial import IndiceEspacial, distancia_km
+
+# Coordenadas aproximadas de João Pessoa, Campina Grande e Recife
+JOAO_PESSOA = (-7.115, -34.863)
+CAMPINA_GRANDE = (-7.230, -35.881)
+RECIFE = (-8.047, -34.877)
+
+def _indice():
+    indice = IndiceEspacial(tamanho_celula=0.05)
+    indice.adicionar("jp", *JOAO_PESSOA)
+    indice.adicionar("cg", *CAMPINA_GRANDE)
+    indice.adicionar("re", *RECIFE)
+    return indice
+
+def test_distancia_haversine():
+    assert distancia_km(*JOAO_PESSOA, *RECIFE) == pytest.approx(103.6, abs=1.0)
+    assert distancia_km(*JOAO_PESSOA, *JOAO_PESSOA) == 0
+
+def test_buscar_proximos_ordena_por_distancia():
+    resultado = _indice().buscar_proximos(*JOAO_PESSOA, raio_km=150)
+    assert [id_ponto for id_ponto, _ in resultado] == ["jp", "re", "cg"]
+    assert [id_ponto for id_ponto, _ in _indice().buscar_proximos(*JOAO_PESSOA, raio_km=50)] == ["jp"]
+
+def test_buscar_na_area():
+    indice = _indice()
+    assert sorted(indice.buscar_na_area((-7.5, -36.0, -7.0, -34.0))) == ["cg", "jp"]
+    assert indice.buscar_na_area((-90, -180, 90, 180)) != []
+    with pytest.raises(ValueError, match="Área inválida"):
+        indice.buscar_na_area((-7.0, -34.0, -7.5, -36.0))
+
+def test_mover_e_remover_ponto():
+    indice = _indice()
+    indice.adicionar("jp", *RECIFE)
+    assert sorted(indice.buscar_na_area((-8.1, -35.0, -8.0, -34.8))) == ["jp", "re"]
+    indice.remover("jp")
+    indice.remover("inexistente")
+    assert len(indice) == 2
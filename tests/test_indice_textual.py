@@ -0,0 +1,33 @@
+from utils.indice_textual import IndiceTextual, normalizar, tokenizar
+
+def _indice():
+    indice = IndiceTextual()
+    indice.adicionar("1", {"nome": "Festa de São João", "descricao": "Quadrilhas e forró", "tipo": "Evento"})
+    indice.adicionar("2", {"nome": "Teatro Santa Roza", "descricao": "Teatro histórico de João Pessoa", "tipo": "Teatro"})
+    indice.adicionar("3", {"nome": "Museu do Forró", "descricao": "Acervo de Luiz Gonzaga", "tipo": "Museu"})
+    return indice
+
+def test_normalizacao_remove_acentos():
+    assert normalizar("São JOÃO") == "sao joao"
+    assert tokenizar("Forró, pé-de-serra!") == ["forro", "pe", "de", "serra"]
+
+def test_busca_sem_acentos():
+    assert [id_doc for id_doc, _ in _indice().buscar("sao joao")] == ["1"]
+
+def test_busca_por_prefixo_exige_todos_os_termos():
+    indice = _indice()
+    assert {id_doc for id_doc, _ in indice.buscar("forr")} == {"1", "3"}
+    assert [id_doc for id_doc, _ in indice.buscar("forr mus")] == ["3"]
+    assert indice.buscar("forr teatro") == []
+
+def test_ranking_prioriza_nome_e_termo_exato():
+    resultados = _indice().buscar("teatro")
+    assert resultados[0][0] == "2"
+    assert [id_doc for id_doc, _ in _indice().buscar("joao")] == ["1", "2"]
+
+def test_remocao_atualiza_trie():
+    indice = _indice()
+    indice.remover("3")
+    assert indice.termos_com_prefixo("mus") == []
+    assert [id_doc for id_doc, _ in indice.buscar("forro")] == ["1"]
+    assert len(indice) == 2
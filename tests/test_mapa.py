@@ -0,0 +1,109 @@
+from folium.plugins import FastMarkerCluster, MarkerCluster
+from models.ponto_cultural import PontoCultural
+from services.ponto_service import PontoService
+from tests.test_ponto_index import _servico_indexado
+from tests.test_ponto_service import _dados
+from utils import mapa
+from utils.mapa import (
+    AREA_MUNDO, agrupar, area_do_viewport, area_inicial, camada_viewport, html_mapa, marcadores_visiveis, montar_mapa
+)
+from config import MAPA_CENTRO
+
+def _pontos(quantidade):
+    return [PontoCultural.from_dict(_dados(f"Ponto {i}"), str(i)) for i in range(quantidade)]
+
+def _camadas(m):
+    return [type(filho) for filho in m._children.values()]
+
+def test_poucos_pontos_usam_marker_cluster():
+    m = montar_mapa(_pontos(3), limiar_rapido=10)
+    assert MarkerCluster in _camadas(m)
+    assert FastMarkerCluster not in _camadas(m)
+
+def test_muitos_pontos_usam_fast_marker_cluster():
+    m = montar_mapa(_pontos(11), limiar_rapido=10)
+    assert FastMarkerCluster in _camadas(m)
+
+def test_textos_dos_marcadores_sao_escapados():
+    ponto = PontoCultural.from_dict(_dados("<script>alert(1)</script>"), "x")
+    html = montar_mapa([ponto]).get_root().render()
+    assert "<script>alert(1)</script>" not in html
+
+def test_html_reaproveitado_ate_os_pontos_mudarem(banco, monkeypatch):
+    renderizacoes = []
+    renderizar = mapa._renderizar
+    monkeypatch.setattr(mapa, "_renderizar", lambda *args: renderizacoes.append(args[1:]) or renderizar(*args))
+    service = PontoService()
+    service.cadastrar_ponto(_dados("Alfa"))
+
+    primeiro = html_mapa(service)
+    assert html_mapa(service) is primeiro
+    html_mapa(service, tipo="Teatro")
+    assert len(renderizacoes) == 2
+
+    service.cadastrar_ponto(_dados("Beta"))
+    assert "Beta" in html_mapa(service)
+    assert len(renderizacoes) == 3
+
+def test_versao_do_indice_faz_parte_da_chave(banco):
+    service, _ = _servico_indexado(banco)
+    vazio = html_mapa(service)
+
+    # Alteração externa, vista apenas pelo índice
+    banco.reference("pontos").child("x").set(PontoCultural.from_dict(_dados("Xilogravura")).to_dict())
+
+    assert "Xilogravura" not in vazio
+    assert "Xilogravura" in html_mapa(service)
+
+def _limites(lat_min, lon_min, lat_max, lon_max):
+    return {"_southWest": {"lat": lat_min, "lng": lon_min}, "_northEast": {"lat": lat_max, "lng": lon_max}}
+
+def _em(nome, latitude, longitude, tipo="Museu"):
+    return PontoCultural.from_dict({**_dados(nome, tipo=tipo), "latitude": latitude, "longitude": longitude}, nome)
+
+def test_area_do_viewport():
+    assert area_do_viewport(None) == area_inicial()
+    assert area_do_viewport(_limites(-8, -38, -6, -34)) == (-8, -38, -6, -34)
+    # O Leaflet devolve longitudes fora de ±180 quando o mapa dá a volta no mundo
+    assert area_do_viewport(_limites(-95, -400, 95, 400)) == AREA_MUNDO
+
+def test_area_inicial_cobre_o_mapa_na_posicao_inicial():
+    lat_min, lon_min, lat_max, lon_max = area_inicial(largura=700, altura=400)
+    assert lat_min < MAPA_CENTRO[0] < lat_max and lon_min < MAPA_CENTRO[1] < lon_max
+    # 700 pixels no zoom 6 (tiles de 256 pixels) correspondem a pouco mais de 15 graus
+    assert abs((lon_max - lon_min) - 700 * 360 / (256 * 2 ** 6)) < 1e-9
+    assert 8 < lat_max - lat_min < 9
+    assert abs((lat_max + lat_min) / 2 - MAPA_CENTRO[0]) < 0.1
+
+def test_agrupa_pontos_proximos_em_zoom_baixo():
+    pontos = [_em("A", -7.11, -34.86), _em("B", -7.12, -34.87), _em("C", -6.5, -36.0)]
+
+    grupos = sorted(agrupar(pontos, zoom=6), key=lambda g: g.quantidade)
+    assert [g.quantidade for g in grupos] == [1, 2]
+    assert grupos[0].ponto.nome == "C"
+    assert grupos[1].ponto is None
+    assert abs(grupos[1].latitude - (-7.115)) < 1e-9
+
+    assert [g.quantidade for g in agrupar(pontos, zoom=16)] == [1, 1, 1]
+
+def test_marcadores_visiveis_consultam_so_a_area(banco):
+    service, _ = _servico_indexado(banco)
+    service.cadastrar_ponto({**_dados("Joao Pessoa"), "latitude": -7.115, "longitude": -34.863})
+    service.cadastrar_ponto({**_dados("Teatro", tipo="Teatro"), "latitude": -7.12, "longitude": -34.88})
+    service.cadastrar_ponto({**_dados("Recife"), "latitude": -8.047, "longitude": -34.877})
+    area = (-7.2, -35.0, -7.0, -34.8)
+
+    visiveis = marcadores_visiveis(service, area, zoom=16)
+    assert sorted(m.ponto.nome for m in visiveis) == ["Joao Pessoa", "Teatro"]
+    assert [m.ponto.nome for m in marcadores_visiveis(service, area, zoom=16, tipo="Museu")] == ["Joao Pessoa"]
+
+def test_quantidade_de_marcadores_nao_depende_do_catalogo(banco):
+    service, _ = _servico_indexado(banco, {
+        str(i): {**_dados(f"Ponto {i}"), "latitude": -7 + i * 1e-4, "longitude": -35 + i * 1e-4}
+        for i in range(500)
+    })
+
+    camada = camada_viewport(service, None, zoom=6)
+    assert len(camada._children) == 1
+    # A área é ampliada até as bordas das células, mas segue restrita ao que está visível
+    assert 10 <= len(camada_viewport(service, _limites(-7.001, -35.001, -6.999, -34.999), zoom=18)._children) < 20
@@ -0,0 +1,82 @@
+import pytest
+from services.ponto_service import PontoService
+from utils import metricas as modulo_metricas
+from utils.metricas import Metricas, medir, metricas
+
+@pytest.fixture
+def coleta(monkeypatch):
+    monkeypatch.setattr(metricas, "habilitadas", True)
+    metricas.limpar()
+    yield metricas
+    metricas.limpar()
+
+def _serie(snapshot, nome, **rotulos):
+    return next(serie for serie in snapshot["histogramas"][nome] if serie["rotulos"] == rotulos)
+
+def test_histograma_e_formato_prometheus():
+    registro = Metricas(habilitadas=True)
+    for valor in (0.002, 0.003, 0.02, 3.0):
+        registro.observar("teste_duracao_segundos", valor, metodo='a"b')
+    registro.incrementar("teste_erros_total", metodo="x")
+    registro.registrar_coletor("cache", lambda: {"hits": 5, "size": 2}, medidores=("size",), cache="c1")
+
+    texto = registro.prometheus()
+
+    assert "# TYPE rota_cultural_teste_duracao_segundos histogram" in texto
+    assert 'rota_cultural_teste_duracao_segundos_bucket{metodo="a\\"b",le="0.005"} 2' in texto
+    assert 'rota_cultural_teste_duracao_segundos_bucket{metodo="a\\"b",le="+Inf"} 4' in texto
+    assert 'rota_cultural_teste_duracao_segundos_count{metodo="a\\"b"} 4' in texto
+    assert 'rota_cultural_teste_erros_total{metodo="x"} 1' in texto
+    assert "# TYPE rota_cultural_cache_hits_total counter" in texto
+    assert 'rota_cultural_cache_size{cache="c1"} 2' in texto
+
+    serie = _serie(registro.snapshot(), "teste_duracao_segundos", metodo='a"b')
+    assert serie["quantidade"] == 4
+    assert 0.0025 <= serie["p50"] <= 0.005
+    assert serie["faixas"]["+Inf"] == 4
+
+def test_desabilitadas_nao_medem(monkeypatch):
+    monkeypatch.setattr(metricas, "habilitadas", False)
+    metricas.limpar()
+
+    def serializar(dados):
+        raise AssertionError("dados serializados com a coleta desativada")
+    monkeypatch.setattr(modulo_metricas, "tamanho_json", serializar)
+
+    @medir("teste", quantidade=len)
+    def listar():
+        return [1, 2]
+
+    assert listar() == [1, 2]
+    with metricas.cronometrar("teste", operacao="x"):
+        pass
+    metricas.observar_tamanho("teste_bytes", {"a": 1})
+
+    snapshot = metricas.snapshot()
+    assert snapshot["histogramas"] == {} and snapshot["contadores"] == {}
+
+def test_ponto_service_instrumentado(banco, coleta):
+    service = PontoService()
+    for i in range(3):
+        service.cadastrar_ponto({
+            "nome": f"Ponto {i}", "descricao": "Descrição", "tipo": "Museu",
+            "latitude": -7.1, "longitude": -34.8, "criado_por": "user-1"
+        })
+    service.listar_recentes(2)
+    service.listar_recentes(2)
+    service.repositorio.ref = None
+    with pytest.raises(AttributeError):
+        service.buscar_pontos("museu")
+
+    snapshot = coleta.snapshot()
+    assert _serie(snapshot, "ponto_service_duracao_segundos", metodo="listar_recentes")["quantidade"] == 2
+    assert _serie(snapshot, "ponto_service_registros", metodo="listar_recentes")["soma"] == 4
+    assert _serie(snapshot, "firebase_duracao_segundos", operacao="inserir")["quantidade"] == 3
+    # A segunda listagem vem do cache
+    assert _serie(snapshot, "firebase_duracao_segundos", operacao="listar_recentes")["quantidade"] == 1
+    assert _serie(snapshot, "firebase_resposta_bytes", operacao="listar_recentes")["soma"] > 0
+    assert snapshot["contadores"]["ponto_service_erros_total"] == [
+        {"rotulos": {"metodo": "buscar_pontos"}, "valor": 1}
+    ]
+    cache = next(c for c in snapshot["coletores"] if c["rotulos"] == {"cache": "servicos"})
+    assert cache["valores"]["hits"] >= 1
@@ -0,0 +1,57 @@
+import pytest
+from models.ponto_colecao import PontoColecao, validar_lote
+from models.ponto_cultural import PontoCultural
+
+REGISTROS = {
+    "c": {"nome": "Casa do Cantador", "descricao": "", "tipo": "Museu", "latitude": "-7.1", "longitude": "-34.8", "criado_por": "u1"},
+    "a": {"nome": "Arena Cultural", "descricao": "", "tipo": "Teatro", "latitude": -7.2, "longitude": -35.9, "criado_por": "u2"},
+    "b": {"nome": "Beco da Cultura", "descricao": "", "tipo": "Museu", "latitude": "-8.0", "longitude": "-34.9", "criado_por": "u1"},
+}
+
+def test_colunas_e_tabelas_internadas():
+    colecao = PontoColecao.from_registros(REGISTROS)
+    assert len(colecao) == 3
+    assert colecao.tipos == ["Museu", "Teatro"]
+    assert colecao.criadores == ["u1", "u2"]
+    assert list(colecao.latitudes) == [-7.1, -7.2, -8.0]
+
+def test_filtrar_ordenar_e_materializar():
+    colecao = PontoColecao.from_registros(REGISTROS)
+    linhas = colecao.ordenar_por_nome(colecao.filtrar_tipo("Museu"))
+    pontos = colecao.materializar(linhas)
+
+    assert [p.nome for p in pontos] == ["Beco da Cultura", "Casa do Cantador"]
+    assert pontos[0] == PontoCultural.from_dict(REGISTROS["b"], "b")
+    assert colecao.filtrar_tipo("Feira") == []
+    assert colecao.materializar(colecao.filtrar_area((-7.5, -36.0, -7.0, -35.0)))[0].id == "a"
+
+def test_coordenada_invalida():
+    with pytest.raises(ValueError, match="Latitude e longitude devem ser números válidos"):
+        PontoColecao.from_registros({"x": {"nome": "X", "latitude": "abc"}})
+
+def test_ponto_cultural_sem_dict_de_instancia():
+    ponto = PontoCultural.from_dict(REGISTROS["a"], "a")
+    assert not hasattr(ponto, "__dict__")
+
+def test_validar_lote_relata_todos_os_erros_por_linha():
+    registros = {
+        **REGISTROS,
+        "x": {"nome": " ", "tipo": "Circo", "latitude": "abc", "longitude": 0, "criado_por": ""},
+        "y": {"nome": "Y", "tipo": "", "latitude": 95, "longitude": -181, "criado_por": "u1"},
+    }
+    relatorio = validar_lote(PontoColecao.from_registros(registros, estrito=False))
+
+    assert relatorio.total == 5
+    assert not relatorio.valido
+    erros = relatorio.por_linha()
+    assert sorted(erros) == [3, 4]
+    assert erros[3][0] == "Nome é obrigatório"
+    assert erros[3][1].startswith("Tipo inválido")
+    assert erros[3][2:] == ["Latitude e longitude devem ser números válidos", "ID do criador é obrigatório"]
+    assert erros[4] == ["Tipo é obrigatório", "Latitude deve estar entre -90.0 e 90.0", "Longitude deve estar entre -180.0 e 180.0"]
+    assert {id_ponto for _, id_ponto, _ in relatorio.erros} == {"x", "y"}
+
+def test_validar_lote_concorda_com_validar():
+    colecao = PontoColecao.from_registros(REGISTROS)
+    assert validar_lote(colecao).valido
+    assert all(ponto.validar() for ponto in colecao.materializar(colecao.linhas()))
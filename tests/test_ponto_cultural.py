@@ -75,8 +75,8 @@ def test_conversao_para_dict():
     dict_ponto = ponto.to_dict()
     assert dict_ponto["nome"] == "Museu do Amanhã"
     assert dict_ponto["tipo"] == "Museu"
-    assert dict_ponto["latitude"] == "-22.8947"
-    assert dict_ponto["longitude"] == "-43.1802"
+    assert dict_ponto["latitude"] == -22.8947
+    assert dict_ponto["longitude"] == -43.1802
 
 def test_criacao_a_partir_de_dict():
     dict_ponto = {
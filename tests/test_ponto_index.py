@@ -0,0 +1,148 @@
+from models.ponto_cultural import PontoCultural
+from services.ponto_index import PontoIndex
+from services.ponto_service import PontoService
+from tests.fake_db import FakeEvent
+from tests.test_ponto_service import _dados
+
+def _servico_indexado(banco, dados=None):
+    banco.dados = {"pontos": dados or {}}
+    indice = PontoIndex()
+    indice.iniciar(timeout=1)
+    return PontoService(indice=indice), indice
+
+def test_indice_carrega_no_primeiro_evento(banco):
+    service, indice = _servico_indexado(banco, {
+        "b": {**_dados("Beta"), "latitude": "-7.1", "longitude": "-34.8"},
+        "a": {**_dados("Alfa", tipo="Teatro"), "latitude": "-7.2", "longitude": "-34.9"},
+    })
+
+    assert indice.pronto
+    assert [p.nome for p in indice.todos()] == ["Alfa", "Beta"]
+    assert [p.nome for p in service.listar_pontos(tipo="Teatro")[0]] == ["Alfa"]
+
+def test_leituras_atendidas_em_memoria(banco):
+    service, _ = _servico_indexado(banco)
+    id_ponto = service.cadastrar_ponto(_dados("Museu Casa do Artista"))
+    banco.leituras.clear()
+
+    assert service.buscar_por_id(id_ponto).nome == "Museu Casa do Artista"
+    assert [p.id for p in service.buscar_pontos("artista")] == [id_ponto]
+    assert service.listar_pagina()[0][0].id == id_ponto
+    assert banco.leituras == []
+
+def test_indice_aplica_alteracoes_externas(banco):
+    _, indice = _servico_indexado(banco)
+    ref = banco.reference("pontos")
+
+    ref.child("x").set(PontoCultural.from_dict(_dados("Xilogravura")).to_dict())
+    assert indice.obter("x").nome == "Xilogravura"
+
+    ref.child("x/nome").set("Xilogravura Popular")
+    assert [p.nome for p in indice.todos()] == ["Xilogravura Popular"]
+
+    ref.update({"x": None})
+    assert indice.obter("x") is None
+    assert len(indice) == 0
+
+def test_exclusao_pelo_servico_atualiza_indice(banco):
+    service, indice = _servico_indexado(banco)
+    ids = [service.cadastrar_ponto(_dados(nome)) for nome in ["A", "B", "C"]]
+    versao = indice.versao
+
+    service.excluir_ponto(ids[1])
+
+    assert [p.nome for p in indice.todos()] == ["A", "C"]
+    assert indice.versao > versao
+
+def test_exclusao_de_ponto_desconhecido_pelo_indice_atualiza_contadores(banco):
+    service, indice = _servico_indexado(banco)
+    service.cadastrar_ponto(_dados("A"))
+    # Ponto gravado sem que o índice o veja, como ao servir de uma cópia local antiga
+    banco.dados["pontos"]["x"] = _dados("X", tipo="Feira")
+    banco.dados["contadores"]["pontos"] = {"total": 2, "tipos": {"Museu": 1, "Feira": 1}}
+    assert indice.obter("x") is None
+
+    service.excluir_ponto("x")
+
+    assert "x" not in banco.dados["pontos"]
+    assert banco.dados["contadores"]["pontos"] == {"total": 1, "tipos": {"Museu": 1, "Feira": 0}}
+
+def test_consultas_espaciais_pelo_servico(banco):
+    service, _ = _servico_indexado(banco)
+    perto = service.cadastrar_ponto({**_dados("Perto"), "latitude": -7.115, "longitude": -34.863})
+    service.cadastrar_ponto({**_dados("Longe"), "latitude": -8.047, "longitude": -34.877})
+
+    assert [p.id for p in service.buscar_proximos(-7.12, -34.86, raio_km=5)] == [perto]
+    assert [p.nome for p in service.buscar_na_area((-7.2, -35.0, -7.0, -34.8))] == ["Perto"]
+
+def test_contagens_pelo_indice(banco):
+    service, indice = _servico_indexado(banco)
+    for i in range(12):
+        service.cadastrar_ponto(_dados(f"Ponto {i:02d}"))
+    service.cadastrar_ponto(_dados("Feira Livre", tipo="Feira"))
+
+    assert service.contar_pontos() == 13
+    assert service.contar_pontos(tipo="Feira") == 1
+    assert service.listar_pontos(pagina=2)[1] == 2
+    assert banco.dados["contadores"]["pontos"]["total"] == 13
+
+class _RefSemResposta:
+    """Referência cujo listener ainda não recebeu a carga inicial do Firebase."""
+
+    def __init__(self):
+        self.callback = None
+
+    def listen(self, callback):
+        self.callback = callback
+        return self
+
+    def close(self):
+        pass
+
+def test_snapshot_local_atende_antes_da_sincronizacao(banco, tmp_path):
+    caminho = str(tmp_path / "indice.json")
+    banco.dados = {"pontos": {"a": _dados("Alfa")}}
+    indice = PontoIndex(caminho_snapshot=caminho, intervalo_snapshot=60)
+    indice.iniciar(timeout=1)
+    PontoService(indice=indice).cadastrar_ponto(_dados("Beta"))
+    indice.parar()
+
+    ref = _RefSemResposta()
+    reiniciado = PontoIndex(ref=ref, caminho_snapshot=caminho)
+    reiniciado.iniciar(timeout=0.01)
+
+    assert reiniciado.pronto and not reiniciado.sincronizado
+    assert [p.nome for p in reiniciado.todos()] == ["Alfa", "Beta"]
+
+    # A carga do Firebase substitui a cópia local
+    ref.callback(FakeEvent("put", "/", {"c": _dados("Gama")}))
+    assert reiniciado.sincronizado
+    assert [p.nome for p in reiniciado.todos()] == ["Gama"]
+
+def test_snapshot_corrompido_e_ignorado(banco, tmp_path):
+    caminho = tmp_path / "indice.json"
+    caminho.write_text("{incompleto")
+    banco.dados = {"pontos": {"a": _dados("Alfa")}}
+    indice = PontoIndex(caminho_snapshot=str(caminho))
+    indice.iniciar(timeout=1)
+
+    assert indice.sincronizado
+    assert [p.nome for p in indice.todos()] == ["Alfa"]
+
+def test_recentes_pelo_indice(banco):
+    service, _ = _servico_indexado(banco, {"antigo": _dados("Sem data")})
+    ids = [service.cadastrar_ponto(_dados(nome)) for nome in ["Alfa", "Beta", "Gama"]]
+    service.excluir_ponto(ids[2])
+    banco.leituras.clear()
+
+    assert [p.nome for p in service.listar_recentes(5)] == ["Beta", "Alfa"]
+    assert banco.leituras == []
+
+def test_pontos_por_criador_pelo_indice(banco):
+    service, _ = _servico_indexado(banco)
+    ids = [service.cadastrar_ponto(_dados(nome, criado_por=uid))
+           for nome, uid in [("Beta", "user-1"), ("Alfa", "user-1"), ("Gama", "user-2")]]
+    service.excluir_ponto(ids[0])
+
+    assert [p.nome for p in service.listar_por_criador("user-1")] == ["Alfa"]
+    assert [p.nome for p in service.listar_por_criador("user-2")] == ["Gama"]
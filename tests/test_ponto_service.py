@@ -0,0 +1,253 @@
+import time
+import pytest
+from services.ponto_service import PontoService
+
+def _dados(nome, tipo="Museu", criado_por="user-1"):
+    return {
+        "nome": nome,
+        "descricao": f"Descrição de {nome}",
+        "tipo": tipo,
+        "latitude": -7.1,
+        "longitude": -34.8,
+        "criado_por": criado_por
+    }
+
+def _cadastrar(service, nomes, tipo="Museu"):
+    return [service.cadastrar_ponto(_dados(nome, tipo)) for nome in nomes]
+
+def test_listar_pagina_percorre_todos_os_pontos_em_ordem(banco):
+    service = PontoService()
+    nomes = [f"Ponto {i:02d}" for i in range(25)]
+    _cadastrar(service, reversed(nomes))
+
+    vistos = []
+    cursor = None
+    while True:
+        pontos, cursor = service.listar_pagina(cursor=cursor, limite=10)
+        vistos.extend(p.nome for p in pontos)
+        if cursor is None:
+            break
+
+    assert vistos == nomes
+
+def test_listar_pagina_baixa_apenas_a_pagina(banco):
+    service = PontoService()
+    _cadastrar(service, [f"Ponto {i:03d}" for i in range(200)])
+    banco.leituras.clear()
+
+    pontos, cursor = service.listar_pagina(limite=10)
+    service.listar_pagina(cursor=cursor, limite=10)
+
+    assert len(pontos) == 10
+    assert all(total <= 12 for _, total in banco.leituras)
+
+def test_listar_pagina_com_nomes_repetidos(banco):
+    service = PontoService()
+    _cadastrar(service, ["Igual"] * 7)
+
+    ids = []
+    cursor = None
+    while True:
+        pontos, cursor = service.listar_pagina(cursor=cursor, limite=3)
+        ids.extend(p.id for p in pontos)
+        if cursor is None:
+            break
+
+    assert len(ids) == 7
+    assert len(set(ids)) == 7
+
+def test_listar_pagina_filtra_por_tipo(banco):
+    service = PontoService()
+    _cadastrar(service, ["A", "C", "E"], tipo="Museu")
+    _cadastrar(service, ["B", "D"], tipo="Teatro")
+
+    pontos, cursor = service.listar_pagina(tipo="Teatro", limite=1)
+    assert [p.nome for p in pontos] == ["B"]
+    pontos, cursor = service.listar_pagina(cursor=cursor, tipo="Teatro", limite=1)
+    assert [p.nome for p in pontos] == ["D"]
+    assert cursor is None
+
+def test_listar_pagina_cursor_invalido(banco):
+    with pytest.raises(ValueError, match="Cursor de paginação inválido"):
+        PontoService().listar_pagina(cursor="nao-e-um-cursor")
+
+def test_consultas_espaciais_sem_indice(banco):
+    service = PontoService()
+    service.cadastrar_ponto({**_dados("Perto"), "latitude": -7.115, "longitude": -34.863})
+    service.cadastrar_ponto({**_dados("Longe"), "latitude": -8.047, "longitude": -34.877})
+
+    assert [p.nome for p in service.buscar_proximos(-7.12, -34.86, raio_km=200)] == ["Perto", "Longe"]
+    assert [p.nome for p in service.buscar_na_area((-8.1, -35.0, -8.0, -34.8))] == ["Longe"]
+
+def test_buscar_na_area_le_apenas_a_faixa_de_latitude(banco):
+    service = PontoService()
+    for nome, latitude in (("Norte", -6.5), ("Centro", -7.1), ("Sul", -8.0)):
+        service.cadastrar_ponto({**_dados(nome), "latitude": latitude, "longitude": -34.8})
+    service.cadastrar_ponto({**_dados("Oeste"), "latitude": -7.1, "longitude": -36.0})
+    banco.leituras.clear()
+
+    assert [p.nome for p in service.buscar_na_area((-7.5, -35.0, -7.0, -34.5))] == ["Centro"]
+    assert banco.leituras == [("pontos", 2)]
+
+def test_total_de_paginas_considera_todos_os_pontos(banco):
+    service = PontoService()
+    _cadastrar(service, [f"Museu {i:02d}" for i in range(23)])
+    _cadastrar(service, ["Teatro A", "Teatro B"], tipo="Teatro")
+
+    pontos, total_paginas = service.listar_pontos(pagina=1)
+    assert len(pontos) == 10
+    assert total_paginas == 3
+    assert service.listar_pontos(pagina=1, tipo="Teatro")[1] == 1
+
+def test_contadores_mantidos_nas_escritas(banco):
+    service = PontoService()
+    ids = _cadastrar(service, ["A", "B", "C"])
+    _cadastrar(service, ["D"], tipo="Feira")
+    service.excluir_ponto(ids[0])
+    service.excluir_ponto("id-inexistente")
+    banco.leituras.clear()
+
+    assert service.contar_pontos() == 3
+    assert service.contar_pontos(tipo="Museu") == 2
+    assert service.contar_pontos(tipo="Teatro") == 0
+    assert all(path == "contadores/pontos" for path, _ in banco.leituras)
+
+def test_contadores_recalculados_quando_ausentes(banco):
+    banco.dados = {"pontos": {
+        "a": {**_dados("A"), "latitude": "-7.1", "longitude": "-34.8"},
+        "b": {**_dados("B", tipo="Feira"), "latitude": "-7.1", "longitude": "-34.8"},
+    }}
+    service = PontoService()
+
+    assert service.contar_pontos(tipo="Feira") == 1
+    assert banco.dados["contadores"]["pontos"] == {"total": 2, "tipos": {"Museu": 1, "Feira": 1}}
+
+def test_contadores_criados_antes_da_primeira_escrita_em_base_existente(banco):
+    # Base anterior aos contadores: o primeiro incremento não pode partir do zero
+    banco.dados = {"pontos": {f"p{i:02d}": _dados(f"Ponto {i:02d}") for i in range(50)}}
+    service = PontoService()
+
+    id_novo = service.cadastrar_ponto(_dados("Novo", tipo="Feira"))
+    assert service.contar_pontos() == 51
+    assert service.contar_pontos(tipo="Feira") == 1
+    assert service.listar_pontos()[1] == 6
+
+    service.excluir_ponto("p00")
+    service.excluir_ponto(id_novo)
+    assert banco.dados["contadores"]["pontos"] == {"total": 49, "tipos": {"Museu": 49, "Feira": 0}}
+
+def test_buscar_por_ids_em_paralelo(banco):
+    service = PontoService()
+    ids = _cadastrar(service, [f"Ponto {i}" for i in range(6)])
+    banco.latencia = 0.05
+    banco.leituras.clear()
+
+    inicio = time.perf_counter()
+    pontos = service.buscar_por_ids(ids + ["inexistente", ids[0]])
+    duracao = time.perf_counter() - inicio
+
+    assert list(pontos) == ids
+    assert len(banco.leituras) == 7
+    assert duracao < 0.05 * 7
+
+def test_excluir_pontos_em_uma_escrita(banco, monkeypatch):
+    service = PontoService()
+    ids = _cadastrar(service, ["A", "B", "C", "D"])
+    _cadastrar(service, ["E"], tipo="Feira")
+    escritas = []
+    atualizar = service.repositorio.raiz.update
+    monkeypatch.setattr(service.repositorio.raiz, "update", lambda valor: (escritas.append(valor), atualizar(valor)))
+    invalidacoes = []
+    monkeypatch.setattr(service.cache, "invalidate_tag", invalidacoes.append)
+
+    service.excluir_pontos(ids[:3] + ["inexistente"])
+
+    assert len(escritas) == 1
+    assert invalidacoes.count("listagem") == 1
+    assert sorted(p["nome"] for p in banco.dados["pontos"].values()) == ["D", "E"]
+    assert banco.dados["contadores"]["pontos"] == {"total": 2, "tipos": {"Museu": 1, "Feira": 1}}
+
+def _pontos_v1(banco, quantidade):
+    banco.dados["pontos"] = {
+        f"p{i:02d}": {**_dados(f"Ponto {i:02d}"), "latitude": "-7.1", "longitude": "-34.8"}
+        for i in range(quantidade)
+    }
+
+def test_migrar_coordenadas_grava_numeros_e_versao(banco):
+    _pontos_v1(banco, 5)
+    service = PontoService()
+
+    assert service.migrar_coordenadas(tamanho_lote=2) == 5
+    for registro in banco.dados["pontos"].values():
+        assert registro["latitude"] == -7.1
+        assert registro["longitude"] == -34.8
+        assert registro["versao_esquema"] == 2
+    assert "migracoes" not in banco.dados or not banco.dados["migracoes"]
+    assert service.migrar_coordenadas(tamanho_lote=2) == 0
+
+def test_migrar_coordenadas_retoma_do_progresso_salvo(banco):
+    _pontos_v1(banco, 5)
+    banco.dados["migracoes"] = {"coordenadas": "p02"}
+
+    assert PontoService().migrar_coordenadas(tamanho_lote=2) == 2
+    assert banco.dados["pontos"]["p02"]["latitude"] == "-7.1"
+    assert banco.dados["pontos"]["p03"]["latitude"] == -7.1
+
+def test_migrar_preenche_tipo_nome_de_pontos_antigos(banco):
+    # Pontos gravados antes do campo "tipo_nome" não aparecem na paginação por tipo
+    _pontos_v1(banco, 5)
+    banco.dados["pontos"]["p00"]["tipo"] = "Feira"
+    service = PontoService()
+    assert service.listar_pagina(tipo="Museu")[0] == []
+
+    assert service.migrar_coordenadas(tamanho_lote=2) == 5
+
+    pontos, cursor = service.listar_pagina(tipo="Museu", limite=3)
+    pontos_2, _ = service.listar_pagina(cursor=cursor, tipo="Museu", limite=3)
+    assert [p.nome for p in pontos + pontos_2] == [f"Ponto {i:02d}" for i in range(1, 5)]
+    assert service.listar_pontos(tipo="Museu")[1] == 1
+    assert banco.dados["pontos"]["p00"]["tipo_nome"] == "Feira|Ponto 00"
+
+def test_migrar_preenche_criado_em_de_pontos_antigos(banco):
+    # Pontos sem "criado_em" ficam fora dos recentes
+    _pontos_v1(banco, 3)
+    service = PontoService()
+    service.cadastrar_ponto(_dados("Novo"))
+    criado_em = next(p["criado_em"] for p in banco.dados["pontos"].values() if p["nome"] == "Novo")
+    assert [p.nome for p in service.listar_recentes(5)] == ["Novo"]
+
+    assert service.migrar_coordenadas() == 3
+
+    assert all(banco.dados["pontos"][f"p{i:02d}"]["criado_em"] == criado_em - 1 for i in range(3))
+    recentes = service.listar_recentes(5)
+    assert len(recentes) == 4 and recentes[0].nome == "Novo"
+
+def _relogio(monkeypatch, inicio=1_700_000_000.0):
+    """Faz cada chamada de time.time() avançar um segundo."""
+    instantes = iter(range(1_000_000))
+    monkeypatch.setattr(time, "time", lambda: inicio + next(instantes))
+
+def test_listar_recentes_le_apenas_os_ultimos(banco, monkeypatch):
+    _relogio(monkeypatch)
+    banco.dados = {"pontos": {"antigo": _dados("Sem data")}}
+    service = PontoService()
+    for nome in ["Alfa", "Beta", "Gama", "Delta"]:
+        service.cadastrar_ponto(_dados(nome))
+    banco.leituras.clear()
+
+    recentes = service.listar_recentes(3)
+
+    assert [p.nome for p in recentes] == ["Delta", "Gama", "Beta"]
+    assert recentes[0].criado_em > recentes[1].criado_em
+    assert banco.leituras == [("pontos", 3)]
+
+def test_listar_por_criador_usa_consulta_indexada(banco):
+    service = PontoService()
+    service.cadastrar_ponto(_dados("Beta", criado_por="user-1"))
+    service.cadastrar_ponto(_dados("Alfa", criado_por="user-1"))
+    service.cadastrar_ponto(_dados("Gama", criado_por="user-2"))
+    banco.leituras.clear()
+
+    assert [p.nome for p in service.listar_por_criador("user-1")] == ["Alfa", "Beta"]
+    assert service.listar_por_criador("user-3") == []
+    assert banco.leituras == [("pontos", 2), ("pontos", 0)]
@@ -0,0 +1,110 @@
+import asyncio
+import aiohttp
+import pytest
+from aiohttp.test_utils import TestServer
+from services.ponto_service_async import AsyncPontoService
+from tests.fake_rest import FakeRestServer
+from tests.test_ponto_service import _dados
+from utils.metricas import metricas
+
+def _executar(banco, teste, **opcoes):
+    """
+    Sobe o servidor local e executa `teste(service, servidor)` numa nova event loop.
+    """
+    async def principal():
+        servidor = FakeRestServer(banco)
+        async with TestServer(servidor.app) as http:
+            async with AsyncPontoService(str(http.make_url("/")), **opcoes) as service:
+                return await teste(service, servidor)
+    return asyncio.run(principal())
+
+def test_cadastrar_listar_buscar_e_excluir(banco):
+    async def teste(service, _):
+        ids = [await service.cadastrar_ponto(_dados(nome, tipo)) for nome, tipo in
+               [("Casa do Cantador", "Museu"), ("Arena", "Teatro"), ("Beco", "Museu")]]
+
+        pontos, total_paginas = await service.listar_pontos(tipo="Museu")
+        assert [p.nome for p in pontos] == ["Beco", "Casa do Cantador"]
+        assert total_paginas == 1
+        assert [p.nome for p in await service.buscar_pontos("cantador")] == ["Casa do Cantador"]
+        assert (await service.buscar_por_id(ids[1])).tipo == "Teatro"
+
+        await service.excluir_ponto(ids[1])
+        assert await service.buscar_por_id(ids[1]) is None
+        return ids
+
+    _executar(banco, teste)
+    assert banco.dados["contadores"]["pontos"] == {"total": 2, "tipos": {"Museu": 2, "Teatro": 0}}
+
+def test_contadores_criados_antes_da_primeira_escrita_em_base_existente(banco):
+    # Base anterior aos contadores: o primeiro incremento não pode partir do zero
+    banco.dados = {"pontos": {f"p{i:02d}": _dados(f"Ponto {i:02d}") for i in range(50)}}
+
+    async def teste(service, _):
+        id_novo = await service.cadastrar_ponto(_dados("Novo", tipo="Feira"))
+        await service.excluir_ponto("p00")
+        await service.excluir_ponto(id_novo)
+
+    _executar(banco, teste)
+    assert banco.dados["contadores"]["pontos"] == {"total": 49, "tipos": {"Museu": 49, "Feira": 0}}
+
+def test_listar_recentes(banco):
+    banco.dados["pontos"] = {
+        "a": {**_dados("Alfa"), "criado_em": 1.0},
+        "b": {**_dados("Beta"), "criado_em": 3.0},
+        "c": {**_dados("Gama"), "criado_em": 2.0},
+        "d": _dados("Sem data"),
+    }
+
+    async def teste(service, _):
+        return [p.nome for p in await service.listar_recentes(2)]
+
+    assert _executar(banco, teste) == ["Beta", "Gama"]
+
+def test_leituras_em_paralelo_reusam_conexoes_e_respeitam_limite(banco):
+    banco.dados["pontos"] = {f"p{i}": _dados(f"Ponto {i}") for i in range(20)}
+    banco.latencia = 0.02
+
+    async def teste(service, servidor):
+        pontos = await service.buscar_por_ids([f"p{i}" for i in range(20)] + ["inexistente"])
+        assert len(pontos) == 20
+        return servidor
+
+    servidor = _executar(banco, teste, max_conexoes=4, max_requisicoes=3)
+    assert servidor.pico == 3
+    assert len(servidor.conexoes) <= 3
+
+def test_tempo_limite(banco):
+    banco.latencia = 0.5
+
+    async def teste(service, _):
+        with pytest.raises(asyncio.TimeoutError):
+            await service.buscar_por_id("p1")
+
+    _executar(banco, teste, tempo_limite=0.05)
+
+def test_erro_http(banco):
+    async def teste(service, _):
+        with pytest.raises(aiohttp.ClientResponseError):
+            await service._requisitar("DELETE", "pontos")
+
+    _executar(banco, teste)
+
+def test_metodos_instrumentados(banco, monkeypatch):
+    monkeypatch.setattr(metricas, "habilitadas", True)
+    metricas.limpar()
+
+    async def teste(service, _):
+        await service.cadastrar_ponto(_dados("Alfa"))
+        await service.listar_recentes(2)
+
+    try:
+        _executar(banco, teste)
+        series = {
+            serie["rotulos"]["metodo"]: serie
+            for serie in metricas.snapshot()["histogramas"]["ponto_service_async_duracao_segundos"]
+        }
+        assert series["cadastrar_ponto"]["quantidade"] == 1
+        assert series["listar_recentes"]["quantidade"] == 1
+    finally:
+        metricas.limpar()
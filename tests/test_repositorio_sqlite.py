@@ -0,0 +1,106 @@
+import sqlite3
+import pytest
+from repositorios import criar_repositorio
+from repositorios.repositorio_sqlite import RepositorioSQLite
+from services.ponto_service import PontoService
+from utils.cache import Cache
+from tests.test_ponto_service import _dados
+
+@pytest.fixture
+def service():
+    Cache().clear()
+    repositorio = RepositorioSQLite(":memory:")
+    yield PontoService(repositorio=repositorio)
+    repositorio.fechar()
+    Cache().clear()
+
+def _cadastrar(service, *pontos):
+    return [service.cadastrar_ponto({**_dados(nome, tipo), "latitude": lat, "longitude": lon})
+            for nome, tipo, lat, lon in pontos]
+
+def test_listagens_e_contagens(service):
+    nomes = [f"Ponto {i:02d}" for i in range(25)]
+    for i, nome in enumerate(reversed(nomes)):
+        _cadastrar(service, (nome, "Museu" if i % 2 else "Teatro", -7.1, -34.8))
+
+    pontos, total_paginas = service.listar_pontos(pagina=3)
+    assert [p.nome for p in pontos] == nomes[20:]
+    assert total_paginas == 3
+    assert service.contar_pontos() == 25
+    assert service.contar_pontos(tipo="Museu") == 12
+
+    vistos, cursor = [], None
+    while True:
+        pontos, cursor = service.listar_pagina(cursor=cursor, tipo="Teatro", limite=5)
+        vistos.extend(p.nome for p in pontos)
+        if cursor is None:
+            break
+    assert vistos == [p.nome for p in service.listar_pontos(tipo="Teatro", limite=100)[0]]
+    assert len(vistos) == 13
+
+def test_busca_textual_por_prefixo_sem_acentos(service):
+    _cadastrar(service, ("Teatro Santa Roza", "Teatro", -7.1, -34.8), ("Museu do Algodão", "Museu", -7.2, -35.9))
+
+    assert [p.nome for p in service.buscar_pontos("algodao")] == ["Museu do Algodão"]
+    assert [p.nome for p in service.buscar_pontos("SANTA ro")] == ["Teatro Santa Roza"]
+    assert service.buscar_pontos("santa algodão") == []
+
+def test_buscas_espaciais(service):
+    ids = _cadastrar(service, ("Perto", "Museu", -7.115, -34.863), ("Longe", "Museu", -8.05, -34.9))
+
+    assert [p.id for p in service.buscar_na_area((-7.2, -35.0, -7.0, -34.8))] == [ids[0]]
+    assert [p.nome for p in service.buscar_proximos(-7.11, -34.86, 200)] == ["Perto", "Longe"]
+    assert service.buscar_proximos(-7.11, -34.86, 5)[0].nome == "Perto"
+
+def test_excluir_exportar_e_importar(service):
+    ids = _cadastrar(service, ("A", "Museu", -7.1, -34.8), ("B", "Feira", -7.1, -34.8))
+    service.excluir_pontos([ids[0]])
+
+    assert service.buscar_por_id(ids[0]) is None
+    assert service.buscar_pontos("a") == []
+    assert [p.id for p in service.exportar(tamanho_lote=1)] == [ids[1]]
+
+    relatorio = service.importar_lote([_dados("C"), {"nome": "Sem tipo"}])
+    assert len(relatorio.importados) == 1
+    assert service.recalcular_contadores() == {"total": 2, "tipos": {"Feira": 1, "Museu": 1}}
+
+def test_criar_repositorio_invalido():
+    with pytest.raises(ValueError, match="Repositório inválido"):
+        criar_repositorio("mongodb")
+
+def test_listar_recentes(service, monkeypatch):
+    instantes = iter(range(100))
+    monkeypatch.setattr("time.time", lambda: 1_700_000_000.0 + next(instantes))
+    _cadastrar(service, ("Alfa", "Museu", -7.1, -34.8), ("Beta", "Museu", -7.1, -34.8), ("Gama", "Teatro", -7.1, -34.8))
+
+    assert [p.nome for p in service.listar_recentes(2)] == ["Gama", "Beta"]
+
+def test_listar_por_criador(service):
+    for nome, uid in [("Beta", "user-1"), ("Alfa", "user-1"), ("Gama", "user-2")]:
+        service.cadastrar_ponto(_dados(nome, criado_por=uid))
+
+    assert [p.nome for p in service.listar_por_criador("user-1")] == ["Alfa", "Beta"]
+    plano = service.repositorio._consultar(
+        "EXPLAIN QUERY PLAN SELECT id FROM pontos WHERE criado_por = ? ORDER BY nome, id", ("user-1",)
+    )
+    assert "pontos_criado_por" in str(plano)
+
+def test_banco_antigo_recebe_coluna_criado_em(tmp_path):
+    caminho = str(tmp_path / "antigo.db")
+    conexao = sqlite3.connect(caminho)
+    conexao.execute(
+        "CREATE TABLE pontos (seq INTEGER PRIMARY KEY, id TEXT NOT NULL UNIQUE, nome TEXT NOT NULL, "
+        "descricao TEXT NOT NULL, tipo TEXT NOT NULL, latitude REAL NOT NULL, longitude REAL NOT NULL, "
+        "criado_por TEXT NOT NULL)"
+    )
+    conexao.execute("INSERT INTO pontos (id, nome, descricao, tipo, latitude, longitude, criado_por) "
+                    "VALUES ('a', 'Alfa', '', 'Museu', -7.1, -34.8, 'user-1')")
+    conexao.commit()
+    conexao.close()
+
+    repositorio = RepositorioSQLite(caminho)
+    try:
+        assert repositorio.obter("a").criado_em is None
+        assert repositorio.listar_recentes(5) == []
+    finally:
+        repositorio.fechar()
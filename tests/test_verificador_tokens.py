@@ -0,0 +1,102 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+import jwt
+import pytest
+from benchmarks.dados_sinteticos import EmissorTokens
+from services import verificador_tokens
+from services.verificador_tokens import VerificadorTokens
+
+@pytest.fixture(scope="module")
+def emissor():
+    return EmissorTokens()
+
+@pytest.fixture
+def verificador(emissor):
+    buscas = []
+    def buscar():
+        buscas.append(time.time())
+        return emissor.certificados()
+    verificador = VerificadorTokens(emissor.projeto, buscar=buscar, tolerancia=0)
+    verificador.buscas = buscas
+    yield verificador
+    verificador.parar()
+
+def test_token_repetido_vem_do_cache(verificador, emissor, monkeypatch):
+    token = emissor.emitir("user-1")
+    assert verificador.verificar(token)["uid"] == "user-1"
+
+    def falhar(*args, **kwargs):
+        raise AssertionError("token decodificado de novo")
+    monkeypatch.setattr(verificador_tokens.jwt, "decode", falhar)
+
+    assert verificador.verificar(token)["email"] == "user-1@exemplo.com"
+    assert len(verificador.buscas) == 1
+    assert verificador.stats()["hits"] == 1
+
+def test_alterar_claims_nao_afeta_o_cache(verificador, emissor):
+    token = emissor.emitir("user-1", firebase={"sign_in_provider": "password"})
+    claims = verificador.verificar(token)
+    claims["uid"] = "outro"
+    claims["firebase"]["sign_in_provider"] = "custom"
+
+    claims = verificador.verificar(token)
+    assert claims["uid"] == "user-1"
+    assert claims["firebase"] == {"sign_in_provider": "password"}
+
+def test_tokens_invalidos(verificador, emissor):
+    with pytest.raises(jwt.ExpiredSignatureError):
+        verificador.verificar(emissor.emitir("user-1", validade=-10))
+    with pytest.raises(jwt.InvalidAudienceError):
+        verificador.verificar(emissor.emitir("user-1", aud="outro-projeto"))
+    with pytest.raises(jwt.InvalidSignatureError):
+        verificador.verificar(EmissorTokens(emissor.projeto, kid=emissor.kid).emitir("user-1"))
+
+def test_cache_respeita_validade_do_token(verificador, emissor):
+    token = emissor.emitir("user-1", validade=1)
+    verificador.verificar(token)
+    time.sleep(1.1)
+
+    with pytest.raises(jwt.ExpiredSignatureError):
+        verificador.verificar(token)
+
+def test_chave_nova_renova_certificados(emissor):
+    novo = EmissorTokens(emissor.projeto, kid="chave-nova")
+    certificados = [emissor.certificados()]
+    verificador = VerificadorTokens(emissor.projeto, buscar=lambda: certificados[-1])
+    try:
+        verificador.verificar(emissor.emitir("user-1"))
+
+        # O Google passa a assinar com uma chave nova
+        certificados.append(({**emissor.certificados()[0], **novo.certificados()[0]}, 3600.0))
+        assert verificador.verificar(novo.emitir("user-2"))["uid"] == "user-2"
+
+        with pytest.raises(jwt.InvalidTokenError):
+            verificador.verificar(EmissorTokens(emissor.projeto, kid="desconhecida").emitir("user-3"))
+    finally:
+        verificador.parar()
+
+def test_chaves_desconhecidas_nao_renovam_a_cada_token(emissor):
+    buscas = []
+    def buscar():
+        buscas.append(time.time())
+        return emissor.certificados()
+    verificador = VerificadorTokens(emissor.projeto, buscar=buscar, intervalo_renovacao=0.5)
+    agora = int(time.time())
+    corpo = {"iss": verificador.emissor, "aud": emissor.projeto, "sub": "x", "iat": agora, "exp": agora + 60}
+    forjados = [jwt.encode(corpo, emissor.chave, algorithm="RS256", headers={"kid": f"forjada-{i}"}) for i in range(50)]
+
+    def verificar(token):
+        with pytest.raises(jwt.InvalidTokenError, match="chave desconhecida"):
+            verificador.verificar(token)
+    try:
+        verificador.verificar(emissor.emitir("user-1"))
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            list(executor.map(verificar, forjados))
+        # Uma busca inicial e no máximo uma forçada no intervalo
+        assert len(buscas) == 2
+
+        time.sleep(0.5)
+        verificar(forjados[0])
+        assert len(buscas) == 3
+    finally:
+        verificador.parar()
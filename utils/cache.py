@@ -1,30 +1,299 @@
-from typing import Any, Optional
+from typing import Any, Callable, Dict, Iterable, Optional, Set
+from collections import OrderedDict
+from concurrent.futures import Future
+import logging
+import threading
 import time
-from config import CACHE_TEMPO_EXPIRACAO
+from config import (
+    CACHE_TEMPO_EXPIRACAO, CACHE_TAMANHO_MAXIMO, CACHE_INTERVALO_LIMPEZA,
+    CACHE_TEMPO_OBSOLETO, CACHE_TEMPO_NEGATIVO
+)
+from utils.metricas import metricas
 
-class Cache:
+logger = logging.getLogger(__name__)
+
+# Valor padrão de get() que distingue "chave ausente" de um valor None em cache
+AUSENTE = object()
+
+def resultado_vazio(valor: Any) -> bool:
+    """
+    Indica se um resultado representa "nada encontrado" (None ou coleção vazia).
+    """
+    if valor is None:
+        return True
+    try:
+        return len(valor) == 0
+    except TypeError:
+        return False
+
+class _Entrada:
+    __slots__ = ("valor", "expira_em", "tags", "negativo")
+
+    def __init__(self, valor: Any, expira_em: float, tags: frozenset, negativo: bool = False):
+        self.valor = valor
+        self.expira_em = expira_em
+        self.tags = tags
+        self.negativo = negativo
+
+
+class CacheLRU:
+    """
+    Cache limitado por tamanho (LRU) com expiração por tempo (TTL) e tags.
+
+    As entradas expiradas são removidas ao serem lidas e por uma varredura
+    amortizada, executada durante as escritas no máximo uma vez a cada
+    `intervalo_limpeza` segundos. Tags permitem invalidar um grupo de chaves
+    sem limpar o cache inteiro.
+
+    Todas as operações são protegidas por lock, e obter_ou_carregar garante uma
+    única carga em andamento por chave: chamadas concorrentes aguardam o
+    resultado da primeira. Com `tempo_obsoleto` > 0, uma entrada expirada ainda
+    é servida por esse intervalo enquanto é recarregada em segundo plano.
+
+    Resultados vazios (nenhum ponto, ID inexistente) também ficam em cache, mas
+    com o prazo curto `ttl_negativo`, para que consultas repetidas sem resultado
+    não voltem à origem e ainda assim enxerguem dados novos rapidamente.
+    """
+
+    def __init__(self, tamanho_maximo: int = CACHE_TAMANHO_MAXIMO,
+                 ttl: float = CACHE_TEMPO_EXPIRACAO,
+                 intervalo_limpeza: float = CACHE_INTERVALO_LIMPEZA,
+                 tempo_obsoleto: float = CACHE_TEMPO_OBSOLETO,
+                 ttl_negativo: float = CACHE_TEMPO_NEGATIVO):
+        self.tamanho_maximo = tamanho_maximo
+        self.ttl = ttl
+        self.intervalo_limpeza = intervalo_limpeza
+        self.tempo_obsoleto = tempo_obsoleto
+        self.ttl_negativo = ttl_negativo
+        self._lock = threading.RLock()
+        self._cache: "OrderedDict[str, _Entrada]" = OrderedDict()
+        self._tags: Dict[str, Set[str]] = {}
+        self._em_carga: Dict[str, Future] = {}
+        # Tags das cargas em andamento, para que invalidate_tag descarte só as afetadas
+        self._tags_em_carga: Dict[str, frozenset] = {}
+        self._ultima_limpeza = time.monotonic()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.negative_hits = 0
+        self.negative_stores = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+    def _buscar(self, key: str, agora: float) -> Optional[_Entrada]:
+        """
+        Retorna a entrada da chave (válida ou obsoleta), descartando-a se já
+        passou do prazo de uso obsoleto. Deve ser chamado com o lock adquirido.
+        """
+        entrada = self._cache.get(key)
+        if entrada is not None and entrada.expira_em + self.tempo_obsoleto <= agora:
+            self._remover(key)
+            self.expirations += 1
+            return None
+        return entrada
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """
+        Retorna o valor em cache ou `default` se a chave estiver ausente ou expirada.
+
+        Use default=AUSENTE para distinguir uma chave ausente de um valor None ou
+        vazio guardado em cache.
+        """
+        with self._lock:
+            agora = time.monotonic()
+            entrada = self._buscar(key, agora)
+            if entrada is not None and entrada.expira_em > agora:
+                self._registrar_hit(key, entrada)
+                return entrada.valor
+            self.misses += 1
+            return default
+
+    def _registrar_hit(self, key: str, entrada: _Entrada) -> None:
+        self._cache.move_to_end(key)
+        self.hits += 1
+        if entrada.negativo:
+            self.negative_hits += 1
+
+    def set(self, key: str, value: Any, tags: Iterable[str] = (), ttl: Optional[float] = None,
+            negativo: bool = False) -> None:
+        """
+        Guarda um valor; entradas negativas usam `ttl_negativo` quando `ttl` não é informado.
+        """
+        with self._lock:
+            agora = time.monotonic()
+            if agora - self._ultima_limpeza >= self.intervalo_limpeza:
+                self.remover_expirados(agora)
+
+            self._remover(key)
+            if ttl is None:
+                ttl = self.ttl_negativo if negativo else self.ttl
+            entrada = _Entrada(value, agora + ttl, frozenset(tags), negativo)
+            self._cache[key] = entrada
+            if negativo:
+                self.negative_stores += 1
+            for tag in entrada.tags:
+                self._tags.setdefault(tag, set()).add(key)
+
+            while len(self._cache) > self.tamanho_maximo:
+                self._remover(next(iter(self._cache)))
+                self.evictions += 1
+
+    def obter_ou_carregar(self, key: str, carregar: Callable[[], Any],
+                          tags: Iterable[str] = (), ttl: Optional[float] = None,
+                          e_negativo: Callable[[Any], bool] = resultado_vazio) -> Any:
+        """
+        Retorna o valor em cache ou executa `carregar` uma única vez por chave.
+
+        Args:
+            key (str): Chave do cache
+            carregar (Callable[[], Any]): Função que obtém o valor na origem
+            tags (Iterable[str]): Tags da entrada criada
+            ttl (Optional[float]): Tempo de expiração de resultados não vazios, em segundos
+            e_negativo (Callable[[Any], bool]): Indica se o resultado é vazio e deve
+                usar o prazo curto de cache negativo
+
+        Returns:
+            Any: Valor em cache ou recém-carregado
+
+        Raises:
+            Exception: A exceção lançada por `carregar`, repassada a todos que aguardavam
+        """
+        with self._lock:
+            agora = time.monotonic()
+            entrada = self._buscar(key, agora)
+            if entrada is not None:
+                self._registrar_hit(key, entrada)
+                if entrada.expira_em <= agora and key not in self._em_carga:
+                    # Entrada obsoleta: serve o valor antigo e recarrega em segundo plano
+                    futuro = self._iniciar_carga(key, tags)
+                    threading.Thread(
+                        target=self._carregar, args=(key, carregar, tags, ttl, e_negativo, futuro), daemon=True
+                    ).start()
+                return entrada.valor
+
+            self.misses += 1
+            futuro = self._em_carga.get(key)
+            lider = futuro is None
+            if lider:
+                futuro = self._iniciar_carga(key, tags)
+
+        if lider:
+            self._carregar(key, carregar, tags, ttl, e_negativo, futuro)
+        return futuro.result()
+
+    def _carregar(self, key: str, carregar: Callable[[], Any], tags: Iterable[str],
+                  ttl: Optional[float], e_negativo: Callable[[Any], bool], futuro: Future) -> None:
+        try:
+            valor = carregar()
+        except Exception as e:
+            with self._lock:
+                if self._em_carga.get(key) is futuro:
+                    self._encerrar_carga(key)
+            futuro.set_exception(e)
+            logger.debug(f"Falha ao carregar a chave {key} do cache: {str(e)}")
+            return
+        with self._lock:
+            # Uma invalidação durante a carga descarta o resultado antigo
+            if self._em_carga.get(key) is futuro:
+                if e_negativo(valor):
+                    self.set(key, valor, tags, negativo=True)
+                else:
+                    self.set(key, valor, tags, ttl)
+                self._encerrar_carga(key)
+        futuro.set_result(valor)
+
+    def _iniciar_carga(self, key: str, tags: Iterable[str]) -> Future:
+        """
+        Registra uma carga em andamento. Deve ser chamado com o lock adquirido.
+        """
+        futuro = self._em_carga[key] = Future()
+        self._tags_em_carga[key] = frozenset(tags)
+        return futuro
+
+    def _encerrar_carga(self, key: str) -> None:
+        """
+        Remove o registro da carga em andamento. Deve ser chamado com o lock adquirido.
+        """
+        self._em_carga.pop(key, None)
+        self._tags_em_carga.pop(key, None)
+
+    def _remover(self, key: str) -> None:
+        entrada = self._cache.pop(key, None)
+        if entrada is None:
+            return
+        for tag in entrada.tags:
+            chaves = self._tags.get(tag)
+            if chaves is not None:
+                chaves.discard(key)
+                if not chaves:
+                    del self._tags[tag]
+
+    def remover_expirados(self, agora: Optional[float] = None) -> int:
+        """
+        Remove todas as entradas expiradas e retorna quantas foram removidas.
+        """
+        with self._lock:
+            agora = time.monotonic() if agora is None else agora
+            limite = agora - self.tempo_obsoleto
+            expiradas = [key for key, entrada in self._cache.items() if entrada.expira_em <= limite]
+            for key in expiradas:
+                self._remover(key)
+            self.expirations += len(expiradas)
+            self._ultima_limpeza = agora
+            return len(expiradas)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self._tags.clear()
+            self._em_carga.clear()
+            self._tags_em_carga.clear()
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._remover(key)
+            self._encerrar_carga(key)
+
+    def invalidate_tag(self, tag: str) -> None:
+        with self._lock:
+            for key in list(self._tags.get(tag, ())):
+                self._remover(key)
+            # Cargas em andamento com a tag podem ter lido dados anteriores à
+            # invalidação; as demais continuam valendo
+            for key in [key for key, tags in self._tags_em_carga.items() if tag in tags]:
+                self._encerrar_carga(key)
+
+    def stats(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "negative_hits": self.negative_hits,
+                "negative_stores": self.negative_stores,
+                "size": len(self._cache)
+            }
+
+
+class Cache(CacheLRU):
+    """
+    Instância única de CacheLRU compartilhada pelos serviços e sessões do processo.
+    """
     _instance = None
-    _cache: dict = {}
-    
+    _lock_instancia = threading.Lock()
+
     def __new__(cls):
-        if cls._instance is None:
-            cls._instance = super(Cache, cls).__new__(cls)
+        with cls._lock_instancia:
+            if cls._instance is None:
+                instancia = super(Cache, cls).__new__(cls)
+                CacheLRU.__init__(instancia)
+                metricas.registrar_coletor("cache", instancia.stats, medidores=("size",), cache="servicos")
+                cls._instance = instancia
         return cls._instance
-    
-    def get(self, key: str) -> Optional[Any]:
-        if key in self._cache:
-            data, timestamp = self._cache[key]
-            if time.time() - timestamp < CACHE_TEMPO_EXPIRACAO:
-                return data
-            del self._cache[key]
-        return None
-    
-    def set(self, key: str, value: Any) -> None:
-        self._cache[key] = (value, time.time())
-    
-    def clear(self) -> None:
-        self._cache.clear()
-    
-    def invalidate(self, key: str) -> None:
-        if key in self._cache:
-            del self._cache[key] 
\ No newline at end of file
+
+    def __init__(self):
+        # A inicialização acontece uma única vez, em __new__
+        pass
@@ -0,0 +1,146 @@
+import math
+from typing import Dict, List, Tuple
+from config import INDICE_ESPACIAL_CELULA
+
+RAIO_TERRA_KM = 6371.0088
+KM_POR_GRAU = math.pi * RAIO_TERRA_KM / 180
+
+# (lat_min, lon_min, lat_max, lon_max)
+Area = Tuple[float, float, float, float]
+
+def distancia_km(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
+    """
+    Distância em quilômetros entre dois pontos pela fórmula de haversine.
+    """
+    phi1 = math.radians(lat1)
+    phi2 = math.radians(lat2)
+    dphi = phi2 - phi1
+    dlambda = math.radians(lon2 - lon1)
+    a = math.sin(dphi / 2) ** 2 + math.cos(phi1) * math.cos(phi2) * math.sin(dlambda / 2) ** 2
+    return 2 * RAIO_TERRA_KM * math.asin(math.sqrt(min(1.0, a)))
+
+def area_do_raio(lat: float, lon: float, raio_km: float) -> Area:
+    """
+    Menor retângulo de coordenadas que contém o círculo informado.
+    """
+    dlat = raio_km / KM_POR_GRAU
+    cos_lat = math.cos(math.radians(lat))
+    dlon = 180.0 if cos_lat < 1e-9 else min(180.0, raio_km / (KM_POR_GRAU * cos_lat))
+    return (max(-90.0, lat - dlat), max(-180.0, lon - dlon), min(90.0, lat + dlat), min(180.0, lon + dlon))
+
+
+class IndiceEspacial:
+    """
+    Índice em grade regular sobre latitude/longitude.
+
+    Cada célula de INDICE_ESPACIAL_CELULA graus guarda as coordenadas dos pontos
+    que caem nela. Consultas por área ou raio visitam apenas as células que
+    cruzam a região; células inteiramente dentro da área são aceitas sem testar
+    ponto a ponto.
+    """
+
+    def __init__(self, tamanho_celula: float = INDICE_ESPACIAL_CELULA):
+        self.tamanho_celula = tamanho_celula
+        self._celulas: Dict[Tuple[int, int], Dict[str, Tuple[float, float]]] = {}
+        self._posicoes: Dict[str, Tuple[int, int]] = {}
+
+    def __len__(self) -> int:
+        return len(self._posicoes)
+
+    def _celula(self, lat: float, lon: float) -> Tuple[int, int]:
+        return (math.floor(lat / self.tamanho_celula), math.floor(lon / self.tamanho_celula))
+
+    def adicionar(self, id_ponto: str, lat: float, lon: float) -> None:
+        """
+        Indexa (ou move) um ponto.
+        """
+        self.remover(id_ponto)
+        celula = self._celula(lat, lon)
+        self._celulas.setdefault(celula, {})[id_ponto] = (lat, lon)
+        self._posicoes[id_ponto] = celula
+
+    def remover(self, id_ponto: str) -> None:
+        """
+        Remove um ponto do índice, se presente.
+        """
+        celula = self._posicoes.pop(id_ponto, None)
+        if celula is None:
+            return
+        pontos = self._celulas[celula]
+        del pontos[id_ponto]
+        if not pontos:
+            del self._celulas[celula]
+
+    def limpar(self) -> None:
+        self._celulas = {}
+        self._posicoes = {}
+
+    def _celulas_na_area(self, area: Area):
+        lat_min, lon_min, lat_max, lon_max = area
+        i_min, j_min = self._celula(lat_min, lon_min)
+        i_max, j_max = self._celula(lat_max, lon_max)
+        if (i_max - i_min + 1) * (j_max - j_min + 1) > len(self._celulas):
+            # Área maior que a parte ocupada da grade: percorre só as células existentes
+            for (i, j), pontos in self._celulas.items():
+                if i_min <= i <= i_max and j_min <= j <= j_max:
+                    yield i, j, pontos
+            return
+        for i in range(i_min, i_max + 1):
+            for j in range(j_min, j_max + 1):
+                pontos = self._celulas.get((i, j))
+                if pontos:
+                    yield i, j, pontos
+
+    def buscar_na_area(self, area: Area) -> List[str]:
+        """
+        Lista os IDs dos pontos dentro do retângulo informado (bordas inclusas).
+
+        Args:
+            area (Area): (lat_min, lon_min, lat_max, lon_max)
+
+        Raises:
+            ValueError: Se os limites mínimos forem maiores que os máximos
+        """
+        lat_min, lon_min, lat_max, lon_max = area
+        if lat_min > lat_max or lon_min > lon_max:
+            raise ValueError("Área inválida: os limites mínimos devem ser menores que os máximos")
+
+        tamanho = self.tamanho_celula
+        resultado = []
+        for i, j, pontos in self._celulas_na_area(area):
+            if (lat_min <= i * tamanho and (i + 1) * tamanho <= lat_max and
+                    lon_min <= j * tamanho and (j + 1) * tamanho <= lon_max):
+                resultado.extend(pontos)
+            else:
+                resultado.extend(
+                    id_ponto for id_ponto, (lat, lon) in pontos.items()
+                    if lat_min <= lat <= lat_max and lon_min <= lon <= lon_max
+                )
+        return resultado
+
+    def buscar_proximos(self, lat: float, lon: float, raio_km: float) -> List[Tuple[str, float]]:
+        """
+        Lista os pontos a até `raio_km` quilômetros da coordenada informada.
+
+        Returns:
+            List[Tuple[str, float]]: Pares (id, distância em km), do mais próximo ao mais distante
+        """
+        if raio_km < 0:
+            raise ValueError("O raio deve ser positivo")
+
+        # Haversine com os termos da origem pré-calculados
+        phi1 = math.radians(lat)
+        cos_phi1 = math.cos(phi1)
+        lambda1 = math.radians(lon)
+        limite = math.sin(min(math.pi / 2, raio_km / (2 * RAIO_TERRA_KM))) ** 2
+        sin, cos, radians = math.sin, math.cos, math.radians
+
+        resultado = []
+        for _, _, pontos in self._celulas_na_area(area_do_raio(lat, lon, raio_km)):
+            for id_ponto, (lat2, lon2) in pontos.items():
+                phi2 = radians(lat2)
+                a = sin((phi2 - phi1) / 2) ** 2 + cos_phi1 * cos(phi2) * sin((radians(lon2) - lambda1) / 2) ** 2
+                if a <= limite:
+                    resultado.append((id_ponto, 2 * RAIO_TERRA_KM * math.asin(math.sqrt(min(1.0, a)))))
+        resultado.sort(key=lambda item: item[1])
+        return resultado
@@ -0,0 +1,168 @@
+import re
+import unicodedata
+from typing import Dict, List, Optional, Set, Tuple
+
+_PADRAO_TOKEN = re.compile(r"\w+")
+
+def normalizar(texto: str) -> str:
+    """
+    Converte o texto para minúsculas e remove acentos ("São João" -> "sao joao").
+    """
+    decomposto = unicodedata.normalize("NFKD", texto or "")
+    return "".join(c for c in decomposto if not unicodedata.combining(c)).lower()
+
+def tokenizar(texto: str) -> List[str]:
+    """
+    Divide o texto normalizado em termos.
+    """
+    return _PADRAO_TOKEN.findall(normalizar(texto))
+
+
+class _NoTrie:
+    __slots__ = ("filhos", "terminal")
+
+    def __init__(self):
+        self.filhos: Dict[str, "_NoTrie"] = {}
+        self.terminal = False
+
+
+class IndiceTextual:
+    """
+    Índice invertido com busca por prefixo para os campos textuais dos pontos.
+
+    Cada termo aponta para os documentos que o contêm, com um peso que depende
+    do campo em que aparece. Os termos ficam também numa trie, o que permite
+    expandir um prefixo digitado ("teat") para todos os termos que começam
+    com ele sem percorrer o vocabulário inteiro.
+    """
+
+    PESOS = {"nome": 3.0, "tipo": 2.0, "descricao": 1.0}
+    # Fração do peso atribuída quando o termo casa apenas por prefixo
+    FATOR_PREFIXO = 0.5
+
+    def __init__(self):
+        self._postings: Dict[str, Dict[str, float]] = {}
+        self._termos_por_doc: Dict[str, Set[str]] = {}
+        self._raiz = _NoTrie()
+
+    def __len__(self) -> int:
+        return len(self._termos_por_doc)
+
+    def adicionar(self, id_doc: str, campos: Dict[str, str]) -> None:
+        """
+        Indexa (ou reindexa) um documento.
+
+        Args:
+            id_doc (str): ID do documento
+            campos (Dict[str, str]): Texto de cada campo a indexar
+        """
+        self.remover(id_doc)
+        pesos: Dict[str, float] = {}
+        for campo, texto in campos.items():
+            peso = self.PESOS.get(campo, 1.0)
+            for termo in tokenizar(texto):
+                pesos[termo] = pesos.get(termo, 0.0) + peso
+
+        for termo, peso in pesos.items():
+            postings = self._postings.get(termo)
+            if postings is None:
+                postings = self._postings[termo] = {}
+                self._inserir_trie(termo)
+            postings[id_doc] = peso
+        self._termos_por_doc[id_doc] = set(pesos)
+
+    def remover(self, id_doc: str) -> None:
+        """
+        Remove um documento do índice, se presente.
+        """
+        for termo in self._termos_por_doc.pop(id_doc, ()):
+            postings = self._postings[termo]
+            del postings[id_doc]
+            if not postings:
+                del self._postings[termo]
+                self._remover_trie(termo)
+
+    def limpar(self) -> None:
+        self._postings = {}
+        self._termos_por_doc = {}
+        self._raiz = _NoTrie()
+
+    def _inserir_trie(self, termo: str) -> None:
+        no = self._raiz
+        for caractere in termo:
+            no = no.filhos.setdefault(caractere, _NoTrie())
+        no.terminal = True
+
+    def _remover_trie(self, termo: str) -> None:
+        caminho = [self._raiz]
+        for caractere in termo:
+            no = caminho[-1].filhos.get(caractere)
+            if no is None:
+                return
+            caminho.append(no)
+        caminho[-1].terminal = False
+        # Poda os nós que deixaram de levar a algum termo
+        for posicao in range(len(termo), 0, -1):
+            no = caminho[posicao]
+            if no.terminal or no.filhos:
+                break
+            del caminho[posicao - 1].filhos[termo[posicao - 1]]
+
+    def termos_com_prefixo(self, prefixo: str) -> List[str]:
+        """
+        Lista os termos indexados que começam com o prefixo informado.
+        """
+        no = self._raiz
+        for caractere in prefixo:
+            no = no.filhos.get(caractere)
+            if no is None:
+                return []
+        termos = []
+        pilha = [(no, prefixo)]
+        while pilha:
+            atual, termo = pilha.pop()
+            if atual.terminal:
+                termos.append(termo)
+            for caractere, filho in atual.filhos.items():
+                pilha.append((filho, termo + caractere))
+        return termos
+
+    def buscar(self, consulta: str, limite: Optional[int] = None) -> List[Tuple[str, float]]:
+        """
+        Busca os documentos que contêm todos os termos da consulta.
+
+        Cada termo da consulta casa por igualdade ou por prefixo; casamentos
+        exatos valem mais que casamentos por prefixo.
+
+        Args:
+            consulta (str): Texto digitado pelo usuário
+            limite (Optional[int]): Quantidade máxima de resultados
+
+        Returns:
+            List[Tuple[str, float]]: Pares (id, pontuação) em ordem decrescente de pontuação
+        """
+        termos = tokenizar(consulta)
+        if not termos:
+            return []
+
+        pontuacao: Optional[Dict[str, float]] = None
+        for termo in dict.fromkeys(termos):
+            parcial: Dict[str, float] = {}
+            for candidato in self.termos_com_prefixo(termo):
+                fator = 1.0 if candidato == termo else self.FATOR_PREFIXO
+                for id_doc, peso in self._postings[candidato].items():
+                    valor = peso * fator
+                    if valor > parcial.get(id_doc, 0.0):
+                        parcial[id_doc] = valor
+            if pontuacao is None:
+                pontuacao = parcial
+            else:
+                pontuacao = {
+                    id_doc: valor + parcial[id_doc]
+                    for id_doc, valor in pontuacao.items() if id_doc in parcial
+                }
+            if not pontuacao:
+                return []
+
+        ordenados = sorted(pontuacao.items(), key=lambda item: -item[1])
+        return ordenados[:limite] if limite else ordenados
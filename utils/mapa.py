@@ -0,0 +1,294 @@
+"""
+Módulo responsável por montar os mapas de pontos culturais exibidos nas páginas.
+"""
+import html
+import logging
+import math
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Sequence, Tuple
+import folium
+from folium.plugins import FastMarkerCluster, MarkerCluster
+from models.ponto_cultural import PontoCultural
+from services.ponto_service import PontoService, TAG_LISTAGEM
+from utils.indice_espacial import Area
+from config import (
+    LOG_LEVEL, LOG_FORMAT, MAPA_CENTRO, MAPA_ZOOM, MAPA_LARGURA, MAPA_ALTURA,
+    MAPA_LIMITE_PONTOS, MAPA_LIMIAR_CLUSTER_RAPIDO, MAPA_ZOOM_SEM_AGRUPAMENTO, MAPA_PIXELS_AGRUPAMENTO
+)
+
+# Configuração de logging
+logging.basicConfig(level=LOG_LEVEL, format=LOG_FORMAT)
+logger = logging.getLogger(__name__)
+
+# Cria o marcador de cada linha [lat, lon, popup, tooltip] do FastMarkerCluster.
+# Os textos já chegam escapados do Python.
+_CALLBACK_MARCADOR = """
+function (linha) {
+    var marcador = L.marker(new L.LatLng(linha[0], linha[1]));
+    marcador.bindPopup(linha[2]);
+    marcador.bindTooltip(linha[3]);
+    return marcador;
+};
+"""
+
+# Área inteira do mapa
+AREA_MUNDO: Area = (-90.0, -180.0, 90.0, 180.0)
+# Largura de um tile do Leaflet, em pixels
+_PIXELS_TILE = 256
+
+@dataclass
+class Agrupamento:
+    """
+    Marcador do viewport: um ponto isolado ou um grupo de pontos próximos,
+    posicionado na média das coordenadas do grupo.
+    """
+    latitude: float
+    longitude: float
+    quantidade: int
+    ponto: Optional[PontoCultural] = None
+
+_ESTILO_GRUPO = (
+    "width:32px;height:32px;line-height:32px;border-radius:16px;text-align:center;"
+    "background:rgba(110,204,57,0.8);font:bold 12px sans-serif"
+)
+
+def _popup(ponto: PontoCultural) -> str:
+    return f"<b>{html.escape(ponto.nome)}</b><br>{html.escape(ponto.tipo)}"
+
+def montar_mapa(pontos: Sequence[PontoCultural], limiar_rapido: int = MAPA_LIMIAR_CLUSTER_RAPIDO) -> folium.Map:
+    """
+    Cria o mapa com os pontos agrupados em clusters.
+
+    Até `limiar_rapido` pontos, cada um vira um folium.Marker dentro de um
+    MarkerCluster. Acima disso usa FastMarkerCluster, que envia só as
+    coordenadas e os textos como um array e cria os marcadores no navegador,
+    sem um objeto Python e um trecho de JavaScript por ponto.
+
+    Args:
+        pontos (Sequence[PontoCultural]): Pontos a exibir
+        limiar_rapido (int): Quantidade a partir da qual usa FastMarkerCluster
+
+    Returns:
+        folium.Map: Mapa montado
+    """
+    mapa = folium.Map(location=MAPA_CENTRO, zoom_start=MAPA_ZOOM)
+    if len(pontos) > limiar_rapido:
+        dados = [[p.latitude, p.longitude, _popup(p), html.escape(p.nome)] for p in pontos]
+        FastMarkerCluster(dados, callback=_CALLBACK_MARCADOR).add_to(mapa)
+    else:
+        cluster = MarkerCluster().add_to(mapa)
+        for ponto in pontos:
+            folium.Marker(
+                [ponto.latitude, ponto.longitude],
+                popup=_popup(ponto),
+                tooltip=html.escape(ponto.nome)
+            ).add_to(cluster)
+    return mapa
+
+def html_mapa(ponto_service: PontoService, tipo: Optional[str] = None, limite: int = MAPA_LIMITE_PONTOS) -> str:
+    """
+    Retorna o HTML do mapa completo com os pontos do tipo informado (ou de
+    todos), agrupados no navegador; é o mapa oferecido para download, que não
+    depende do viewport.
+
+    O HTML fica no cache compartilhado, com chave pela versão dos dados e pelo
+    filtro de tipo, de modo que as execuções seguintes da página o reaproveitam
+    em vez de recriar os marcadores. A entrada é descartada quando os pontos
+    mudam: pela versão do índice em memória ou pela tag das listagens, que o
+    serviço invalida a cada escrita.
+
+    Args:
+        ponto_service (PontoService): Serviço usado para listar os pontos
+        tipo (Optional[str]): Tipo de ponto para filtrar
+        limite (int): Quantidade máxima de pontos no mapa
+
+    Returns:
+        str: Documento HTML completo do mapa
+
+    Raises:
+        Exception: Se houver erro ao carregar os pontos ou montar o mapa
+    """
+    try:
+        cache_key = f"mapa_html_versao={ponto_service.versao}_tipo={tipo}_limite={limite}"
+        return ponto_service.cache.obter_ou_carregar(
+            cache_key, lambda: _renderizar(ponto_service, tipo, limite), tags=[TAG_LISTAGEM]
+        )
+    except Exception as e:
+        logger.error(f"Erro ao montar mapa de pontos culturais: {str(e)}")
+        raise
+
+def _renderizar(ponto_service: PontoService, tipo: Optional[str], limite: int) -> str:
+    pontos: List[PontoCultural] = ponto_service.listar_pontos(pagina=1, tipo=tipo, limite=limite)[0]
+    return montar_mapa(pontos).get_root().render()
+
+def mapa_base() -> folium.Map:
+    """
+    Mapa vazio na posição inicial, sobre o qual st_folium aplica a camada do viewport.
+    """
+    return folium.Map(location=MAPA_CENTRO, zoom_start=MAPA_ZOOM)
+
+def _pixel_y(latitude: float, zoom: int) -> float:
+    """
+    Posição vertical, em pixels, da latitude na projeção Web Mercator do Leaflet.
+    """
+    seno = math.sin(math.radians(latitude))
+    return (0.5 - math.log((1 + seno) / (1 - seno)) / (4 * math.pi)) * _PIXELS_TILE * 2 ** zoom
+
+def _latitude(pixel_y: float, zoom: int) -> float:
+    """
+    Inverso de _pixel_y.
+    """
+    return math.degrees(math.atan(math.sinh(math.pi * (1 - 2 * pixel_y / (_PIXELS_TILE * 2 ** zoom)))))
+
+def area_inicial(largura: int = MAPA_LARGURA, altura: int = MAPA_ALTURA) -> Area:
+    """
+    Área exibida por mapa_base antes da primeira interação: MAPA_CENTRO no
+    zoom MAPA_ZOOM, num mapa de largura x altura pixels.
+    """
+    latitude, longitude = MAPA_CENTRO
+    graus_por_pixel = 360.0 / (_PIXELS_TILE * 2 ** MAPA_ZOOM)
+    centro_y = _pixel_y(latitude, MAPA_ZOOM)
+    return (
+        max(-90.0, _latitude(centro_y + altura / 2, MAPA_ZOOM)),
+        max(-180.0, longitude - largura / 2 * graus_por_pixel),
+        min(90.0, _latitude(centro_y - altura / 2, MAPA_ZOOM)),
+        min(180.0, longitude + largura / 2 * graus_por_pixel)
+    )
+
+def area_do_viewport(limites: Optional[dict]) -> Area:
+    """
+    Converte os limites devolvidos por st_folium ("_southWest"/"_northEast")
+    numa área (lat_min, lon_min, lat_max, lon_max) dentro das coordenadas válidas.
+    Sem limites (primeira exibição do mapa), retorna a área inicial.
+    """
+    try:
+        sudoeste, nordeste = limites["_southWest"], limites["_northEast"]
+        lat_min, lon_min = float(sudoeste["lat"]), float(sudoeste["lng"])
+        lat_max, lon_max = float(nordeste["lat"]), float(nordeste["lng"])
+    except (KeyError, TypeError, ValueError):
+        return area_inicial()
+    if lon_max - lon_min >= 360:
+        lon_min, lon_max = -180.0, 180.0
+    return (max(-90.0, lat_min), max(-180.0, lon_min), min(90.0, lat_max), min(180.0, lon_max))
+
+def tamanho_celula(zoom: int) -> float:
+    """
+    Lado, em graus, da célula de agrupamento no zoom informado: o equivalente
+    a MAPA_PIXELS_AGRUPAMENTO pixels na tela.
+    """
+    return 360.0 / (2 ** zoom) * MAPA_PIXELS_AGRUPAMENTO / _PIXELS_TILE
+
+def ajustar_area(area: Area, zoom: int) -> Area:
+    """
+    Amplia a área até os limites das células do zoom, para que pequenos
+    deslocamentos do mapa reaproveitem a mesma consulta em cache e os grupos
+    da borda não mudem de composição.
+    """
+    celula = tamanho_celula(zoom)
+    lat_min, lon_min, lat_max, lon_max = area
+    return (
+        max(-90.0, math.floor(lat_min / celula) * celula),
+        max(-180.0, math.floor(lon_min / celula) * celula),
+        min(90.0, math.ceil(lat_max / celula) * celula),
+        min(180.0, math.ceil(lon_max / celula) * celula)
+    )
+
+def agrupar(pontos: Sequence[PontoCultural], zoom: int) -> List[Agrupamento]:
+    """
+    Agrupa os pontos por célula da grade do zoom. A partir de
+    MAPA_ZOOM_SEM_AGRUPAMENTO cada ponto vira um marcador próprio.
+    """
+    if zoom >= MAPA_ZOOM_SEM_AGRUPAMENTO:
+        return [Agrupamento(p.latitude, p.longitude, 1, p) for p in pontos]
+
+    celula = tamanho_celula(zoom)
+    # célula -> [soma das latitudes, soma das longitudes, quantidade, primeiro ponto]
+    celulas: Dict[Tuple[int, int], list] = {}
+    for ponto in pontos:
+        chave = (math.floor(ponto.latitude / celula), math.floor(ponto.longitude / celula))
+        grupo = celulas.get(chave)
+        if grupo is None:
+            celulas[chave] = [ponto.latitude, ponto.longitude, 1, ponto]
+        else:
+            grupo[0] += ponto.latitude
+            grupo[1] += ponto.longitude
+            grupo[2] += 1
+    return [
+        Agrupamento(soma_lat / quantidade, soma_lon / quantidade, quantidade, ponto if quantidade == 1 else None)
+        for soma_lat, soma_lon, quantidade, ponto in celulas.values()
+    ]
+
+def marcadores_visiveis(ponto_service: PontoService, area: Area, zoom: int,
+                        tipo: Optional[str] = None) -> List[Agrupamento]:
+    """
+    Marcadores da área visível, agrupados no servidor conforme o zoom.
+
+    Só os pontos da área são consultados, pela busca espacial do serviço, e o
+    resultado fica em cache pela versão dos dados, área ajustada, zoom e tipo.
+    A quantidade de marcadores depende do que está visível, não do total de
+    pontos cadastrados.
+
+    Args:
+        ponto_service (PontoService): Serviço usado na busca espacial
+        area (Area): Área visível (lat_min, lon_min, lat_max, lon_max)
+        zoom (int): Zoom atual do mapa
+        tipo (Optional[str]): Tipo de ponto para filtrar
+
+    Returns:
+        List[Agrupamento]: Pontos isolados e grupos da área
+
+    Raises:
+        Exception: Se houver erro ao buscar os pontos
+    """
+    try:
+        area = ajustar_area(area, zoom)
+        # Acima do zoom de agrupamento o zoom não muda o resultado
+        zoom = min(zoom, MAPA_ZOOM_SEM_AGRUPAMENTO)
+        cache_key = f"mapa_viewport_versao={ponto_service.versao}_area={area}_zoom={zoom}_tipo={tipo}"
+        return ponto_service.cache.obter_ou_carregar(
+            cache_key, lambda: _carregar_marcadores(ponto_service, area, zoom, tipo), tags=[TAG_LISTAGEM]
+        )
+    except Exception as e:
+        logger.error(f"Erro ao carregar marcadores do mapa: {str(e)}")
+        raise
+
+def _carregar_marcadores(ponto_service: PontoService, area: Area, zoom: int, tipo: Optional[str]) -> List[Agrupamento]:
+    pontos = ponto_service.buscar_na_area(area)
+    if tipo:
+        pontos = [p for p in pontos if p.tipo == tipo]
+    return agrupar(pontos, zoom)
+
+def camada_viewport(ponto_service: PontoService, limites: Optional[dict], zoom: Optional[int],
+                    tipo: Optional[str] = None) -> folium.FeatureGroup:
+    """
+    Camada com os marcadores do viewport, para o parâmetro feature_group_to_add
+    de st_folium, que a troca sem recriar o mapa.
+
+    Args:
+        ponto_service (PontoService): Serviço usado na busca espacial
+        limites (Optional[dict]): Limites devolvidos por st_folium (None na primeira exibição)
+        zoom (Optional[int]): Zoom devolvido por st_folium
+        tipo (Optional[str]): Tipo de ponto para filtrar
+
+    Returns:
+        folium.FeatureGroup: Marcadores e grupos visíveis
+    """
+    zoom = MAPA_ZOOM if zoom is None else int(zoom)
+    camada = folium.FeatureGroup(name="Pontos culturais")
+    for marcador in marcadores_visiveis(ponto_service, area_do_viewport(limites), zoom, tipo):
+        if marcador.ponto is not None:
+            folium.Marker(
+                [marcador.latitude, marcador.longitude],
+                popup=_popup(marcador.ponto),
+                tooltip=html.escape(marcador.ponto.nome)
+            ).add_to(camada)
+        else:
+            folium.Marker(
+                [marcador.latitude, marcador.longitude],
+                icon=folium.DivIcon(
+                    html=f'<div style="{_ESTILO_GRUPO}">{marcador.quantidade}</div>',
+                    icon_size=(32, 32), icon_anchor=(16, 16)
+                ),
+                tooltip=f"{marcador.quantidade} pontos culturais"
+            ).add_to(camada)
+    return camada
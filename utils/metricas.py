@@ -0,0 +1,348 @@
+"""
+Métricas de desempenho: histogramas de duração, tamanho de dados e quantidade
+de registros, contadores de erros e coletores lidos no momento da exportação
+(como as estatísticas do cache), exportáveis no formato de texto do Prometheus
+ou como um snapshot JSON.
+"""
+import functools
+import inspect
+import json
+import math
+import threading
+import time
+from bisect import bisect_left
+from contextlib import nullcontext
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from config import METRICAS_HABILITADAS
+
+# Prefixo dos nomes exportados para o Prometheus
+PREFIXO = "rota_cultural"
+
+# Limites superiores (inclusivos) das faixas de cada tipo de histograma
+LIMITES_SEGUNDOS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+LIMITES_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304, 16777216, 67108864)
+LIMITES_REGISTROS = (0, 1, 5, 10, 25, 50, 100, 250, 500, 1000, 5000, 10000, 50000, 100000)
+
+# Rótulos de uma série, em ordem: (("metodo", "listar_pontos"), ...)
+Rotulos = Tuple[Tuple[str, str], ...]
+
+# Devolvido por cronometrar() com a coleta desativada
+_SEM_MEDICAO = nullcontext()
+
+def tamanho_json(dados: Any) -> int:
+    """
+    Tamanho aproximado, em bytes, dos dados serializados em JSON compacto.
+    """
+    return len(json.dumps(dados, separators=(",", ":"), default=str))
+
+
+class Histograma:
+    """
+    Distribuição de valores em faixas fixas, no modelo dos histogramas do Prometheus.
+    """
+    __slots__ = ("limites", "contagens", "soma", "quantidade")
+
+    def __init__(self, limites: Tuple[float, ...]):
+        self.limites = limites
+        # Uma faixa por limite e a última para valores acima de todos (+Inf)
+        self.contagens = [0] * (len(limites) + 1)
+        self.soma = 0.0
+        self.quantidade = 0
+
+    def observar(self, valor: float) -> None:
+        self.contagens[bisect_left(self.limites, valor)] += 1
+        self.soma += valor
+        self.quantidade += 1
+
+    def quantil(self, q: float) -> Optional[float]:
+        """
+        Estima o quantil `q` (0 a 1) interpolando dentro da faixa que o contém,
+        como histogram_quantile do Prometheus. Retorna None sem observações.
+        """
+        if not self.quantidade:
+            return None
+        alvo = q * self.quantidade
+        acumulado = 0
+        inferior = 0.0
+        for limite, contagem in zip(self.limites + (math.inf,), self.contagens):
+            if contagem and acumulado + contagem >= alvo:
+                if limite == math.inf:
+                    return inferior
+                return inferior + (limite - inferior) * (alvo - acumulado) / contagem
+            acumulado += contagem
+            inferior = limite
+        return inferior
+
+
+def _nomes(componente: str) -> Tuple[str, str]:
+    """
+    Nomes das métricas de duração e de erros de um componente.
+    """
+    return f"{componente}_duracao_segundos", f"{componente}_erros_total"
+
+
+class _Cronometro:
+    __slots__ = ("metricas", "nomes", "chave", "inicio")
+
+    def __init__(self, metricas: 'Metricas', nomes: Tuple[str, str], chave: Rotulos):
+        self.metricas = metricas
+        self.nomes = nomes
+        self.chave = chave
+
+    def __enter__(self) -> '_Cronometro':
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, tipo, valor, rastreamento) -> bool:
+        self.metricas._observar(self.nomes[0], self.chave, time.perf_counter() - self.inicio, LIMITES_SEGUNDOS)
+        if tipo is not None:
+            self.metricas._incrementar(self.nomes[1], self.chave, 1)
+        return False
+
+
+class Metricas:
+    """
+    Registro das métricas do processo.
+
+    Com `habilitadas` falso, nenhuma medição é feita: medir() e cronometrar()
+    apenas verificam o atributo e executam o código medido, e observar_tamanho()
+    não serializa os dados. O atributo pode ser alterado em execução.
+
+    Coletores são funções que retornam um dicionário de valores, chamadas só na
+    exportação; assim contadores que já existem (como os de CacheLRU) são
+    exportados sem custo nas operações.
+    """
+
+    def __init__(self, habilitadas: bool = False):
+        self.habilitadas = habilitadas
+        self._lock = threading.Lock()
+        self._histogramas: Dict[str, Dict[Rotulos, Histograma]] = {}
+        self._contadores: Dict[str, Dict[Rotulos, float]] = {}
+        self._coletores: Dict[Tuple[str, Rotulos], Tuple[Callable[[], Dict[str, float]], frozenset]] = {}
+
+    @staticmethod
+    def _rotulos(rotulos: Dict[str, Any]) -> Rotulos:
+        return tuple(sorted((chave, str(valor)) for chave, valor in rotulos.items()))
+
+    def _observar(self, nome: str, chave: Rotulos, valor: float, limites: Tuple[float, ...]) -> None:
+        with self._lock:
+            series = self._histogramas.get(nome)
+            if series is None:
+                series = self._histogramas[nome] = {}
+            histograma = series.get(chave)
+            if histograma is None:
+                histograma = series[chave] = Histograma(limites)
+            histograma.observar(valor)
+
+    def _incrementar(self, nome: str, chave: Rotulos, valor: float) -> None:
+        with self._lock:
+            series = self._contadores.get(nome)
+            if series is None:
+                series = self._contadores[nome] = {}
+            series[chave] = series.get(chave, 0) + valor
+
+    def observar(self, nome: str, valor: float, limites: Tuple[float, ...] = LIMITES_SEGUNDOS, **rotulos) -> None:
+        """
+        Registra um valor no histograma `nome`; as faixas são as da primeira observação.
+        """
+        if self.habilitadas:
+            self._observar(nome, self._rotulos(rotulos), valor, limites)
+
+    def incrementar(self, nome: str, valor: float = 1, **rotulos) -> None:
+        """
+        Soma `valor` ao contador `nome`.
+        """
+        if self.habilitadas:
+            self._incrementar(nome, self._rotulos(rotulos), valor)
+
+    def observar_tamanho(self, nome: str, dados: Any, **rotulos) -> None:
+        """
+        Registra o tamanho dos dados em JSON no histograma `nome`. A serialização
+        só acontece com a coleta habilitada.
+        """
+        if self.habilitadas:
+            self.observar(nome, tamanho_json(dados), LIMITES_BYTES, **rotulos)
+
+    def cronometrar(self, componente: str, **rotulos):
+        """
+        Context manager que registra a duração do bloco em
+        "<componente>_duracao_segundos" e, se ele lançar uma exceção, soma 1 a
+        "<componente>_erros_total".
+
+        Uso:
+            with metricas.cronometrar("firebase", operacao="obter"):
+                dados = ref.get()
+        """
+        if not self.habilitadas:
+            return _SEM_MEDICAO
+        return _Cronometro(self, _nomes(componente), self._rotulos(rotulos))
+
+    def registrar_coletor(self, familia: str, coletar: Callable[[], Dict[str, float]],
+                          medidores: Iterable[str] = (), **rotulos) -> None:
+        """
+        Registra uma função lida na exportação. Cada chave do dicionário
+        retornado vira a métrica "<familia>_<chave>_total" (contador) ou, se
+        estiver em `medidores`, "<familia>_<chave>" (valor instantâneo).
+        Registrar de novo a mesma família e rótulos substitui o coletor.
+        """
+        with self._lock:
+            self._coletores[(familia, self._rotulos(rotulos))] = (coletar, frozenset(medidores))
+
+    def limpar(self) -> None:
+        """
+        Descarta os histogramas e contadores; os coletores continuam registrados.
+        """
+        with self._lock:
+            self._histogramas.clear()
+            self._contadores.clear()
+
+    def _coletar(self) -> List[Tuple[str, Rotulos, Dict[str, float], frozenset]]:
+        with self._lock:
+            coletores = list(self._coletores.items())
+        return [(familia, rotulos, coletar(), medidores) for (familia, rotulos), (coletar, medidores) in coletores]
+
+    def snapshot(self) -> dict:
+        """
+        Retorna todas as métricas em um dicionário serializável em JSON.
+
+        Returns:
+            dict: "histogramas" e "contadores" por nome, cada um com a lista de
+                séries (rótulos e valores; histogramas trazem quantidade, soma,
+                média, p50, p95, p99 e as faixas acumuladas) e "coletores" com
+                os valores lidos de cada coletor
+        """
+        with self._lock:
+            histogramas = {
+                nome: [
+                    {
+                        "rotulos": dict(rotulos),
+                        "quantidade": h.quantidade,
+                        "soma": h.soma,
+                        "media": h.soma / h.quantidade if h.quantidade else None,
+                        "p50": h.quantil(0.5),
+                        "p95": h.quantil(0.95),
+                        "p99": h.quantil(0.99),
+                        "faixas": dict(zip(
+                            [str(limite) for limite in h.limites] + ["+Inf"], _acumular(h.contagens)
+                        ))
+                    }
+                    for rotulos, h in series.items()
+                ]
+                for nome, series in self._histogramas.items()
+            }
+            contadores = {
+                nome: [{"rotulos": dict(rotulos), "valor": valor} for rotulos, valor in series.items()]
+                for nome, series in self._contadores.items()
+            }
+        coletores = [
+            {"familia": familia, "rotulos": dict(rotulos), "valores": valores}
+            for familia, rotulos, valores, _ in self._coletar()
+        ]
+        return {
+            "habilitadas": self.habilitadas,
+            "histogramas": histogramas,
+            "contadores": contadores,
+            "coletores": coletores
+        }
+
+    def prometheus(self) -> str:
+        """
+        Retorna todas as métricas no formato de texto do Prometheus (versão 0.0.4).
+        """
+        linhas = []
+        with self._lock:
+            for nome, series in sorted(self._histogramas.items()):
+                completo = f"{PREFIXO}_{nome}"
+                linhas.append(f"# TYPE {completo} histogram")
+                for rotulos, h in series.items():
+                    limites = [_formatar(limite) for limite in h.limites] + ["+Inf"]
+                    for limite, acumulado in zip(limites, _acumular(h.contagens)):
+                        linhas.append(f"{completo}_bucket{_formatar_rotulos(rotulos + (('le', limite),))} {acumulado}")
+                    linhas.append(f"{completo}_sum{_formatar_rotulos(rotulos)} {_formatar(h.soma)}")
+                    linhas.append(f"{completo}_count{_formatar_rotulos(rotulos)} {h.quantidade}")
+            for nome, series in sorted(self._contadores.items()):
+                completo = f"{PREFIXO}_{nome}"
+                linhas.append(f"# TYPE {completo} counter")
+                for rotulos, valor in series.items():
+                    linhas.append(f"{completo}{_formatar_rotulos(rotulos)} {_formatar(valor)}")
+
+        # Séries de coletores diferentes com o mesmo nome ficam sob um único # TYPE
+        familias: Dict[str, Tuple[str, List[str]]] = {}
+        for familia, rotulos, valores, medidores in self._coletar():
+            for chave, valor in valores.items():
+                medidor = chave in medidores
+                completo = f"{PREFIXO}_{familia}_{chave}" + ("" if medidor else "_total")
+                _, series = familias.setdefault(completo, ("gauge" if medidor else "counter", []))
+                series.append(f"{completo}{_formatar_rotulos(rotulos)} {_formatar(valor)}")
+        for completo, (tipo, series) in sorted(familias.items()):
+            linhas.append(f"# TYPE {completo} {tipo}")
+            linhas.extend(series)
+        return "\n".join(linhas) + "\n"
+
+
+def _acumular(contagens: List[int]) -> List[int]:
+    acumuladas = []
+    total = 0
+    for contagem in contagens:
+        total += contagem
+        acumuladas.append(total)
+    return acumuladas
+
+def _formatar(valor: float) -> str:
+    if isinstance(valor, float) and valor.is_integer():
+        return str(int(valor))
+    return repr(valor)
+
+def _formatar_rotulos(rotulos: Rotulos) -> str:
+    if not rotulos:
+        return ""
+    return "{" + ",".join(f'{chave}="{_escapar(valor)}"' for chave, valor in rotulos) + "}"
+
+def _escapar(valor: str) -> str:
+    return valor.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+# Registro único do processo
+metricas = Metricas(habilitadas=METRICAS_HABILITADAS)
+
+def medir(componente: str, quantidade: Optional[Callable[[Any], int]] = None):
+    """
+    Decorador que cronometra cada chamada do método com o rótulo metodo=<nome>.
+    Em métodos assíncronos, a medição cobre a execução da corrotina.
+
+    Args:
+        componente (str): Prefixo das métricas ("<componente>_duracao_segundos",
+            "<componente>_erros_total" e "<componente>_registros")
+        quantidade (Optional[Callable[[Any], int]]): Extrai do resultado a
+            quantidade de registros retornados, registrada em "<componente>_registros"
+    """
+    nomes = _nomes(componente)
+    registros = f"{componente}_registros"
+
+    def decorador(funcao):
+        # Rótulos e nomes calculados uma vez, fora do caminho das chamadas
+        chave = (("metodo", funcao.__name__),)
+
+        if inspect.iscoroutinefunction(funcao):
+            @functools.wraps(funcao)
+            async def medido_async(*args, **kwargs):
+                if not metricas.habilitadas:
+                    return await funcao(*args, **kwargs)
+                with _Cronometro(metricas, nomes, chave):
+                    resultado = await funcao(*args, **kwargs)
+                if quantidade is not None:
+                    metricas._observar(registros, chave, quantidade(resultado), LIMITES_REGISTROS)
+                return resultado
+            return medido_async
+
+        @functools.wraps(funcao)
+        def medido(*args, **kwargs):
+            if not metricas.habilitadas:
+                return funcao(*args, **kwargs)
+            with _Cronometro(metricas, nomes, chave):
+                resultado = funcao(*args, **kwargs)
+            if quantidade is not None:
+                metricas._observar(registros, chave, quantidade(resultado), LIMITES_REGISTROS)
+            return resultado
+        return medido
+    return decorador
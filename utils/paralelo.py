@@ -0,0 +1,15 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List
+from config import LOTE_MAX_CONEXOES
+
+def executar_em_paralelo(funcao: Callable, itens: List) -> List:
+    """
+    Aplica a função a cada item usando um pool de threads, mantendo a ordem.
+
+    Usado nas leituras em lote; o número de threads é limitado por
+    LOTE_MAX_CONEXOES.
+    """
+    if len(itens) <= 1:
+        return [funcao(item) for item in itens]
+    with ThreadPoolExecutor(max_workers=min(LOTE_MAX_CONEXOES, len(itens))) as executor:
+        return list(executor.map(funcao, itens))